@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the shared TextFeaturizer: featurizing corpora of synthetic
+OCR texts in one batch, next to the previous train_models.extract_features
+loop (one dict per text, then a DataFrame), kept here as the reference.
+The feature matrices must match.
+
+Run: python benchmark_featurizer.py
+"""
+
+import json
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from featurizer import FEATURE_NAMES, TextFeaturizer
+
+# Corpus sizes (texts) to time
+CORPUS_SIZES = [1000, 10000, 50000]
+
+LEXICON_PATH = 'lexicons/feature_keywords.json'
+
+WORDS = [
+    'LOWONGAN', 'KERJA', 'PT', 'Maju', 'Bersama', 'Tbk', 'dibutuhkan', 'segera', 'staff', 'admin',
+    'kualifikasi', 'pengalaman', 'pendidikan', 'min.', 'S1/D3', 'gaji', 'Rp', '4.500.000', 'tunjangan',
+    'BPJS', 'kirim', 'CV', 'ke', 'hrd@majubersama.co.id', 'Jl.', 'Sudirman', 'No.', '12', 'Jakarta',
+    'kerja', 'rumah', 'tanpa', 'modal', 'jutaan', 'per', 'hari', 'hub', 'WA', '0812-3456-7890', 'join',
+    'member', 'bonus', 'komisi', 'buruan', 'terbatas!!', 'gratis', 'dan', 'untuk', 'yang', 'dengan',
+    'L0W0NGAN', 'G4JI', '|', '~', '?', 'interview', 'fresh', 'graduate', 'recruitment'
+]
+
+def build_corpus(size, rng):
+    """OCR-like texts of 20 to 200 words"""
+    return [' '.join(rng.choice(WORDS) for _ in range(rng.randint(20, 200))) for _ in range(size)]
+
+def reference_extract_features(texts, keyword_lists):
+    """The previous train_models.extract_features: one Python loop per text"""
+    features = []
+    for text in texts:
+        text_lower = text.lower()
+        genuine_count = sum(1 for kw in keyword_lists['genuine_keywords'] if kw in text_lower)
+        fake_count = sum(1 for kw in keyword_lists['fake_keywords'] if kw in text_lower)
+        features.append({
+            'length': len(text),
+            'word_count': len(text.split()),
+            'sentence_count': len([s for s in text.split('.') if s.strip()]),
+            'avg_word_length': np.mean([len(word) for word in text.split()]) if text.split() else 0,
+            'genuine_keywords': genuine_count,
+            'fake_keywords': fake_count,
+            'keyword_ratio': genuine_count / max(fake_count, 1),
+            'has_email': '@' in text,
+            'has_phone': any(char.isdigit() for char in text),
+            'has_address': any(word in text_lower for word in keyword_lists['address']),
+            'has_company': any(word in text_lower for word in keyword_lists['company']),
+            'has_whatsapp': any(word in text_lower for word in keyword_lists['whatsapp']),
+            'has_money_promise': any(word in text_lower for word in keyword_lists['money_promise']),
+            'has_urgency': any(word in text_lower for word in keyword_lists['urgency']),
+            'has_mlm_terms': any(word in text_lower for word in keyword_lists['mlm_terms']),
+            'has_no_experience': any(word in text_lower for word in keyword_lists['no_experience']),
+            'uppercase_ratio': sum(1 for c in text if c.isupper()) / max(len(text), 1),
+            'exclamation_count': text.count('!'),
+            'question_count': text.count('?'),
+            'number_count': sum(1 for c in text if c.isdigit()),
+        })
+    return pd.DataFrame(features)
+
+def main():
+    with open(LEXICON_PATH, encoding='utf-8') as f:
+        keyword_lists = json.load(f)['lexicons']
+    featurizer = TextFeaturizer(keyword_lists)
+    rng = random.Random(0)
+
+    print(f"{'texts':>7} | {'featurizer':>10} | {'reference':>10} | matrix")
+    mismatches = 0
+    for size in CORPUS_SIZES:
+        texts = build_corpus(size, rng)
+
+        start = time.perf_counter()
+        matrix = featurizer.transform(texts)
+        batch = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = reference_extract_features(texts, keyword_lists)[list(FEATURE_NAMES)].astype(float).values
+        loop = time.perf_counter() - start
+
+        same = np.allclose(matrix, reference)
+        mismatches += not same
+        print(f"{size:>7} | {batch:>8.2f} s | {loop:>8.2f} s | {'same' if same else 'DIFFERENT'}")
+
+    if mismatches:
+        raise SystemExit(f"❌ {mismatches} corpus/corpora featurized differently from the reference")
+    print("✅ Featurizer matrix matches the reference")
+
+if __name__ == '__main__':
+    main()
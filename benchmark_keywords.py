@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark for keyword matching: time of KeywordAutomaton.find() as the
+text grows and as the lexicon grows to 100k keywords, next to the previous
+`keyword in text` scan over every keyword. The automaton's time should grow
+with the text only.
+
+Run: python benchmark_keywords.py
+"""
+
+import random
+import time
+
+import index
+
+# Text lengths (words) and lexicon sizes (keywords) to time
+TEXT_WORDS = [100, 400, 1600]
+LEXICON_SIZES = [None, 10000, 100000]  # None: the real keywords.json lexicons
+
+REPEATS = 20
+
+def build_lexicons(size, rng):
+    """The keyword lexicons padded with generated one- to three-word keywords to size entries"""
+    lexicons = {name: list(keywords) for name, keywords in index.get_lexicons().keywords.items()}
+    if size is None:
+        return lexicons
+    names = list(lexicons)
+    total = sum(len(keywords) for keywords in lexicons.values())
+    while total < size:
+        keyword = ' '.join(
+            ''.join(rng.choice('abdegiklmnoprstuy') for _ in range(rng.randint(3, 9)))
+            for _ in range(rng.randint(1, 3))
+        )
+        lexicons[rng.choice(names)].append(keyword)
+        total += 1
+    return lexicons
+
+def build_text(words, rng):
+    """Poster-like text: keyword words mixed with filler"""
+    vocabulary = [word for keywords in index.get_lexicons().keywords.values() for keyword in keywords for word in keyword.split()]
+    vocabulary += ['dan', 'untuk', 'yang', 'dengan', 'kami', 'anda', '2024', 'Rp', '08123456789']
+    return ' '.join(rng.choice(vocabulary) for _ in range(words))
+
+def substring_scan(lexicons, text):
+    """The previous matching: one substring scan per keyword"""
+    text_lower = text.lower()
+    return {name: [keyword for keyword in keywords if keyword in text_lower] for name, keywords in lexicons.items()}
+
+def time_per_call(function, repeats=REPEATS):
+    """Median seconds per call"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2]
+
+def main():
+    rng = random.Random(0)
+    texts = {words: build_text(words, rng) for words in TEXT_WORDS}
+
+    print(f"{'keywords':>9} | {'build':>8} | {'words':>6} | {'automaton':>10} | {'substring scan':>14}")
+    for size in LEXICON_SIZES:
+        lexicons = build_lexicons(size, rng)
+        start = time.perf_counter()
+        automaton = index.KeywordAutomaton(lexicons)
+        build = time.perf_counter() - start
+        entries = sum(len(keywords) for keywords in lexicons.values())
+
+        for words, text in texts.items():
+            automaton_time = time_per_call(lambda: automaton.find(text))
+            scan_time = time_per_call(lambda: substring_scan(lexicons, text), repeats=3)
+            print(f"{entries:>9} | {build * 1000:>5.0f} ms | {words:>6} | "
+                  f"{automaton_time * 1000:>7.2f} ms | {scan_time * 1000:>11.2f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark for OCR post-correction: time per text of the single-pass
+OCRCorrector as its fix table grows, next to applying the same fixes one
+compiled regex at a time (what running the regex fixes of
+lexicons/ocr_fixes.json in sequence would cost). The corrector's time
+should stay flat.
+Then the SymSpell spelling index: build and load time, and the cost of
+correcting one misspelled word, which should not depend on vocabulary size.
+
+Run: python benchmark_ocr_corrections.py
+"""
+
+import os
+import random
+import re
+import tempfile
+import time
+
+import index
+
+# Fix-table sizes to time; the real tables are padded with generated words
+TABLE_SIZES = [75, 250, 500, 1000, 5000, 20000]
+
+# Sequential regexes are only timed up to this size (they take seconds beyond)
+SEQUENTIAL_MAX_SIZE = 5000
+
+REPEATS = 20
+
+SAMPLE_TEXT = (
+    "L0W0NGAN KERJ4 PT Maju Bersama Tbk membuka l0wongan untuk P0SISI Staff Admin "
+    "dan Customer Service. KU4L1F1K4S1: pendidikan minimal S1/D3, PENG4L4M4N 1-2 tahun, "
+    "usia maks 30th, mampu K0MUN1K451 dengan baik, menguasai Microsoft0ffice. "
+    "G4JI 5JT - 7JT per bulan + TUNJ4NG4N transport dan makan, BPJS, K4RIR jelas. "
+    "Kirim L4M4R4N ke hrd@majubersama.co.id atau WA 081234567890 paling lambat 30 Juni 2024. "
+) * 6
+
+def confuse(word):
+    """Spell a word the way OCR misreads it (letters swapped for look-alike digits)"""
+    return word.translate(str.maketrans('OIEAST', '014457'))
+
+def build_fixes(size):
+    """The real word fixes padded with generated words to size entries"""
+    lexicons = index.get_lexicons()
+    fixes = dict(lexicons.word_fixes)
+    for target in lexicons.pattern_fixes.values():
+        if isinstance(target, str) and target.isalpha():
+            fixes.setdefault(confuse(target), target)
+    fixes = dict(list(fixes.items())[:size])
+
+    rng = random.Random(0)
+    while len(fixes) < size:
+        word = ''.join(rng.choice('ABCDEFGHIJKLMNOPRSTUWY') for _ in range(rng.randint(5, 12)))
+        fixes.setdefault(confuse(word), word)
+    return fixes
+
+def sequential_patterns(fixes):
+    """One compiled regex per fix, in the style of the ocr_fixes.json regex fixes"""
+    patterns = []
+    for target in fixes.values():
+        classes = ''.join(
+            f"[{c}{c.lower()}{confuse(c)}]" if confuse(c) != c else f"[{c}{c.lower()}]"
+            for c in target
+        )
+        patterns.append((re.compile(rf'\b{classes}\b'), target))
+    return patterns
+
+def apply_sequential(patterns, text):
+    for pattern, target in patterns:
+        text = pattern.sub(target, text)
+    return text
+
+def time_per_call(function, repeats=REPEATS):
+    """Median seconds per call"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2]
+
+def misspell(word, rng):
+    """Drop one interior letter, the kind of slip the corrector accepts"""
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1:]
+
+def benchmark_spelling():
+    vocabulary = index.get_spelling_vocabulary()
+    start = time.perf_counter()
+    speller = index.SymSpell(vocabulary, index.app.config['OCR_SPELL_MAX_DISTANCE'])
+    build = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        index.app.config['OCR_SPELL_INDEX_PATH'] = os.path.join(directory, 'ocr_spelling_index.pkl')
+        index.load_spelling_index()  # Builds and saves
+        start = time.perf_counter()
+        index.load_spelling_index()
+        load = time.perf_counter() - start
+
+    print(f"📚 Spelling index: {len(speller.words)} words, {len(speller.deletes)} deletes, "
+          f"built in {build * 1000:.0f} ms, loaded in {load * 1000:.0f} ms")
+    print()
+    print(f"{'vocabulary':>10} | {'per misspelled word':>20}")
+
+    rng = random.Random(0)
+    words = [word for word in vocabulary if len(word) >= 6]
+    typos = [misspell(word, rng) for word in rng.sample(words, 300)]
+    for size in (len(vocabulary), 5 * len(vocabulary), 20 * len(vocabulary)):
+        padded = dict(vocabulary)
+        while len(padded) < size:
+            padded[''.join(rng.choice('abdegiklmnoprstuy') for _ in range(rng.randint(5, 12)))] = 1
+        speller = index.SymSpell(padded, index.app.config['OCR_SPELL_MAX_DISTANCE'])
+        start = time.perf_counter()
+        for typo in typos:
+            speller.lookup(typo, 1 if len(typo) < 9 else None)
+        seconds = (time.perf_counter() - start) / len(typos)
+        print(f"{size:>10} | {seconds * 1e6:>17.0f} µs")
+
+def main():
+    lexicons = index.get_lexicons()
+    print(f"📄 Sample text: {len(SAMPLE_TEXT)} chars, {len(SAMPLE_TEXT.split())} words")
+    print(f"🔧 Real tables: {len(lexicons.word_fixes)} word fixes, "
+          f"{len(lexicons.pattern_fixes)} regex fixes, "
+          f"{len(index.get_ocr_corrector())} compiled words")
+    print()
+    print(f"{'fixes':>8} | {'single pass':>12} | {'sequential regex':>16}")
+
+    for size in TABLE_SIZES:
+        fixes = build_fixes(size)
+        corrector = index.OCRCorrector(fixes)
+        single = time_per_call(lambda: corrector.correct(SAMPLE_TEXT))
+
+        sequential = '-'
+        if size <= SEQUENTIAL_MAX_SIZE:
+            patterns = sequential_patterns(fixes)
+            seconds = time_per_call(lambda: apply_sequential(patterns, SAMPLE_TEXT), repeats=3)
+            sequential = f"{seconds * 1000:.2f} ms"
+        print(f"{size:>8} | {single * 1000:>9.2f} ms | {sequential:>16}")
+
+    print()
+    benchmark_spelling()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the text classifier: time per text of the TF-IDF + Logistic
+Regression model served as LinearTextModel's term weight table, next to
+the scikit-learn pipeline it was built from (vectorizer.transform into a
+sparse matrix, then predict_proba). The genuine probabilities must match.
+
+Run: python benchmark_text_classifier.py
+"""
+
+import random
+import time
+import warnings
+from pathlib import Path
+
+import joblib
+
+import index
+
+# Text lengths (words) to time
+TEXT_WORDS = [50, 200, 1000]
+
+TEXTS_PER_LENGTH = 200
+
+REPEATS = 20
+
+MODELS_DIR = Path('models')
+
+WORDS = [
+    'LOWONGAN', 'KERJA', 'PT', 'Maju', 'Bersama', 'Tbk', 'dibutuhkan', 'segera', 'staff', 'admin',
+    'kualifikasi', 'pengalaman', 'pendidikan', 'min.', 'S1/D3', 'gaji', 'Rp', '4.500.000', 'tunjangan',
+    'BPJS', 'kirim', 'CV', 'ke', 'hrd@majubersama.co.id', 'Jl.', 'Sudirman', 'No.', '12', 'Jakarta',
+    'kerja', 'rumah', 'tanpa', 'modal', 'jutaan', 'per', 'hari', 'hub', 'WA', '0812-3456-7890', 'join',
+    'member', 'bonus', 'komisi', 'buruan', 'terbatas!!', 'gratis', 'dan', 'untuk', 'yang', 'dengan',
+    'L0W0NGAN', 'G4JI', '|', '~', '?', 'interview', 'fresh', 'graduate', 'recruitment'
+]
+
+def build_texts(words, rng):
+    """OCR-like texts of the given length"""
+    return [' '.join(rng.choice(WORDS) for _ in range(words)) for _ in range(TEXTS_PER_LENGTH)]
+
+def time_per_call(function, repeats=REPEATS):
+    """Median seconds per call"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2]
+
+def main():
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # Pickles from another scikit-learn version
+        vectorizer = joblib.load(MODELS_DIR / 'tfidf_vectorizer_retrained.pkl')
+        classifier = joblib.load(MODELS_DIR / 'text_classifier_retrained.pkl')
+
+    start = time.perf_counter()
+    model = index.LinearTextModel(vectorizer, classifier)
+    build = time.perf_counter() - start
+    genuine = list(classifier.classes_).index('genuine')
+    print(f"📚 Term table: {len(model)} terms, built in {build * 1000:.1f} ms")
+    print()
+    print(f"{'words':>6} | {'term table':>12} | {'scikit-learn':>12} | max probability difference")
+
+    rng = random.Random(0)
+    worst = 0.0
+    for words in TEXT_WORDS:
+        texts = build_texts(words, rng)
+
+        table = time_per_call(lambda: [model.predict(text) for text in texts]) / len(texts)
+        pipeline = time_per_call(
+            lambda: [classifier.predict_proba(vectorizer.transform([text])) for text in texts], repeats=3
+        ) / len(texts)
+
+        expected = classifier.predict_proba(vectorizer.transform(texts))[:, genuine]
+        difference = max(abs(model.predict(text)[0] - probability) for text, probability in zip(texts, expected))
+        worst = max(worst, difference)
+        print(f"{words:>6} | {table * 1e6:>9.0f} µs | {pipeline * 1e6:>9.0f} µs | {difference:.2e}")
+
+    if worst > 1e-9:
+        raise SystemExit(f"❌ Term table probabilities differ from scikit-learn by up to {worst:.2e}")
+    print("✅ Term table matches the scikit-learn pipeline")
+
+if __name__ == '__main__':
+    main()
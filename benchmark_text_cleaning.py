@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for clean_extracted_text over realistic raw OCR output
+(Tesseract text with line breaks, stray symbols, misread characters and
+broken words). Each sample is timed against the previous per-call regex
+implementation, kept here as the reference, and the outputs must match.
+
+Run: python benchmark_text_cleaning.py
+"""
+
+import re
+import time
+
+import index
+
+REPEATS = 200
+
+POSTER = """L0W0NGAN KERJ4
+PT Sinar Abadi Logistik
+
+Dibutuhkan segera :
+- Staff Admin Gudang (2 orang)
+- Driver SIM B1 Umum
+
+KU4L1F1K4S1 :
+* Pria / Wanita usia 20 - 35 th
+* Pendidikan min. SMA/SMK , D3 , S1
+* Jujur , disiplin dan bertanggung jawab
+|
+G4JI : Rp 4.500.000 - 6.000.000 + TUNJ4NG4N
+Kirim CV ke : hrd@sinarabadi.co.id
+Paling lambat 30 Juni 2024
+"""
+
+PHOTO = """~ ' . , _
+DI CARI KARY AWAN
+L OWONGAN   KERJA  !!
+kerja dari rumah , gaji  harian 500rb/hari
+tanpa pengalaman , tanpa interview
+| | |
+hub WA 0812-3456-7890 ( admin Rina )
+— — —
+transfer biaya pendaftaran 150rb dulu ya kak
+\x0c"""
+
+REGIONS = (
+    "PERUS4H44N FMCG TERKEMUKA MEMBUTUHKAN\n\nSales Executive\n\n"
+    "Persyaratan : Min D3 semua jurusan , pengalaman 1 th di bidang sales\n"
+    "Memiliki kendaraan sendiri dan SIM C\n\n"
+    "Benefit : gaji pokok , insentif , BPJS Kesehatan & Ketenagakerjaan\n\n"
+    "Lamaran dikirim ke recruitment@fmcg-nusantara.com\n"
+)
+
+SAMPLES = {
+    'poster': POSTER,
+    'photo': PHOTO,
+    'regions': REGIONS,
+    'long': (POSTER + PHOTO + REGIONS) * 8
+}
+
+def reference_clean_extracted_text(text):
+    """The previous clean_extracted_text: one regex call (and compile-cache lookup) per rule"""
+    if not text or not isinstance(text, str):
+        return ""
+
+    text = index.fix_common_ocr_errors(text)
+    text = re.sub(r'[^\x20-\x7E\u00A0-\u024F\u1E00-\u1EFF]', ' ', text)
+
+    char_fixes = {'0': 'O', '1': 'I', '5': 'S', '8': 'B', '!': 'I', '|': 'I'}
+    for wrong, correct in char_fixes.items():
+        text = re.sub(f'(?<=[a-zA-Z]){re.escape(wrong)}(?=[a-zA-Z])', correct, text)
+
+    text = re.sub(r'([A-Z])\s+([a-z])', r'\1\2', text)
+    text = re.sub(r'([a-z])\s+([A-Z])', r'\1 \2', text)
+    text = re.sub(r'([a-zA-Z])\s+([.,!?;:])', r'\1\2', text)
+
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = re.sub(r'^\s+|\s+$', '', text)
+
+    cleaned_lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if len(re.findall(r'[a-zA-Z0-9]', line)) >= 2:
+            cleaned_lines.append(line)
+    text = '\n'.join(cleaned_lines)
+
+    return re.sub(r'\s+', ' ', text).strip()
+
+def time_per_call(function, text, repeats=REPEATS):
+    """Median seconds per call"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(text)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2]
+
+def main():
+    print(f"{'sample':>8} | {'chars':>6} | {'cleaner':>10} | {'reference':>10} | output")
+    mismatches = 0
+    for name, text in SAMPLES.items():
+        cleaned = index.clean_extracted_text(text)
+        same = cleaned == reference_clean_extracted_text(text)
+        mismatches += not same
+        current = time_per_call(index.clean_extracted_text, text)
+        reference = time_per_call(reference_clean_extracted_text, text)
+        print(f"{name:>8} | {len(text):>6} | {current * 1e6:>7.0f} µs | {reference * 1e6:>7.0f} µs | "
+              f"{'same' if same else 'DIFFERENT'}")
+
+    print()
+    print(f"📝 {SAMPLES['poster'][:40]!r} -> {index.clean_extracted_text(SAMPLES['poster'])[:60]!r}")
+    if mismatches:
+        raise SystemExit(f"❌ {mismatches} sample(s) cleaned differently from the reference")
+    print("✅ Cleaner output matches the reference")
+
+if __name__ == '__main__':
+    main()
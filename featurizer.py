@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+CekAjaYuk text featurizer: the Random Forest's 20 text features for a batch
+of texts as one NumPy matrix. Shared by train_models.py and the backend
+(index.py) so training and serving compute the same features.
+Keyword lists come from lexicons/feature_keywords.json.
+"""
+
+import json
+
+import numpy as np
+
+# Random Forest features, in training (column) order
+FEATURE_NAMES = (
+    'length', 'word_count', 'sentence_count', 'avg_word_length',
+    'genuine_keywords', 'fake_keywords', 'keyword_ratio',
+    'has_email', 'has_phone', 'has_address', 'has_company',
+    'has_whatsapp', 'has_money_promise', 'has_urgency', 'has_mlm_terms', 'has_no_experience',
+    'uppercase_ratio', 'exclamation_count', 'question_count', 'number_count'
+)
+COLUMNS = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+# Keyword features: feature -> feature_keywords.json list, counted or any-of
+KEYWORD_COUNT_FEATURES = {'genuine_keywords': 'genuine_keywords', 'fake_keywords': 'fake_keywords'}
+KEYWORD_FLAG_FEATURES = {
+    'has_address': 'address',
+    'has_company': 'company',
+    'has_whatsapp': 'whatsapp',
+    'has_money_promise': 'money_promise',
+    'has_urgency': 'urgency',
+    'has_mlm_terms': 'mlm_terms',
+    'has_no_experience': 'no_experience'
+}
+
+INTEGER_FEATURES = ('length', 'word_count', 'sentence_count', 'genuine_keywords', 'fake_keywords',
+                    'exclamation_count', 'question_count', 'number_count')
+
+# Texts shorter than this (stripped) get an empty row; train_models.py never keeps them
+MIN_TEXT_LENGTH = 10
+
+# Below this many characters a batch is scanned text by text (NumPy's per-call
+# overhead, paid a few times per keyword, outweighs it for single requests)
+VECTORIZE_MIN_CHARS = 30000
+
+# Joins the batch into one string; never part of a keyword, so no match spans two texts
+SEPARATOR = '\x00'
+
+def character_classes(char):
+    """Bit flags: 1 upper case, 2 digit, 4 whitespace"""
+    return char.isupper() | char.isdigit() << 1 | char.isspace() << 2
+
+ASCII_CLASSES = np.array([character_classes(chr(code)) for code in range(128)], dtype=np.uint8)
+
+class TextFeaturizer:
+    """
+    Featurizes texts in batches. The batch is joined into one string and
+    turned into an array of character codes, so every feature is a handful
+    of NumPy operations over the whole batch: character classes (upper
+    case, digits, whitespace) come from one table lookup per character and
+    are summed per text; keywords are found by looking up each position's
+    character pair among the keywords' first pairs, then checking the rest
+    of each candidate keyword position-wise. Small batches (a single
+    request) are scanned text by text instead.
+    Keywords match as substrings of the lower-case text ('wa' inside
+    'wawancara'), and a keyword listed twice counts twice, as in training.
+    """
+
+    def __init__(self, keyword_lists):
+        lists = {name: [keyword.lower() for keyword in keyword_lists[name]]
+                 for name in list(KEYWORD_COUNT_FEATURES.values()) + list(KEYWORD_FLAG_FEATURES.values())}
+        self.vocabulary = sorted({keyword for keywords in lists.values() for keyword in keywords if keyword})
+        positions = {keyword: i for i, keyword in enumerate(self.vocabulary)}
+        self.weights = {
+            name: np.bincount([positions[keyword] for keyword in keywords if keyword], minlength=len(self.vocabulary))
+            for name, keywords in lists.items()
+        }
+
+        # Keyword characters as small ids (0: any other character, the separator included)
+        characters = sorted({char for keyword in self.vocabulary for char in keyword})
+        self.alphabet = np.zeros(max(map(ord, characters), default=0) + 2, dtype=np.int32)
+        self.alphabet[[ord(char) for char in characters]] = np.arange(1, len(characters) + 1)
+        self.pair_base = len(characters) + 1
+        self.longest = max(map(len, self.vocabulary), default=0)
+
+        # Keywords by their first character pair (single-character keywords apart)
+        self.keyword_ids = [self.alphabet[[ord(char) for char in keyword]] for keyword in self.vocabulary]
+        self.by_pair = {}
+        self.single = []
+        for j, ids in enumerate(self.keyword_ids):
+            if len(ids) == 1:
+                self.single.append(j)
+            else:
+                self.by_pair.setdefault(int(ids[0] * self.pair_base + ids[1]), []).append(j)
+        self.pair_table = np.zeros(self.pair_base ** 2, dtype=bool)
+        self.pair_table[list(self.by_pair)] = True
+
+    @classmethod
+    def from_file(cls, path):
+        """Featurizer for a feature_keywords.json lexicon file"""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f)['lexicons'])
+
+    def encode(self, text):
+        """Alphabet ids of text's characters"""
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        return self.alphabet[np.minimum(codes, len(self.alphabet) - 1)]
+
+    def keyword_presence(self, texts):
+        """(len(texts), len(vocabulary)) bool matrix: keyword j occurs in lower-cased text i"""
+        lowered = [text.lower() for text in texts]  # Per text: lower() can change a text's length
+        lengths = np.fromiter(map(len, lowered), dtype=np.int64, count=len(lowered))
+        starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+        size = int(starts[-1] + lengths[-1]) if len(lowered) else 0
+
+        presence = np.zeros((len(texts), len(self.vocabulary)), dtype=bool)
+        if not self.vocabulary:
+            return presence
+        if size < VECTORIZE_MIN_CHARS:
+            for i, text in enumerate(lowered):
+                presence[i] = [keyword in text for keyword in self.vocabulary]
+            return presence
+
+        ids = self.encode(SEPARATOR.join(lowered) + SEPARATOR * self.longest)
+
+        def text_of(positions):
+            return np.searchsorted(starts, positions, side='right') - 1
+
+        for j in self.single:
+            presence[text_of(np.flatnonzero(ids[:size] == self.keyword_ids[j][0])), j] = True
+
+        # Positions whose character pair starts some keyword, grouped by pair
+        pairs = ids[:size] * self.pair_base + ids[1:size + 1]
+        candidates = np.flatnonzero(self.pair_table[pairs])
+        candidate_pairs = pairs[candidates]
+        if len(self.pair_table) <= 1 << 16:
+            candidate_pairs = candidate_pairs.astype(np.uint16)  # Radix sorted
+        order = np.argsort(candidate_pairs, kind='stable')
+        candidates = candidates[order]
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(candidate_pairs, minlength=len(self.pair_table)))))
+
+        for pair, keywords in self.by_pair.items():
+            for j in keywords:
+                hits = candidates[offsets[pair]:offsets[pair + 1]]
+                for k in range(2, len(self.keyword_ids[j])):
+                    hits = hits[ids[hits + k] == self.keyword_ids[j][k]]
+                presence[text_of(hits), j] = True
+        return presence
+
+    def transform(self, texts):
+        """Feature matrix (len(texts), len(FEATURE_NAMES)), columns in FEATURE_NAMES order"""
+        texts = list(texts)
+        count = len(texts)
+        matrix = np.zeros((count, len(FEATURE_NAMES)))
+        if count == 0:
+            return matrix
+
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=count)
+        starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+        ends = starts + lengths
+        codes = np.frombuffer(SEPARATOR.join(texts).encode('utf-32-le'), dtype=np.uint32)
+
+        # Character classes: a table lookup per character, extended for the non-ASCII ones present
+        beyond = np.unique(codes[codes >= len(ASCII_CLASSES)])
+        table = np.zeros(max(len(ASCII_CLASSES), int(beyond.max()) + 1 if len(beyond) else 0), dtype=np.uint8)
+        table[:len(ASCII_CLASSES)] = ASCII_CLASSES
+        table[beyond] = [character_classes(chr(code)) for code in beyond.tolist()]
+        classes = table[codes]
+        upper, digit, space = (classes & 1).view(bool), (classes & 2) > 0, (classes & 4) > 0
+
+        def per_text(mask):
+            """Per-text counts of a per-character mask (separators fall between texts)"""
+            positions = np.flatnonzero(mask)
+            return np.searchsorted(positions, ends) - np.searchsorted(positions, starts)
+
+        # Words: runs of non-space characters; the separators end them too
+        separator = np.zeros(len(codes), dtype=bool)
+        separator[ends[:-1]] = True
+        word_chars = ~(space | separator)
+        word_starts = word_chars.copy()
+        word_starts[1:] &= ~word_chars[:-1]
+
+        # Sentences: pieces between full stops with some non-space text. Going
+        # over the non-space characters, one starts at each text character that
+        # follows a full stop or the start of its text.
+        solid = np.flatnonzero(~space)
+        stops = (codes[solid] == ord('.')) | separator[solid]
+        sentence_starts = np.zeros(len(codes), dtype=bool)
+        sentence_starts[solid[~stops & np.concatenate(([True], stops[:-1]))]] = True
+
+        word_count = per_text(word_starts)
+        number_count = per_text(digit)
+        columns = {
+            'length': lengths,
+            'word_count': word_count,
+            'sentence_count': per_text(sentence_starts),
+            'avg_word_length': (lengths - per_text(space)) / np.maximum(word_count, 1),
+            'has_email': per_text(codes == ord('@')) > 0,
+            'has_phone': number_count > 0,
+            'uppercase_ratio': per_text(upper) / np.maximum(lengths, 1),
+            'exclamation_count': per_text(codes == ord('!')),
+            'question_count': per_text(codes == ord('?')),
+            'number_count': number_count
+        }
+
+        presence = self.keyword_presence(texts)
+        for feature, name in KEYWORD_COUNT_FEATURES.items():
+            columns[feature] = presence @ self.weights[name]
+        for feature, name in KEYWORD_FLAG_FEATURES.items():
+            columns[feature] = (presence @ self.weights[name]) > 0
+        columns['keyword_ratio'] = columns['genuine_keywords'] / np.maximum(columns['fake_keywords'], 1)
+
+        for name, values in columns.items():
+            matrix[:, COLUMNS[name]] = values
+
+        # Too little text to judge: empty row
+        short = np.fromiter((len(text.strip()) < MIN_TEXT_LENGTH for text in texts), dtype=bool, count=count)
+        matrix[short] = 0
+        matrix[short, COLUMNS['keyword_ratio']] = 1
+        return matrix
+
+def feature_dict(row):
+    """A feature matrix row as {name: value}, with flags as bools and counts as ints"""
+    features = {}
+    for name, value in zip(FEATURE_NAMES, row.tolist()):
+        if name.startswith('has_'):
+            value = bool(value)
+        elif name in INTEGER_FEATURES:
+            value = int(value)
+        features[name] = value
+    return features
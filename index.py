@@ -2,7 +2,7 @@
 """
 CekAjaYuk Backend - Working Version with Proper Status
 """
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, g, has_request_context
 from flask_cors import CORS
 from datetime import datetime
 from pathlib import Path
@@ -13,15 +13,34 @@ import numpy as np
 import cv2
 from PIL import Image
 import io
+import re
+import time
 import base64
+import queue
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import pytesseract
 
+from featurizer import FEATURE_NAMES, TextFeaturizer, feature_dict
+
+# Parallel Tesseract runs share the cores; keep each one single-threaded
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-TESSERACT_PATH = '/usr/bin/tesseract'
-pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
+# Tesseract locations probed once at startup (TESSERACT_CMD overrides them)
+TESSERACT_CANDIDATE_PATHS = [
+    os.environ.get('TESSERACT_CMD'),
+    '/usr/bin/tesseract',
+    '/usr/local/bin/tesseract',
+    r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+    r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
+    'tesseract'  # If in PATH
+]
 
 app = Flask(__name__, static_folder='frontend/static', static_url_path='/static')
 CORS(app)
@@ -30,404 +49,239 @@ CORS(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MODELS_FOLDER'] = 'models'
+app.config['LEXICON_DIR'] = os.environ.get('LEXICON_DIR', 'lexicons')  # Keyword and OCR-fix data files (see LEXICON_FILES)
+app.config['LEXICON_RELOAD_INTERVAL'] = float(os.environ.get('LEXICON_RELOAD_INTERVAL', 10))  # Seconds between checks for edited lexicon files (0 disables hot reload)
+app.config['OCR_BACKEND'] = os.environ.get('OCR_BACKEND', 'auto')  # auto | api | cli
+app.config['OCR_MAX_WORKERS'] = int(os.environ.get('OCR_MAX_WORKERS', min(4, os.cpu_count() or 1)))  # Parallel OCR runs per worker
+app.config['OCR_POOL_SIZE'] = int(os.environ.get('OCR_POOL_SIZE', app.config['OCR_MAX_WORKERS']))  # Tesseract handles per worker
+app.config['OCR_DEADLINE_SECONDS'] = float(os.environ.get('OCR_DEADLINE_SECONDS', 20))  # Per-request OCR budget ('balanced' mode)
+app.config['OCR_DEFAULT_MODE'] = os.environ.get('OCR_DEFAULT_MODE', 'balanced')  # fast | balanced | accurate
+app.config['OCR_TESSDATA_DIRS'] = {  # Optional tessdata_fast / tessdata_best checkouts for the fast and accurate modes
+    'fast': os.environ.get('TESSDATA_FAST_DIR'),
+    'best': os.environ.get('TESSDATA_BEST_DIR')
+}
+app.config['OCR_PATIENCE'] = 3  # Stop after this many strategies without improvement
+app.config['OCR_MIN_IMPROVEMENT'] = 0.02  # Relative score gain that counts as improvement
+app.config['OCR_EARLY_EXIT_CONFIDENCE'] = 0.85  # Share of clean words that ends the search
+app.config['OCR_EARLY_EXIT_MIN_WORDS'] = 15
+app.config['OCR_SCORING'] = os.environ.get('OCR_SCORING', 'confidence')  # confidence | length
+app.config['OCR_CONFIDENCE_PASSES'] = 2  # Strategies tried with word-confidence scoring
+app.config['OCR_CONFIDENCE_ACCEPT'] = 0.75  # Quality that accepts the first pass
+app.config['OCR_TEXT_REGIONS'] = True  # OCR detected text blocks before whole-page strategies
+app.config['OCR_TEXT_PRECHECK'] = True  # Skip OCR for images that show no sign of text
+app.config['OCR_PRECHECK_MIN_GLYPHS'] = 6  # Glyph-like components needed to run OCR
+app.config['OCR_PRECHECK_MIN_LINE_GLYPHS'] = 3  # ...or this many side by side on one line (a single headline word)
+app.config['IMAGE_PIXEL_BUDGET'] = int(os.environ.get('IMAGE_PIXEL_BUDGET', 40_000_000))  # Larger JPEGs are draft-decoded down to it, other formats rejected
+app.config['IMAGE_REJECT_PIXELS'] = int(os.environ.get('IMAGE_REJECT_PIXELS', 150_000_000))  # Rejected from the header alone
+Image.MAX_IMAGE_PIXELS = app.config['IMAGE_REJECT_PIXELS']  # Pillow's own bomb check errors at twice this
+app.config['OCR_TARGET_TEXT_HEIGHT'] = 24  # Dominant glyph height (px, roughly the x-height) images are rescaled to
+app.config['OCR_TEXT_HEIGHT_RANGE'] = (16, 40)  # Glyph heights already in this range are not rescaled
+app.config['OCR_TILE_THRESHOLD_PIXELS'] = int(os.environ.get('OCR_TILE_THRESHOLD_PIXELS', 12_000_000))  # Larger images are OCR'd in tiles
+app.config['OCR_TILE_SIZE'] = 2048  # Tile side in pixels
+app.config['OCR_TILE_OVERLAP'] = 256  # Overlap between neighbouring tiles, wider than a typical word
+app.config['OCR_DESKEW'] = True  # Fix orientation (Tesseract OSD) and skew once before OCR
+app.config['OCR_OSD_MIN_CONFIDENCE'] = 2.0  # OSD orientation confidence needed to rotate
+app.config['OCR_MIN_SKEW_DEGREES'] = 0.5  # Smaller skew is left alone
+app.config['OCR_MAX_SKEW_DEGREES'] = 30  # Larger estimates are treated as layout, not skew
+app.config['OCR_SPELL_CORRECTION'] = True  # Dictionary (SymSpell) correction of misread words after the fix tables
+app.config['OCR_SPELL_MAX_DISTANCE'] = 2  # Edit distance for words of 9+ letters; shorter words get 1
+app.config['OCR_SPELL_MIN_LENGTH'] = 5  # Shorter words are never spell-corrected
+app.config['OCR_SPELL_INDEX_PATH'] = os.path.join(app.config['MODELS_FOLDER'], 'ocr_spelling_index.pkl')  # Rebuilt when the vocabulary changes
+app.config['OCR_CACHE_ENABLED'] = True
+app.config['OCR_CACHE_DIR'] = os.path.join(app.config['UPLOAD_FOLDER'], 'ocr_cache')
+app.config['OCR_CACHE_MAX_BYTES'] = int(os.environ.get('OCR_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+app.config['NEAR_DUPLICATE_ENABLED'] = True
+app.config['NEAR_DUPLICATE_MAX_DISTANCE'] = 6  # Max differing dHash bits (of 64) for a near-duplicate
+app.config['MEMORY_PROFILING'] = os.environ.get('MEMORY_PROFILING', '0') == '1'  # tracemalloc peaks per OCR stage
+app.config['REQUEST_MEMORY_BUDGET_BYTES'] = int(os.environ.get('REQUEST_MEMORY_BUDGET_BYTES', 256 * 1024 * 1024))
 
 # Global model variables
 rf_model = None
 feature_scaler = None
 text_vectorizer = None
+text_model = None
 dl_model = None
 models_loaded_count = 0
+ocr_engine = None
+ocr_executor = None
+ocr_executor_lock = threading.Lock()
+lexicons = None
+lexicon_load_lock = threading.Lock()
+lexicon_reload_lock = threading.Lock()
+lexicons_checked_at = 0.0
+lexicons_failed_signature = None
+ocr_cache = None
+poster_index = None
+
+# Lexicon data files in LEXICON_DIR, each {"version": n, ...}:
+#   keywords.json          legitimate / suspicious / neutral keyword lists (analyze_indonesian_keywords)
+#   ocr_fixes.json         whole-word and regex OCR fixes (OCRCorrector, spelling vocabulary)
+#   feature_keywords.json  keyword lists of the text features, the text classifier and the OCR checks
+LEXICON_FILES = ('keywords', 'ocr_fixes', 'feature_keywords')
+
+class SubstringKeywords:
+    """
+    A feature keyword list, matched as substrings of the lower-case text the
+    way the models' training features were ('wa' matches inside 'wawancara').
+    Lower-cased once at load; a keyword listed twice counts twice.
+    """
 
-# Indonesian Keywords Dictionary for Job Posting Analysis
-INDONESIAN_KEYWORDS = {
-    # Kata-kata yang menunjukkan lowongan kerja ASLI (1000+ words)
-    'legitimate_indicators': [
-        # Informasi perusahaan yang jelas (100+ words)
-        'perusahaan', 'company', 'pt', 'cv', 'tbk', 'persero', 'terbuka', 'swasta',
-        'kantor', 'alamat', 'lokasi', 'cabang', 'pusat', 'regional', 'divisi',
-        'departemen', 'bagian', 'unit', 'tim', 'grup', 'holding', 'korporat',
-        'korporasi', 'firma', 'badan', 'usaha', 'enterprise', 'organization',
-        'organisasi', 'lembaga', 'institusi', 'yayasan', 'foundation', 'trust',
-        'cooperative', 'koperasi', 'asosiasi', 'association', 'federation',
-        'federasi', 'union', 'serikat', 'guild', 'chamber', 'kamar', 'dagang',
-        'industri', 'manufaktur', 'pabrik', 'factory', 'plant', 'mill',
-        'workshop', 'bengkel', 'studio', 'laboratorium', 'laboratory', 'clinic',
-        'klinik', 'hospital', 'rumah', 'sakit', 'sekolah', 'school', 'college',
-        'universitas', 'university', 'institut', 'institute', 'akademi', 'academy',
-        'pusat', 'center', 'centre', 'hub', 'kompleks', 'complex', 'plaza',
-        'mall', 'gedung', 'building', 'tower', 'menara', 'lantai', 'floor',
-
-        # Posisi pekerjaan yang spesifik (200+ words)
-        'posisi', 'jabatan', 'lowongan', 'vacancy', 'karir', 'career', 'pekerjaan',
-        'staff', 'karyawan', 'pegawai', 'manager', 'supervisor', 'koordinator',
-        'asisten', 'admin', 'administrasi', 'sekretaris', 'operator', 'teknisi',
-        'analis', 'programmer', 'developer', 'designer', 'marketing', 'sales',
-        'customer', 'service', 'finance', 'accounting', 'hr', 'hrd', 'legal',
-        'engineer', 'consultant', 'specialist', 'executive', 'director',
-        'chief', 'kepala', 'head', 'leader', 'pemimpin', 'manajer', 'general',
-        'assistant', 'deputy', 'wakil', 'vice', 'senior', 'junior', 'trainee',
-        'intern', 'magang', 'praktikan', 'apprentice', 'cadet', 'officer',
-        'pejabat', 'official', 'representative', 'perwakilan', 'agent', 'agen',
-        'broker', 'dealer', 'distributor', 'supplier', 'vendor', 'contractor',
-        'kontraktor', 'freelancer', 'consultant', 'advisor', 'penasehat',
-        'counselor', 'mentor', 'coach', 'trainer', 'instructor', 'teacher',
-        'guru', 'dosen', 'lecturer', 'professor', 'researcher', 'peneliti',
-        'scientist', 'ilmuwan', 'analyst', 'auditor', 'inspector', 'examiner',
-        'evaluator', 'assessor', 'reviewer', 'editor', 'writer', 'penulis',
-        'journalist', 'reporter', 'correspondent', 'photographer', 'cameraman',
-        'videographer', 'graphic', 'web', 'mobile', 'software', 'hardware',
-        'network', 'system', 'database', 'security', 'quality', 'production',
-        'operation', 'logistics', 'procurement', 'purchasing', 'inventory',
-        'warehouse', 'shipping', 'delivery', 'transportation', 'driver',
-        'pilot', 'captain', 'crew', 'mechanic', 'technician', 'electrician',
-        'plumber', 'carpenter', 'welder', 'painter', 'cleaner', 'janitor',
-        'security', 'guard', 'receptionist', 'cashier', 'teller', 'clerk',
-
-        # Kualifikasi yang realistis (150+ words)
-        'kualifikasi', 'persyaratan', 'requirement', 'pendidikan', 'pengalaman',
-        'keahlian', 'skill', 'kemampuan', 'kompetensi', 'sertifikat', 'ijazah',
-        'diploma', 'sarjana', 's1', 's2', 's3', 'sma', 'smk', 'd1', 'd2', 'd3', 'd4',
-        'fresh', 'graduate', 'berpengalaman', 'minimal', 'maksimal', 'usia', 'tahun', 'bulan',
-        'lulusan', 'jurusan', 'fakultas', 'universitas', 'institut', 'sekolah',
-        'bachelor', 'master', 'doctor', 'phd', 'magister', 'doktor', 'profesor',
-        'certification', 'sertifikasi', 'license', 'lisensi', 'permit', 'izin',
-        'training', 'pelatihan', 'course', 'kursus', 'workshop', 'seminar',
-        'conference', 'konferensi', 'symposium', 'simposium', 'bootcamp',
-        'internship', 'magang', 'apprenticeship', 'fellowship', 'scholarship',
-        'beasiswa', 'grant', 'hibah', 'award', 'penghargaan', 'achievement',
-        'prestasi', 'accomplishment', 'portfolio', 'portofolio', 'project',
-        'proyek', 'assignment', 'tugas', 'thesis', 'skripsi', 'dissertation',
-        'research', 'penelitian', 'publication', 'publikasi', 'paper', 'artikel',
-        'journal', 'jurnal', 'book', 'buku', 'manual', 'guide', 'panduan',
-        'reference', 'referensi', 'recommendation', 'rekomendasi', 'endorsement',
-        'testimony', 'testimoni', 'review', 'ulasan', 'feedback', 'evaluation',
-        'assessment', 'test', 'exam', 'ujian', 'quiz', 'interview', 'wawancara',
-
-        # Benefit yang wajar (150+ words)
-        'gaji', 'salary', 'upah', 'wage', 'tunjangan', 'allowance', 'benefit', 'fasilitas',
-        'asuransi', 'insurance', 'kesehatan', 'health', 'medical', 'dental', 'vision',
-        'bpjs', 'jamsostek', 'cuti', 'leave', 'vacation', 'holiday', 'libur',
-        'bonus', 'insentif', 'incentive', 'komisi', 'commission', 'overtime',
-        'lembur', 'shift', 'transport', 'transportation', 'parking', 'parkir',
-        'makan', 'meal', 'lunch', 'dinner', 'snack', 'catering', 'kantin',
-        'seragam', 'uniform', 'dress', 'code', 'equipment', 'peralatan',
-        'laptop', 'computer', 'phone', 'handphone', 'mobile', 'tablet',
-        'training', 'pelatihan', 'development', 'pengembangan', 'career', 'karir',
-        'jenjang', 'path', 'promotion', 'promosi', 'advancement', 'kenaikan',
-        'pangkat', 'rank', 'grade', 'level', 'position', 'title', 'gelar',
-        'pension', 'pensiun', 'retirement', 'severance', 'pesangon', 'gratuity',
-        'thr', 'hari', 'raya', 'religious', 'agama', 'pilgrimage', 'haji',
-        'umrah', 'maternity', 'melahirkan', 'paternity', 'ayah', 'family',
-        'keluarga', 'child', 'anak', 'education', 'pendidikan', 'tuition',
-        'scholarship', 'beasiswa', 'daycare', 'nursery', 'gym', 'fitness',
-        'recreation', 'rekreasi', 'club', 'social', 'event', 'gathering',
-        'team', 'building', 'outing', 'trip', 'tour', 'travel', 'hotel',
-        'accommodation', 'akomodasi', 'housing', 'rumah', 'apartment', 'mess',
-
-        # Proses rekrutmen yang jelas (100+ words)
-        'lamaran', 'application', 'apply', 'melamar', 'kirim', 'send', 'submit',
-        'email', 'mail', 'post', 'cv', 'curriculum', 'vitae', 'resume',
-        'biodata', 'profile', 'surat', 'letter', 'cover', 'motivasi', 'motivation',
-        'interview', 'wawancara', 'meeting', 'pertemuan', 'discussion', 'diskusi',
-        'test', 'tes', 'exam', 'ujian', 'assessment', 'evaluasi', 'screening',
-        'seleksi', 'selection', 'recruitment', 'rekrutmen', 'hiring', 'penerimaan',
-        'tahap', 'stage', 'phase', 'step', 'proses', 'process', 'procedure',
-        'prosedur', 'method', 'metode', 'system', 'sistem', 'protocol',
-        'deadline', 'batas', 'waktu', 'time', 'limit', 'periode', 'period',
-        'duration', 'durasi', 'schedule', 'jadwal', 'timeline', 'calendar',
-        'appointment', 'janji', 'booking', 'reservation', 'confirmation',
-        'konfirmasi', 'verification', 'verifikasi', 'validation', 'validasi',
-        'panggilan', 'call', 'invitation', 'undangan', 'notification',
-        'pemberitahuan', 'announcement', 'pengumuman', 'result', 'hasil',
-        'outcome', 'decision', 'keputusan', 'verdict', 'conclusion', 'kesimpulan',
-
-        # Kontak yang profesional (100+ words)
-        'kontak', 'contact', 'communication', 'komunikasi', 'telepon', 'telephone',
-        'phone', 'mobile', 'handphone', 'hp', 'whatsapp', 'wa', 'sms', 'text',
-        'email', 'mail', 'address', 'alamat', 'website', 'web', 'site', 'url',
-        'link', 'social', 'media', 'linkedin', 'facebook', 'twitter', 'instagram',
-        'office', 'kantor', 'building', 'gedung', 'floor', 'lantai', 'room',
-        'ruang', 'suite', 'unit', 'pic', 'person', 'in', 'charge', 'responsible',
-        'penanggung', 'jawab', 'coordinator', 'koordinator', 'manager', 'manajer',
-        'supervisor', 'head', 'kepala', 'chief', 'director', 'direktur',
-        'hrd', 'human', 'resource', 'sumber', 'daya', 'manusia', 'personnel',
-        'recruitment', 'rekrutmen', 'recruiter', 'hiring', 'penerimaan',
-        'talent', 'acquisition', 'staffing', 'employment', 'career', 'karir',
-        'job', 'vacancy', 'position', 'opening', 'opportunity', 'kesempatan',
-        'representative', 'perwakilan', 'agent', 'agen', 'consultant', 'konsultan',
-        'advisor', 'penasehat', 'counselor', 'mentor', 'guide', 'panduan',
-
-        # Technical skills dan industri (200+ words)
-        'computer', 'komputer', 'technology', 'teknologi', 'digital', 'software',
-        'hardware', 'network', 'jaringan', 'internet', 'web', 'mobile', 'app',
-        'aplikasi', 'program', 'programming', 'coding', 'development', 'design',
-        'database', 'server', 'cloud', 'security', 'cyber', 'data', 'analytics',
-        'analysis', 'business', 'intelligence', 'artificial', 'machine', 'learning',
-        'automation', 'robotics', 'engineering', 'manufacturing', 'production',
-        'quality', 'control', 'assurance', 'testing', 'research', 'development',
-        'innovation', 'project', 'management', 'planning', 'strategy', 'consulting',
-        'advisory', 'financial', 'accounting', 'audit', 'tax', 'legal', 'compliance',
-        'regulatory', 'risk', 'insurance', 'banking', 'investment', 'trading',
-        'marketing', 'advertising', 'promotion', 'branding', 'communication',
-        'public', 'relations', 'media', 'content', 'creative', 'graphic',
-        'multimedia', 'photography', 'video', 'animation', 'broadcasting',
-        'journalism', 'writing', 'editing', 'translation', 'interpretation',
-        'education', 'training', 'teaching', 'instruction', 'curriculum',
-        'healthcare', 'medical', 'nursing', 'pharmacy', 'laboratory', 'clinical',
-        'hospitality', 'tourism', 'hotel', 'restaurant', 'culinary', 'chef',
-        'retail', 'wholesale', 'distribution', 'logistics', 'supply', 'chain',
-        'procurement', 'purchasing', 'inventory', 'warehouse', 'shipping',
-        'transportation', 'automotive', 'aviation', 'maritime', 'construction',
-        'architecture', 'real', 'estate', 'property', 'facility', 'maintenance'
-    ],
-
-    # Kata-kata yang menunjukkan lowongan kerja PALSU/MENCURIGAKAN (800+ words)
-    'suspicious_indicators': [
-        # Janji berlebihan dan tidak realistis (100+ words)
-        'mudah', 'cepat', 'instant', 'langsung', 'tanpa', 'pengalaman',
-        'jutaan', 'milyar', 'kaya', 'sukses', 'freedom', 'bebas', 'flexible',
-        'kerja', 'rumah', 'online', 'part', 'time', 'sampingan', 'tambahan',
-        'unlimited', 'tak', 'terbatas', 'fantastis', 'luar', 'biasa',
-        'amazing', 'incredible', 'unbelievable', 'extraordinary', 'phenomenal',
-        'spectacular', 'miraculous', 'magical', 'ajaib', 'mukjizat', 'keajaiban',
-        'dahsyat', 'hebat', 'super', 'mega', 'ultra', 'extreme', 'maximum',
-        'optimal', 'perfect', 'sempurna', 'ideal', 'ultimate', 'supreme',
-        'premium', 'exclusive', 'eksklusif', 'special', 'khusus', 'istimewa',
-        'limited', 'terbatas', 'rare', 'langka', 'unique', 'unik', 'one',
-        'time', 'sekali', 'seumur', 'hidup', 'lifetime', 'forever', 'selamanya',
-        'guaranteed', 'dijamin', 'pasti', 'certain', 'sure', 'yakin', 'confident',
-        'proven', 'terbukti', 'tested', 'teruji', 'verified', 'terverifikasi',
-        'authentic', 'asli', 'original', 'genuine', 'real', 'nyata', 'actual',
-        'revolutionary', 'revolusioner', 'breakthrough', 'terobosan', 'innovation',
-        'inovasi', 'cutting', 'edge', 'canggih', 'modern', 'latest', 'terbaru',
-
-        # Skema MLM/Piramida dan bisnis mencurigakan (150+ words)
-        'mlm', 'multi', 'level', 'marketing', 'network', 'bisnis', 'investasi',
-        'modal', 'join', 'member', 'downline', 'upline', 'sponsor', 'referral',
-        'komisi', 'passive', 'income', 'residual', 'binary', 'matrix', 'plan',
-        'sistem', 'piramida', 'rantai', 'jaringan', 'distributor', 'agen',
-        'affiliate', 'afiliasi', 'partnership', 'kemitraan', 'franchise',
-        'waralaba', 'dealer', 'reseller', 'dropship', 'dropshipper', 'supplier',
-        'vendor', 'wholesaler', 'grosir', 'retail', 'eceran', 'trading',
-        'perdagangan', 'forex', 'cryptocurrency', 'crypto', 'bitcoin', 'altcoin',
-        'mining', 'staking', 'defi', 'nft', 'blockchain', 'token', 'coin',
-        'investment', 'fund', 'mutual', 'reksadana', 'saham', 'stock', 'bond',
-        'obligasi', 'commodity', 'komoditas', 'futures', 'options', 'derivative',
-        'hedge', 'portfolio', 'asset', 'aset', 'property', 'properti', 'real',
-        'estate', 'land', 'tanah', 'building', 'gedung', 'apartment', 'villa',
-        'insurance', 'asuransi', 'policy', 'polis', 'premium', 'premi', 'claim',
-        'klaim', 'benefit', 'manfaat', 'coverage', 'perlindungan', 'protection',
-        'scheme', 'skema', 'program', 'package', 'paket', 'bundle', 'combo',
-        'deal', 'offer', 'penawaran', 'promotion', 'promosi', 'discount',
-        'diskon', 'cashback', 'rebate', 'reward', 'hadiah', 'prize', 'undian',
-        'lottery', 'sweepstakes', 'contest', 'kompetisi', 'challenge', 'tantangan',
-
-        # Permintaan uang/biaya mencurigakan (100+ words)
-        'biaya', 'bayar', 'transfer', 'deposit', 'jaminan', 'administrasi',
-        'pendaftaran', 'registrasi', 'materai', 'meterai', 'pulsa', 'saldo',
-        'top', 'up', 'isi', 'ulang', 'voucher', 'token', 'kode', 'pin',
-        'starter', 'pack', 'paket', 'membership', 'keanggotaan', 'iuran',
-        'fee', 'charge', 'cost', 'price', 'harga', 'tarif', 'rate', 'amount',
-        'jumlah', 'sum', 'total', 'payment', 'pembayaran', 'transaction',
-        'transaksi', 'purchase', 'pembelian', 'buy', 'beli', 'order', 'pesan',
-        'booking', 'reservation', 'down', 'payment', 'uang', 'muka', 'advance',
-        'prepaid', 'prabayar', 'postpaid', 'pascabayar', 'credit', 'kredit',
-        'debit', 'cash', 'tunai', 'bank', 'account', 'rekening', 'atm', 'card',
-        'kartu', 'e-wallet', 'digital', 'wallet', 'dompet', 'electronic', 'money',
-        'e-money', 'mobile', 'banking', 'internet', 'online', 'virtual', 'account',
-        'va', 'qr', 'code', 'barcode', 'scan', 'tap', 'swipe', 'chip', 'magnetic',
-        'stripe', 'contactless', 'nfc', 'bluetooth', 'wifi', 'data', 'internet',
-        'quota', 'kuota', 'package', 'unlimited', 'roaming', 'international',
-
-        # Bahasa tidak profesional dan slang (100+ words)
-        'bro', 'sis', 'guys', 'teman', 'sobat', 'kawan', 'sahabat', 'bestie',
-        'mantap', 'keren', 'wow', 'amazing', 'fantastic', 'gila', 'gilak',
-        'mantul', 'mantab', 'jos', 'gandos', 'top', 'markotop', 'ajib',
-        'dahsyat', 'hebat', 'super', 'mega', 'ultra', 'extreme', 'awesome',
-        'cool', 'hot', 'fire', 'lit', 'sick', 'dope', 'fresh', 'tight',
-        'solid', 'legit', 'real', 'true', 'facts', 'no', 'cap', 'periodt',
-        'slay', 'queen', 'king', 'boss', 'chief', 'legend', 'goat', 'mvp',
-        'pro', 'expert', 'master', 'ninja', 'guru', 'wizard', 'genius',
-        'brilliant', 'smart', 'clever', 'wise', 'sharp', 'quick', 'fast',
-        'speed', 'turbo', 'boost', 'power', 'strong', 'tough', 'hard',
-        'intense', 'crazy', 'wild', 'mad', 'insane', 'nuts', 'bonkers',
-        'wicked', 'sick', 'ill', 'bad', 'good', 'great', 'excellent',
-        'outstanding', 'remarkable', 'impressive', 'stunning', 'gorgeous',
-        'beautiful', 'lovely', 'cute', 'sweet', 'nice', 'fine', 'okay',
-        'alright', 'sure', 'yeah', 'yep', 'yup', 'nope', 'nah', 'whatever',
-
-        # Urgency dan pressure tactics (100+ words)
-        'segera', 'cepat', 'buruan', 'terbatas', 'limited', 'promo', 'diskon',
-        'gratis', 'free', 'bonus', 'hadiah', 'doorprize', 'undian', 'lucky',
-        'beruntung', 'kesempatan', 'emas', 'langka', 'jarang', 'eksklusif',
-        'special', 'khusus', 'istimewa', 'rahasia', 'secret', 'tersembunyi',
-        'urgent', 'emergency', 'darurat', 'penting', 'important', 'critical',
-        'crucial', 'vital', 'essential', 'necessary', 'must', 'harus', 'wajib',
-        'required', 'mandatory', 'compulsory', 'obligatory', 'forced', 'paksa',
-        'pressure', 'tekanan', 'stress', 'rush', 'hurry', 'quick', 'fast',
-        'immediate', 'instant', 'now', 'sekarang', 'today', 'hari', 'ini',
-        'tonight', 'malam', 'tomorrow', 'besok', 'deadline', 'batas', 'waktu',
-        'expire', 'expired', 'kadaluarsa', 'habis', 'end', 'finish', 'close',
-        'tutup', 'stop', 'berhenti', 'last', 'terakhir', 'final', 'ultimate',
-        'chance', 'kesempatan', 'opportunity', 'peluang', 'moment', 'saat',
-        'time', 'timing', 'schedule', 'jadwal', 'calendar', 'date', 'tanggal',
-        'clock', 'jam', 'hour', 'minute', 'menit', 'second', 'detik', 'countdown',
-
-        # Kontak tidak profesional dan media sosial (100+ words)
-        'dm', 'inbox', 'pm', 'private', 'message', 'chat', 'japri', 'personal',
-        'nomor', 'hp', 'handphone', 'telegram', 'line', 'bbm', 'pin', 'ig',
-        'instagram', 'facebook', 'fb', 'twitter', 'tiktok', 'youtube', 'snapchat',
-        'medsos', 'sosmed', 'social', 'media', 'platform', 'aplikasi', 'app',
-        'whatsapp', 'wa', 'wechat', 'viber', 'skype', 'zoom', 'meet', 'teams',
-        'discord', 'slack', 'messenger', 'signal', 'threema', 'wickr', 'kik',
-        'reddit', 'tumblr', 'pinterest', 'linkedin', 'clubhouse', 'twitch',
-        'streaming', 'live', 'broadcast', 'podcast', 'vlog', 'blog', 'website',
-        'site', 'link', 'url', 'bit.ly', 'tinyurl', 'shortlink', 'redirect',
-        'click', 'klik', 'tap', 'touch', 'swipe', 'scroll', 'browse', 'surf',
-        'search', 'google', 'yahoo', 'bing', 'duckduckgo', 'engine', 'seo',
-        'keyword', 'hashtag', 'tag', 'mention', 'share', 'like', 'love',
-        'comment', 'reply', 'retweet', 'repost', 'story', 'status', 'update',
-        'post', 'upload', 'download', 'install', 'uninstall', 'delete', 'remove',
-
-        # Skema get-rich-quick dan manipulatif (150+ words)
-        'autopilot', 'otomatis', 'robot', 'bot', 'software', 'tools', 'system',
-        'trick', 'tips', 'cara', 'metode', 'strategi', 'formula', 'resep',
-        'kunci', 'solusi', 'jalan', 'pintas', 'shortcut', 'hack', 'cheat',
-        'magic', 'ajaib', 'mukjizat', 'keajaiban', 'misteri', 'fenomena',
-        'secret', 'rahasia', 'hidden', 'tersembunyi', 'underground', 'exclusive',
-        'insider', 'leaked', 'bocor', 'revealed', 'terungkap', 'exposed',
-        'truth', 'kebenaran', 'fact', 'fakta', 'reality', 'kenyataan', 'proof',
-        'bukti', 'evidence', 'testimoni', 'testimony', 'review', 'rating',
-        'star', 'bintang', 'score', 'point', 'level', 'rank', 'position',
-        'status', 'badge', 'medal', 'trophy', 'award', 'prize', 'winner',
-        'champion', 'juara', 'first', 'pertama', 'top', 'best', 'terbaik',
-        'number', 'one', 'nomor', 'satu', 'leader', 'pemimpin', 'pioneer',
-        'pelopor', 'founder', 'pendiri', 'creator', 'pencipta', 'inventor',
-        'discoverer', 'penemu', 'explorer', 'researcher', 'scientist', 'expert',
-        'specialist', 'professional', 'master', 'guru', 'teacher', 'mentor',
-        'coach', 'trainer', 'instructor', 'guide', 'advisor', 'consultant',
-        'jangan', 'sampai', 'terlewat', 'lewatkan', 'sia', 'siakan', 'rugi',
-        'menyesal', 'penyesalan', 'kesalahan', 'fatal', 'besar', 'seumur',
-        'hidup', 'selamanya', 'abadi', 'kekal', 'permanen', 'tetap', 'forever',
-        'eternal', 'infinite', 'unlimited', 'endless', 'boundless', 'limitless'
-    ],
-
-    # Kata-kata netral yang perlu konteks (200+ words)
-    'neutral_keywords': [
-        # Basic work terms
-        'kerja', 'work', 'job', 'opportunity', 'kesempatan', 'peluang',
-        'penghasilan', 'income', 'uang', 'money', 'rupiah', 'dollar',
-        'waktu', 'time', 'hari', 'minggu', 'bulan', 'tahun', 'jam',
-        'tempat', 'lokasi', 'daerah', 'kota', 'jakarta', 'surabaya',
-        'bandung', 'medan', 'semarang', 'yogyakarta', 'bali', 'makassar',
-        'solo', 'malang', 'bogor', 'depok', 'tangerang', 'bekasi',
-        'industri', 'sektor', 'bidang', 'area', 'wilayah', 'zona',
-
-        # Time and schedule terms
-        'senin', 'selasa', 'rabu', 'kamis', 'jumat', 'sabtu', 'minggu',
-        'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
-        'pagi', 'siang', 'sore', 'malam', 'morning', 'afternoon', 'evening', 'night',
-        'shift', 'overtime', 'lembur', 'flexible', 'fleksibel', 'schedule', 'jadwal',
-
-        # Location terms
-        'pusat', 'center', 'utara', 'selatan', 'timur', 'barat', 'north', 'south',
-        'east', 'west', 'tengah', 'central', 'kecamatan', 'kelurahan', 'desa',
-        'kabupaten', 'provinsi', 'negara', 'country', 'region', 'district',
-        'jalan', 'street', 'road', 'avenue', 'boulevard', 'gang', 'alley',
-
-        # General business terms
-        'bisnis', 'business', 'commerce', 'trade', 'perdagangan', 'ekonomi',
-        'economy', 'market', 'pasar', 'customer', 'pelanggan', 'client', 'klien',
-        'service', 'layanan', 'product', 'produk', 'quality', 'kualitas',
-        'standard', 'standar', 'professional', 'profesional', 'experience',
-        'pengalaman', 'skill', 'keahlian', 'knowledge', 'pengetahuan',
-
-        # Communication terms
-        'komunikasi', 'communication', 'bahasa', 'language', 'english', 'inggris',
-        'speaking', 'writing', 'reading', 'listening', 'presentation', 'presentasi',
-        'meeting', 'rapat', 'discussion', 'diskusi', 'negotiation', 'negosiasi',
-
-        # Technology terms
-        'computer', 'komputer', 'internet', 'email', 'website', 'software',
-        'application', 'aplikasi', 'system', 'sistem', 'data', 'information',
-        'informasi', 'digital', 'online', 'offline', 'mobile', 'desktop',
-
-        # Education terms
-        'education', 'pendidikan', 'school', 'sekolah', 'university', 'universitas',
-        'college', 'degree', 'gelar', 'certificate', 'sertifikat', 'training',
-        'pelatihan', 'course', 'kursus', 'learning', 'pembelajaran', 'study',
-
-        # General descriptive terms
-        'good', 'baik', 'excellent', 'bagus', 'quality', 'berkualitas', 'professional',
-        'reliable', 'handal', 'responsible', 'bertanggung jawab', 'honest', 'jujur',
-        'dedicated', 'berdedikasi', 'motivated', 'termotivasi', 'enthusiastic',
-        'antusias', 'creative', 'kreatif', 'innovative', 'inovatif', 'efficient',
-        'efisien', 'effective', 'efektif', 'productive', 'produktif', 'organized',
-        'terorganisir', 'detail', 'oriented', 'focused', 'fokus', 'committed',
-        'berkomitmen', 'loyal', 'setia', 'trustworthy', 'dapat dipercaya',
-
-        # Additional 300+ neutral keywords to reach 2000+ total
-        'available', 'tersedia', 'open', 'terbuka', 'closed', 'tutup', 'active',
-        'aktif', 'inactive', 'tidak aktif', 'current', 'saat ini', 'previous',
-        'sebelumnya', 'next', 'berikutnya', 'last', 'terakhir', 'first', 'pertama',
-        'second', 'kedua', 'third', 'ketiga', 'fourth', 'keempat', 'fifth', 'kelima',
-        'primary', 'utama', 'secondary', 'sekunder', 'main', 'utama', 'sub', 'bagian',
-        'major', 'besar', 'minor', 'kecil', 'important', 'penting', 'urgent', 'mendesak',
-        'normal', 'biasa', 'special', 'khusus', 'regular', 'reguler', 'irregular',
-        'tidak teratur', 'formal', 'resmi', 'informal', 'tidak resmi', 'official',
-        'resmi', 'unofficial', 'tidak resmi', 'public', 'umum', 'private', 'pribadi',
-        'internal', 'dalam', 'external', 'luar', 'local', 'lokal', 'national',
-        'nasional', 'international', 'internasional', 'global', 'worldwide', 'dunia',
-        'domestic', 'domestik', 'foreign', 'asing', 'native', 'asli', 'original',
-        'asli', 'copy', 'salinan', 'duplicate', 'duplikat', 'unique', 'unik',
-        'common', 'umum', 'rare', 'langka', 'frequent', 'sering', 'occasional',
-        'kadang', 'daily', 'harian', 'weekly', 'mingguan', 'monthly', 'bulanan',
-        'yearly', 'tahunan', 'annual', 'tahunan', 'seasonal', 'musiman', 'temporary',
-        'sementara', 'permanent', 'permanen', 'fixed', 'tetap', 'variable', 'variabel',
-        'constant', 'konstan', 'stable', 'stabil', 'unstable', 'tidak stabil',
-        'secure', 'aman', 'insecure', 'tidak aman', 'safe', 'aman', 'dangerous',
-        'berbahaya', 'risky', 'berisiko', 'certain', 'pasti', 'uncertain', 'tidak pasti',
-        'clear', 'jelas', 'unclear', 'tidak jelas', 'obvious', 'jelas', 'hidden',
-        'tersembunyi', 'visible', 'terlihat', 'invisible', 'tidak terlihat', 'bright',
-        'terang', 'dark', 'gelap', 'light', 'ringan', 'heavy', 'berat', 'easy',
-        'mudah', 'difficult', 'sulit', 'simple', 'sederhana', 'complex', 'kompleks',
-        'basic', 'dasar', 'advanced', 'lanjutan', 'beginner', 'pemula', 'intermediate',
-        'menengah', 'expert', 'ahli', 'novice', 'pemula', 'experienced', 'berpengalaman',
-        'skilled', 'terampil', 'unskilled', 'tidak terampil', 'qualified', 'berkualifikasi',
-        'unqualified', 'tidak berkualifikasi', 'certified', 'bersertifikat', 'licensed',
-        'berlisensi', 'authorized', 'berwenang', 'unauthorized', 'tidak berwenang',
-        'approved', 'disetujui', 'rejected', 'ditolak', 'accepted', 'diterima',
-        'declined', 'ditolak', 'confirmed', 'dikonfirmasi', 'pending', 'menunggu',
-        'processing', 'memproses', 'completed', 'selesai', 'finished', 'selesai',
-        'started', 'dimulai', 'stopped', 'dihentikan', 'paused', 'dijeda', 'resumed',
-        'dilanjutkan', 'cancelled', 'dibatalkan', 'postponed', 'ditunda', 'delayed',
-        'tertunda', 'scheduled', 'dijadwalkan', 'planned', 'direncanakan', 'organized',
-        'diorganisir', 'arranged', 'diatur', 'prepared', 'disiapkan', 'ready', 'siap',
-        'unready', 'tidak siap', 'available', 'tersedia', 'unavailable', 'tidak tersedia',
-        'accessible', 'dapat diakses', 'inaccessible', 'tidak dapat diakses', 'reachable',
-        'dapat dijangkau', 'unreachable', 'tidak dapat dijangkau', 'connected', 'terhubung',
-        'disconnected', 'terputus', 'online', 'daring', 'offline', 'luring', 'active',
-        'aktif', 'inactive', 'tidak aktif', 'enabled', 'diaktifkan', 'disabled',
-        'dinonaktifkan', 'working', 'bekerja', 'broken', 'rusak', 'functional',
-        'berfungsi', 'dysfunctional', 'tidak berfungsi', 'operational', 'operasional',
-        'non-operational', 'tidak operasional', 'running', 'berjalan', 'stopped',
-        'berhenti', 'moving', 'bergerak', 'stationary', 'diam', 'mobile', 'bergerak',
-        'immobile', 'tidak bergerak', 'flexible', 'fleksibel', 'rigid', 'kaku',
-        'soft', 'lunak', 'hard', 'keras', 'smooth', 'halus', 'rough', 'kasar',
-        'clean', 'bersih', 'dirty', 'kotor', 'fresh', 'segar', 'stale', 'basi',
-        'new', 'baru', 'old', 'lama', 'modern', 'modern', 'traditional', 'tradisional',
-        'contemporary', 'kontemporer', 'classic', 'klasik', 'vintage', 'vintage',
-        'antique', 'antik', 'recent', 'baru-baru ini', 'ancient', 'kuno', 'current',
-        'saat ini', 'outdated', 'ketinggalan zaman', 'updated', 'diperbarui', 'upgraded',
-        'ditingkatkan', 'downgraded', 'diturunkan', 'improved', 'diperbaiki', 'worsened',
-        'memburuk', 'enhanced', 'ditingkatkan', 'reduced', 'dikurangi', 'increased',
-        'ditingkatkan', 'decreased', 'dikurangi', 'expanded', 'diperluas', 'contracted',
-        'dikontrak', 'extended', 'diperpanjang', 'shortened', 'dipersingkat', 'lengthened',
-        'diperpanjang', 'widened', 'diperlebar', 'narrowed', 'dipersempit', 'broadened',
-        'diperluas', 'deepened', 'diperdalam', 'shallowed', 'diperdangkal', 'raised',
-        'dinaikkan', 'lowered', 'diturunkan', 'lifted', 'diangkat', 'dropped', 'dijatuhkan'
-    ]
-}
+    def __init__(self, keywords):
+        self.keywords = tuple(keyword.lower() for keyword in keywords)
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def any(self, text_lower):
+        return any(keyword in text_lower for keyword in self.keywords)
+
+    def count(self, text_lower):
+        return sum(1 for keyword in self.keywords if keyword in text_lower)
+
+    def found(self, text_lower, limit=None):
+        return [keyword for keyword in self.keywords[:limit] if keyword in text_lower]
+
+class Lexicons:
+    """
+    One version of the lexicon files and everything compiled from it: the
+    keyword automaton, the OCR corrector (with its spelling index), the OCR
+    scoring vocabulary, the feature keyword lists and their TextFeaturizer.
+    Fully built before it is used and never changed afterwards, so a reload
+    swaps it whole.
+    version is a digest of the files' contents.
+    """
+
+    def __init__(self, data, version, directory=None, signature=None):
+        self.version = version
+        self.directory = directory
+        self.signature = signature
+        self.file_versions = {name: data[name].get('version') for name in LEXICON_FILES}
+        self.loaded_at = datetime.now().isoformat()
+
+        self.keywords = data['keywords']['lexicons']
+        self.word_fixes = data['ocr_fixes']['word_fixes']
+        self.pattern_fixes = data['ocr_fixes']['pattern_fixes']
+        self.features = {name: SubstringKeywords(keywords) for name, keywords in data['feature_keywords']['lexicons'].items()}
+        self.featurizer = TextFeaturizer(data['feature_keywords']['lexicons'])
+
+        self.keyword_automaton = KeywordAutomaton(self.keywords)
+        self.ocr_vocabulary = frozenset(
+            word
+            for phrase in [keyword for keywords in self.keywords.values() for keyword in keywords] + list(self.pattern_fixes.values())
+            for word in phrase.lower().split()
+        )
+        self.spelling_vocabulary = get_spelling_vocabulary(self)
+        speller = load_spelling_index(self.spelling_vocabulary) if app.config['OCR_SPELL_CORRECTION'] else None
+        self.corrector = OCRCorrector(
+            self.word_fixes, self.pattern_fixes,
+            speller=speller, min_length=app.config['OCR_SPELL_MIN_LENGTH']
+        )
+
+    @classmethod
+    def load(cls, directory):
+        """Read and compile the lexicon files in directory (ValueError when one is malformed)"""
+        import hashlib
+        import json
+
+        signature = lexicon_signature(directory)
+        digest = hashlib.sha256()
+        data = {}
+        for name in LEXICON_FILES:
+            path = os.path.join(directory, f'{name}.json')
+            with open(path, 'rb') as f:
+                content = f.read()
+            digest.update(content)
+            try:
+                data[name] = json.loads(content)
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}")
+
+        try:
+            return cls(data, digest.hexdigest()[:12], directory, signature)
+        except (KeyError, AttributeError, TypeError) as e:
+            raise ValueError(f"Malformed lexicon files in {directory}: {e!r}")
+
+    def info(self):
+        return {
+            'version': self.version,
+            'loaded_at': self.loaded_at,
+            'files': {name: {'version': version} for name, version in self.file_versions.items()},
+            'keywords': {name: len(keywords) for name, keywords in self.keywords.items()},
+            'ocr_fixes': len(self.word_fixes) + len(self.pattern_fixes),
+            'feature_keywords': {name: len(keywords) for name, keywords in self.features.items()}
+        }
+
+def lexicon_signature(directory):
+    """(name, mtime, size) of each lexicon file, a cheap check for edits"""
+    signature = []
+    for name in LEXICON_FILES:
+        stat = os.stat(os.path.join(directory, f'{name}.json'))
+        signature.append((name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def get_lexicons():
+    """
+    The worker's Lexicons, loaded on first use (initialize_app warms them).
+    Later calls check the files at most every LEXICON_RELOAD_INTERVAL
+    seconds; edited files are compiled on a background thread and swapped
+    in once ready, so no request waits on a reload. A request keeps the
+    version it first saw (pinned in flask.g) until it finishes.
+    """
+    global lexicons
+
+    if has_request_context() and 'lexicons' in g:
+        return g.lexicons
+
+    current = lexicons
+    if current is None:
+        with lexicon_load_lock:
+            if lexicons is None:
+                lexicons = Lexicons.load(app.config['LEXICON_DIR'])
+                logger.info(f"✅ Lexicons loaded: version {lexicons.version}")
+            current = lexicons
+    else:
+        check_lexicon_files(current)
+
+    if has_request_context():
+        g.lexicons = current
+    return current
+
+def check_lexicon_files(current):
+    """Start a background reload when the lexicon files changed since current was loaded"""
+    global lexicons_checked_at
+
+    interval = app.config['LEXICON_RELOAD_INTERVAL']
+    now = time.monotonic()
+    if interval <= 0 or now - lexicons_checked_at < interval:
+        return
+    lexicons_checked_at = now
+
+    try:
+        signature = lexicon_signature(current.directory)
+    except OSError as e:
+        logger.warning(f"⚠️ Lexicon files unreadable ({e}), keeping version {current.version}")
+        return
+    if signature in (current.signature, lexicons_failed_signature):
+        return
+    if lexicon_reload_lock.acquire(blocking=False):
+        threading.Thread(target=reload_lexicons, args=(signature,), name='lexicon-reload', daemon=True).start()
+
+def reload_lexicons(signature):
+    """Compile the lexicon files and swap them in; a failed load keeps the current version"""
+    global lexicons, lexicons_failed_signature
+
+    try:
+        start = time.time()
+        previous = lexicons
+        lexicons = Lexicons.load(previous.directory)
+        increment_metric('lexicon_reloads')
+        logger.info(f"🔄 Lexicons reloaded: version {previous.version} -> {lexicons.version} ({time.time() - start:.2f}s)")
+    except Exception as e:
+        lexicons_failed_signature = signature
+        increment_metric('lexicon_reload_failures')
+        logger.error(f"❌ Lexicon reload failed, keeping version {lexicons.version}: {e}")
+    finally:
+        lexicon_reload_lock.release()
 
 # Global status variables
 models_status = {
@@ -442,6 +296,68 @@ ocr_status = {
     'error': 'Tesseract not configured'
 }
 
+# Per-worker pipeline counters, reported by /api/metrics
+pipeline_metrics = {}
+pipeline_metrics_lock = threading.Lock()
+
+def increment_metric(name, amount=1):
+    """Increment a pipeline counter"""
+    with pipeline_metrics_lock:
+        pipeline_metrics[name] = pipeline_metrics.get(name, 0) + amount
+
+def current_rss_bytes():
+    """Resident set size of this worker, or None where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class MemoryProfile:
+    """
+    Peak memory per pipeline stage of one request, from tracemalloc.
+    Active only with MEMORY_PROFILING: tracing slows every allocation, and
+    it is process-wide, so concurrent requests on a worker share peaks.
+    tracemalloc sees numpy/OpenCV buffers but not Pillow's own allocator,
+    so each stage also records the worker's resident size when it ends.
+    """
+
+    def __init__(self):
+        self.enabled = app.config['MEMORY_PROFILING']
+        self.stages = {}
+        self._baseline = 0
+        if self.enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self.stages[name] = {
+                'peak_bytes': max(0, peak - self._baseline),
+                'retained_bytes': max(0, current - self._baseline),
+                'rss_bytes': current_rss_bytes()
+            }
+
+    def report(self):
+        """Per-stage peaks and the request peak, or None when profiling is off"""
+        if not self.enabled:
+            return None
+        peak = max((stage['peak_bytes'] for stage in self.stages.values()), default=0)
+        budget = app.config['REQUEST_MEMORY_BUDGET_BYTES']
+        if peak > budget:
+            increment_metric('memory_budget_exceeded')
+            logger.warning(f"⚠️ Request peak {peak / 1e6:.1f} MB over budget {budget / 1e6:.1f} MB: {self.stages}")
+        return {'peak_bytes': peak, 'budget_bytes': budget, 'stages': dict(self.stages)}
+
 def create_response(status='success', message=None, data=None, error=None):
     """Create standardized API response"""
     response = {
@@ -554,44 +470,424 @@ def create_response(status='success', message=None, data=None, error=None):
 #         logger.warning("⚠️ pytesseract not installed")
 #         return False
 
+def resolve_tesseract_path():
+    """Return the first working Tesseract executable from TESSERACT_CANDIDATE_PATHS"""
+    import shutil
+
+    for path in TESSERACT_CANDIDATE_PATHS:
+        if not path:
+            continue
+        if os.path.isabs(path):
+            if os.path.exists(path):
+                return path
+            logger.debug(f"Path not found: {path}")
+        else:
+            found = shutil.which(path)
+            if found:
+                return found
+    return None
+
+def parse_tesseract_config(config):
+    """Split a pytesseract config string into (oem, psm, variables, tessdata_dir)"""
+    import shlex
+
+    oem, psm, variables, tessdata_dir = 3, 3, {}, None
+    tokens = shlex.split(config or '')
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == '--oem' and i + 1 < len(tokens):
+            oem = int(tokens[i + 1])
+            i += 1
+        elif token == '--psm' and i + 1 < len(tokens):
+            psm = int(tokens[i + 1])
+            i += 1
+        elif token == '--tessdata-dir' and i + 1 < len(tokens):
+            tessdata_dir = tokens[i + 1]
+            i += 1
+        elif token == '-c' and i + 1 < len(tokens) and '=' in tokens[i + 1]:
+            key, value = tokens[i + 1].split('=', 1)
+            variables[key] = value
+            i += 1
+        i += 1
+    return oem, psm, variables, tessdata_dir
+
+TESSERACT_TSV_INT_COLUMNS = (
+    'level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+    'left', 'top', 'width', 'height'
+)
+
+def encode_for_tesseract(image):
+    """
+    Encode an image as uncompressed PNM for Tesseract's stdin: PBM when the
+    image is already binarized (one bit per pixel), PGM for greyscale and
+    PPM for everything else. Leptonica reads these without decompression.
+    """
+    if isinstance(image, np.ndarray):
+        image = Image.fromarray(image)
+
+    if image.mode == 'L':
+        histogram = image.histogram()
+        if not any(histogram[1:255]):
+            image = image.convert('1', dither=Image.NONE)
+    elif image.mode not in ('1', 'RGB'):
+        image = image.convert('RGB')
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PPM')
+    return buffer.getvalue()
+
+def parse_tesseract_tsv(output):
+    """Parse Tesseract TSV output into pytesseract's Output.DICT layout"""
+    rows = output.splitlines()
+    if not rows:
+        return {}
+    columns = rows[0].split('\t')
+    data = {name: [] for name in columns}
+    for row in rows[1:]:
+        values = row.split('\t')
+        # The text column is empty (and sometimes missing) on non-word rows
+        values += [''] * (len(columns) - len(values))
+        for name, value in zip(columns, values):
+            if name in TESSERACT_TSV_INT_COLUMNS:
+                value = int(value)
+            elif name == 'conf':
+                value = float(value)
+            data[name].append(value)
+    return data
+
+class TesseractCLIBackend:
+    """
+    Runs every OCR call through the tesseract executable, streaming the
+    image through stdin and reading results from stdout (no temp files).
+    Each image is encoded once and the bytes are reused for every config
+    run against it while the image object is alive.
+    """
+
+    name = 'cli'
+
+    def __init__(self, lang='eng'):
+        self.lang = lang
+        self._encoded = {}
+        # Reentrant: a finalizer can run (garbage collection) in a thread that holds it
+        self._encoded_lock = threading.RLock()
+
+    def _encode(self, image):
+        import weakref
+
+        if isinstance(image, np.ndarray):
+            return encode_for_tesseract(image)  # Arrays can't be weak-referenced, so no reuse
+
+        key = id(image)
+        with self._encoded_lock:
+            data = self._encoded.get(key)
+        if data is not None:
+            return data
+
+        data = encode_for_tesseract(image)
+        increment_metric('ocr_images_encoded')
+        with self._encoded_lock:
+            stored = self._encoded.setdefault(key, data)
+        if stored is data:
+            # Only the thread that stored the bytes drops them with the image, before its id can be reused
+            weakref.finalize(image, self._forget, key)
+        return stored
+
+    def _forget(self, key):
+        with self._encoded_lock:
+            self._encoded.pop(key, None)
+
+    def _run(self, image, config, lang, timeout):
+        import shlex
+        import subprocess
+
+        command = [pytesseract.pytesseract.tesseract_cmd, 'stdin', 'stdout']
+        if lang:
+            command += ['-l', lang]
+        command += shlex.split(config or '')
+
+        try:
+            result = subprocess.run(
+                command, input=self._encode(image), capture_output=True,
+                timeout=timeout or None
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError('Tesseract process timeout')
+        except FileNotFoundError:
+            raise pytesseract.TesseractNotFoundError()
+
+        if result.returncode != 0:
+            message = result.stderr.decode('utf-8', errors='replace').strip()
+            raise pytesseract.TesseractError(result.returncode, message)
+        return result.stdout.decode('utf-8', errors='replace')
+
+    def image_to_string(self, image, config='', lang=None, timeout=0):
+        return self._run(image, config, lang or self.lang, timeout)
+
+    def image_to_data(self, image, config='', lang=None, timeout=0):
+        output = self._run(image, f'-c tessedit_create_tsv=1 {config}', lang or self.lang, timeout)
+        return parse_tesseract_tsv(output)
+
+    def osd(self, image, timeout=0):
+        output = self._run(image, '--psm 0', 'osd', timeout)
+        data = dict(
+            line.split(':', 1) for line in output.splitlines() if ':' in line
+        )
+        return {'rotate': int(data['Rotate']), 'confidence': float(data['Orientation confidence'])}
+
+    def close(self):
+        with self._encoded_lock:
+            self._encoded.clear()
+
+class TesseractAPIBackend:
+    """
+    Keeps a pool of initialised tesserocr handles per worker.
+    Handles are keyed by (lang, oem, tessdata dir) because all three are
+    fixed at Init time; the page segmentation mode and -c variables are
+    applied per call.
+    """
+
+    name = 'api'
+
+    def __init__(self, lang='eng', pool_size=2, tessdata_path=None):
+        import tesserocr  # Optional dependency, raises ImportError when missing
+
+        self._tesserocr = tesserocr
+        self._lock = threading.Lock()
+        self._pools = {}
+        self._created = {}
+        self.lang = lang
+        self.pool_size = max(1, pool_size)
+        self.tessdata_path = tessdata_path
+
+        # Fail fast at startup rather than on the first request
+        key = (lang, 1, None)
+        self._pools[key] = queue.LifoQueue()
+        self._pools[key].put(self._create_handle(*key))
+        self._created[key] = 1
+
+    def _create_handle(self, lang, oem, tessdata_dir=None):
+        kwargs = {'lang': lang, 'oem': oem}
+        if tessdata_dir or self.tessdata_path:
+            kwargs['path'] = tessdata_dir or self.tessdata_path
+        return self._tesserocr.PyTessBaseAPI(**kwargs)
+
+    def _acquire(self, lang, oem, tessdata_dir=None):
+        key = (lang, oem, tessdata_dir)
+        with self._lock:
+            pool = self._pools.setdefault(key, queue.LifoQueue())
+            if pool.empty() and self._created.get(key, 0) < self.pool_size:
+                self._created[key] = self._created.get(key, 0) + 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return key, self._create_handle(lang, oem, tessdata_dir)
+            except Exception:
+                with self._lock:
+                    self._created[key] -= 1
+                raise
+        return key, pool.get()
+
+    def _release(self, key, api):
+        self._pools[key].put(api)
+
+    def _run(self, image, config, lang, read):
+        oem, psm, variables, tessdata_dir = parse_tesseract_config(config)
+        key, api = self._acquire(lang or self.lang, oem, tessdata_dir)
+        previous = {name: api.GetVariableAsString(name) for name in variables}
+        try:
+            api.SetPageSegMode(psm)
+            for name, value in variables.items():
+                api.SetVariable(name, value)
+            api.SetImage(image)
+            return read(api)
+        finally:
+            # Clear() drops the image and results but keeps the loaded model;
+            # -c variables are restored so the next caller gets a clean handle
+            api.Clear()
+            for name, value in previous.items():
+                if value is not None:
+                    api.SetVariable(name, value)
+            self._release(key, api)
+
+    def _read_words(self, api):
+        """Collect word-level results in pytesseract's image_to_data layout"""
+        RIL = self._tesserocr.RIL
+        data = {name: [] for name in (
+            'level', 'block_num', 'par_num', 'line_num', 'word_num',
+            'left', 'top', 'width', 'height', 'conf', 'text'
+        )}
+
+        api.Recognize()
+        iterator = api.GetIterator()
+        if iterator is None:
+            return data
+
+        block_num = par_num = line_num = word_num = 0
+        for item in self._tesserocr.iterate_level(iterator, RIL.WORD):
+            if item.IsAtBeginningOf(RIL.BLOCK):
+                block_num += 1
+                par_num = 0
+            if item.IsAtBeginningOf(RIL.PARA):
+                par_num += 1
+                line_num = 0
+            if item.IsAtBeginningOf(RIL.TEXTLINE):
+                line_num += 1
+                word_num = 0
+            word_num += 1
+
+            box = item.BoundingBox(RIL.WORD)
+            if box is None:
+                continue
+            left, top, right, bottom = box
+            for name, value in (
+                ('level', 5), ('block_num', block_num), ('par_num', par_num),
+                ('line_num', line_num), ('word_num', word_num),
+                ('left', left), ('top', top), ('width', right - left), ('height', bottom - top),
+                ('conf', item.Confidence(RIL.WORD)), ('text', item.GetUTF8Text(RIL.WORD) or '')
+            ):
+                data[name].append(value)
+        return data
+
+    def image_to_string(self, image, config='', lang=None, timeout=0):
+        return self._run(image, config, lang, lambda api: api.GetUTF8Text())
+
+    def image_to_data(self, image, config='', lang=None, timeout=0):
+        return self._run(image, config, lang, self._read_words)
+
+    def osd(self, image, timeout=0):
+        def read(api):
+            result = api.DetectOrientationScript()
+            if not result:
+                raise RuntimeError('Orientation detection failed')
+            # orient_deg is the page's rotation; the correction is its complement
+            return {'rotate': (360 - result['orient_deg']) % 360, 'confidence': result['orient_conf']}
+
+        return self._run(image, '--oem 1 --psm 0', None, read)
+
+    def close(self):
+        with self._lock:
+            pools, self._pools, self._created = self._pools, {}, {}
+        for pool in pools.values():
+            while not pool.empty():
+                pool.get().End()
+
+class OCREngine:
+    """
+    Single entry point for Tesseract calls.
+    The binary, version and languages are resolved once in check_tesseract();
+    calls go to the preferred backend and fall back to the CLI backend on error.
+    """
+
+    def __init__(self, backend, fallback=None, capabilities=None):
+        self.backend = backend
+        self.fallback = fallback
+        self.capabilities = capabilities or {}
+
+    @property
+    def name(self):
+        return self.backend.name
+
+    def _call(self, method, image, **kwargs):
+        try:
+            return getattr(self.backend, method)(image, **kwargs)
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            logger.debug(f"{self.backend.name} backend failed ({e}), using {self.fallback.name} backend")
+            return getattr(self.fallback, method)(image, **kwargs)
+
+    def image_to_string(self, image, config='', lang=None, timeout=0):
+        return self._call('image_to_string', image, config=config, lang=lang, timeout=timeout)
+
+    def image_to_data(self, image, config='', lang=None, timeout=0):
+        """Word-level OCR output as a dict of lists (pytesseract Output.DICT layout)"""
+        return self._call('image_to_data', image, config=config, lang=lang, timeout=timeout)
+
+    def osd(self, image, timeout=0):
+        """Tesseract OSD: {'rotate': clockwise degrees that make the page upright, 'confidence'}"""
+        return self._call('osd', image, timeout=timeout)
+
+    def close(self):
+        self.backend.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+def create_ocr_engine(capabilities):
+    """Build the OCR engine for this worker from the resolved Tesseract capabilities"""
+    backend_choice = app.config['OCR_BACKEND']
+    lang = capabilities.get('languages', 'eng')  # 'ind+eng' when both are installed
+    cli_backend = TesseractCLIBackend(lang=lang)
+
+    if backend_choice in ('auto', 'api'):
+        try:
+            api_backend = TesseractAPIBackend(
+                lang=lang,
+                pool_size=app.config['OCR_POOL_SIZE'],
+                tessdata_path=os.environ.get('TESSDATA_PREFIX')
+            )
+            logger.info(f"✅ OCR engine: in-process Tesseract API (pool size {api_backend.pool_size})")
+            return OCREngine(api_backend, fallback=cli_backend, capabilities=capabilities)
+        except ImportError:
+            log = logger.warning if backend_choice == 'api' else logger.info
+            log("tesserocr not installed, using Tesseract CLI backend")
+        except Exception as e:
+            logger.warning(f"⚠️ In-process Tesseract API unavailable ({e}), using CLI backend")
+
+    logger.info("✅ OCR engine: Tesseract CLI")
+    return OCREngine(cli_backend, capabilities=capabilities)
+
 def check_tesseract():
     """
-    Checks Tesseract OCR availability in a Docker-friendly way.
-    It verifies the executable path and checks for required languages.
+    Resolve Tesseract once at startup: executable path, version and languages.
+    The pytesseract command is set here only, never per request, and the
+    worker's OCR engine is (re)built from the resolved capabilities.
     """
-    global ocr_status
-    TESSERACT_PATH = '/usr/bin/tesseract'
+    global ocr_status, ocr_engine
+
+    tesseract_path = resolve_tesseract_path()
+    if tesseract_path is None:
+        error_msg = "Tesseract not found in any of the expected locations."
+        logger.error(f"❌ {error_msg}")
+        ocr_status = {'available': False, 'error': error_msg}
+        return False
 
     try:
-        # 1. Set the path explicitly. This is the most crucial step.
-        pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
-        
-        # 2. Verify it's executable by getting the version.
-        # This is a lightweight check and doesn't need PIL.
+        pytesseract.pytesseract.tesseract_cmd = tesseract_path
+
+        # Verify it's executable by getting the version.
         version = pytesseract.get_tesseract_version()
 
-        # 3. Check for available languages (sangat penting).
+        # Check for available languages (sangat penting).
         languages = pytesseract.get_languages()
         lang_support = 'ind+eng' if 'ind' in languages and 'eng' in languages else 'eng'
-        
+
         ocr_status = {
             'available': True,
             'version': str(version).strip(),
-            'path': TESSERACT_PATH,
+            'path': tesseract_path,
             'languages': lang_support,
             'supported_languages': languages
         }
+
+        if ocr_engine is not None:
+            ocr_engine.close()
+        ocr_engine = create_ocr_engine(ocr_status)
+        ocr_status['backend'] = ocr_engine.name
+
         logger.info(f"✅ Tesseract v{ocr_status['version']} configured successfully.")
         logger.info(f"   Supported Languages: {ocr_status['supported_languages']}")
         return True
 
     except pytesseract.TesseractNotFoundError:
-        # This error is specific: the executable at the path was not found.
-        error_msg = f"Tesseract not found at the expected path '{TESSERACT_PATH}'."
+        # This error is specific: the executable at the path was not usable.
+        error_msg = f"Tesseract not found at the expected path '{tesseract_path}'."
         logger.error(f"❌ {error_msg}")
         ocr_status = {'available': False, 'error': error_msg}
         return False
-    
+
     except Exception as e:
         # Catches any other unexpected errors during the check.
         error_msg = f"An unexpected error occurred while checking Tesseract: {e}"
@@ -599,9 +895,617 @@ def check_tesseract():
         ocr_status = {'available': False, 'error': error_msg}
         return False
 
+class OCRResultCache:
+    """
+    Content-addressed, size-bounded OCR result cache on disk.
+    Entries are JSON files named by a hash of the decoded pixels plus the
+    OCR version string, so every endpoint and every worker shares them.
+    Reads refresh the file mtime and eviction removes the oldest files
+    (LRU) once the directory grows past max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._puts_since_scan = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._bytes = self._scan()[1]
+
+    def _path(self, key):
+        return self.directory / f"{key}.json"
+
+    def _scan(self):
+        entries = []
+        for path in self.directory.glob('*.json'):
+            try:
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                continue  # Removed by another worker
+        return entries, sum(size for _, size, _ in entries)
+
+    def get(self, key):
+        import json
+
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError):
+            increment_metric('ocr_cache_misses')
+            return None
+        increment_metric('ocr_cache_hits')
+        return value
+
+    def put(self, key, value):
+        import json
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)  # Atomic: readers never see partial files
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ OCR cache write failed: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        increment_metric('ocr_cache_writes')
+
+        with self._lock:
+            self._bytes += size
+            self._puts_since_scan += 1
+            # Other workers write too, so re-scan periodically, not only when over budget
+            needs_eviction = self._bytes > self.max_bytes or self._puts_since_scan >= 100
+        if needs_eviction:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache is under 90% of max_bytes"""
+        with self._lock:
+            entries, total = self._scan()
+            target = self.max_bytes * 0.9
+            removed = 0
+            if total > self.max_bytes:
+                for _, size, path in sorted(entries):
+                    if total <= target:
+                        break
+                    try:
+                        path.unlink()
+                        total -= size
+                        removed += 1
+                    except OSError:
+                        continue
+            self._bytes = total
+            self._puts_since_scan = 0
+        if removed:
+            increment_metric('ocr_cache_evictions', removed)
+            logger.info(f"🧹 OCR cache: evicted {removed} entries")
+
+    def stats(self):
+        with self._lock:
+            size = self._bytes
+        return {
+            'directory': str(self.directory),
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'hits': pipeline_metrics.get('ocr_cache_hits', 0),
+            'misses': pipeline_metrics.get('ocr_cache_misses', 0)
+        }
+
+def ocr_cache_version(**options):
+    """Version string for cached OCR results: engine, languages, configs, lexicons and pipeline options"""
+    import hashlib
+    import json
+
+    signature = {
+        'pipeline': OCR_PIPELINE_VERSION,
+        'tesseract': ocr_status.get('version'),
+        'backend': ocr_engine.name if ocr_engine else None,
+        'configs': OCR_CONFIGS,
+        'text_regions': app.config['OCR_TEXT_REGIONS'],
+        'text_height': (app.config['OCR_TARGET_TEXT_HEIGHT'], app.config['OCR_TEXT_HEIGHT_RANGE']),
+        'tiles': (app.config['OCR_TILE_THRESHOLD_PIXELS'], app.config['OCR_TILE_SIZE'], app.config['OCR_TILE_OVERLAP']),
+        'deskew': app.config['OCR_DESKEW'],
+        'modes': OCR_MODES,
+        'tessdata_dirs': app.config['OCR_TESSDATA_DIRS'],
+        'lexicons': get_lexicons().version,
+        'options': options
+    }
+    return hashlib.sha1(json.dumps(signature, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+def ocr_cache_key(digest, **options):
+    """Cache key for an OCR result: content digest plus the OCR version"""
+    return f"{digest}-{ocr_cache_version(**options)}"
+
+def get_ocr_cache():
+    """Return this worker's OCR result cache, or None when caching is disabled"""
+    global ocr_cache
+
+    if ocr_cache is None and app.config['OCR_CACHE_ENABLED']:
+        try:
+            ocr_cache = OCRResultCache(app.config['OCR_CACHE_DIR'], app.config['OCR_CACHE_MAX_BYTES'])
+        except OSError as e:
+            logger.warning(f"⚠️ OCR cache unavailable: {e}")
+            app.config['OCR_CACHE_ENABLED'] = False
+    return ocr_cache
+
+# Long side of the grayscale preview used to estimate text height
+TEXT_HEIGHT_SAMPLE_SIZE = 1600
+
+def estimate_text_height(gray):
+    """
+    Dominant glyph height in pixels of a grayscale array: the median height
+    of glyph-shaped connected components of the Otsu-binarised image (text
+    taken as the minority colour), or None when too few are found.
+    """
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if cv2.countNonZero(binary) > binary.size / 2:
+        binary = cv2.bitwise_not(binary)
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+
+    widths = stats[1:, cv2.CC_STAT_WIDTH]
+    heights = stats[1:, cv2.CC_STAT_HEIGHT]
+    fill = stats[1:, cv2.CC_STAT_AREA] / np.maximum(widths * heights, 1)
+    glyphs = (heights >= 4) & (heights <= gray.shape[0] / 4) & (widths <= heights * 3) & (fill > 0.1) & (fill < 0.95)
+    if np.count_nonzero(glyphs) < 20:
+        return None
+    return float(np.median(heights[glyphs]))
+
+def resolution_scale(text_height, size):
+    """
+    Scale factor that brings text_height into OCR_TEXT_HEIGHT_RANGE (1.0 when
+    it already is). Without an estimate, narrow images are upscaled to 1200px
+    as before. Upscaling never pushes an image past the tiling threshold.
+    """
+    width, height = size
+    low, high = app.config['OCR_TEXT_HEIGHT_RANGE']
+    if text_height is None:
+        scale = 1200 / width if width < 1200 else 1.0
+    elif low <= text_height <= high:
+        return 1.0
+    else:
+        scale = min(max(app.config['OCR_TARGET_TEXT_HEIGHT'] / text_height, 0.125), 3.0)
+
+    if scale > 1:
+        pixel_limit = (app.config['OCR_TILE_THRESHOLD_PIXELS'] / float(width * height)) ** 0.5
+        scale = max(1.0, min(scale, pixel_limit))
+    return scale
+
+def rescale_image(image, scale):
+    """Resize a loaded image by scale; no-op when within 2%"""
+    if abs(scale - 1) < 0.02:
+        return image
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    if scale < 1:
+        return image.resize(size, Image.BOX)  # Area average: fast and keeps thin strokes
+    return image.resize(size, Image.BICUBIC)
+
+def make_thumbnail(image, max_size, resample=Image.BILINEAR):
+    """Downscaled copy with the long side at most max_size, without a full-size intermediate copy"""
+    scale = max_size / max(image.size)
+    if scale >= 1:
+        return image.copy()
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    return image.resize(size, resample, reducing_gap=2.0 if resample in (Image.BILINEAR, Image.BICUBIC) else None)
+
+def image_content_digest(image):
+    """SHA-256 of the decoded pixels (mode, size and bytes)"""
+    import hashlib
+
+    digest = hashlib.sha256(f"{image.mode}:{image.size}".encode())
+    # Row strips of ~4MB hash to the same digest as tobytes() without copying the whole bitmap
+    rows = max(1, (4 << 20) // max(1, image.width * len(image.getbands())))
+    for top in range(0, image.height, rows):
+        digest.update(image.crop((0, top, image.width, min(image.height, top + rows))).tobytes())
+    return digest.hexdigest()
+
+def compute_dhash(image, hash_size=8):
+    """64-bit difference hash: robust to recompression, rescaling and small edits"""
+    if image.mode not in ('L', 'RGB'):
+        image = image.convert('RGB')
+    small = np.asarray(image.resize((hash_size + 1, hash_size), Image.BILINEAR).convert('L'), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int(''.join('1' if bit else '0' for bit in bits), 2)
+
+def fingerprint_image(image):
+    """Exact digest plus perceptual hash, computed once when an upload is decoded"""
+    return {'digest': image_content_digest(image), 'dhash': compute_dhash(image)}
+
+class ImageRejectedError(ValueError):
+    """An upload refused before decoding; status_code is the HTTP status to answer with"""
+
+    def __init__(self, message, status_code=413):
+        super().__init__(message)
+        self.status_code = status_code
+
+def open_image_header(data):
+    """
+    Open an upload reading only its header (format, dimensions, frame
+    count) and enforce the pixel budget before any pixel is decoded.
+    Returns (lazy PIL image, header) where header['budget_scale'] is the
+    scale a JPEG over IMAGE_PIXEL_BUDGET must be draft-decoded at (else 1.0).
+    Raises ImageRejectedError for unreadable images, images over
+    IMAGE_REJECT_PIXELS, and non-JPEG images over the budget, which cannot
+    be reduced without a full decode.
+    """
+    from PIL import UnidentifiedImageError
+
+    try:
+        image = Image.open(io.BytesIO(data))
+    except Image.DecompressionBombError as e:
+        increment_metric('images_rejected')
+        raise ImageRejectedError(f"Image rejected: {e}")
+    except (UnidentifiedImageError, OSError) as e:
+        raise ImageRejectedError(f"Unreadable or unsupported image: {e}", status_code=400)
+
+    width, height = image.size
+    pixels = width * height
+    header = {
+        'format': image.format,
+        'size': [width, height],
+        'frames': getattr(image, 'n_frames', 1),
+        'budget_scale': 1.0
+    }
+
+    budget = app.config['IMAGE_PIXEL_BUDGET']
+    if pixels > app.config['IMAGE_REJECT_PIXELS'] or (pixels > budget and image.format != 'JPEG'):
+        increment_metric('images_rejected')
+        logger.warning(f"⛔ Rejected {image.format} upload of {width}x{height} from its header")
+        raise ImageRejectedError(
+            f"Image too large: {width}x{height} ({pixels / 1e6:.0f} MP) exceeds the "
+            f"{budget / 1e6:.0f} MP limit. Please upload a smaller image."
+        )
+    if pixels > budget:
+        header['budget_scale'] = (budget / float(pixels)) ** 0.5
+        increment_metric('images_downscaled')
+        logger.info(f"📉 {width}x{height} JPEG over the pixel budget, decoding at {header['budget_scale']:.2f}x")
+    return image, header
+
+class DecodedImage:
+    """
+    The one decoded image of a request. Its RGB and grayscale versions, the
+    grayscale array, thumbnails and fingerprint are derived at most once, on
+    first use, and shared by every stage instead of being re-converted.
+    memory holds the request's per-stage MemoryProfile.
+    """
+
+    def __init__(self, image, memory=None, resolution=None):
+        self.image = image
+        self.memory = memory or MemoryProfile()
+        self.resolution = resolution
+        self._derived = {}
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decode an upload that passed open_image_header (which raises
+        ImageRejectedError otherwise), normalised so its dominant text
+        height lands in OCR_TEXT_HEIGHT_RANGE and its size within
+        IMAGE_PIXEL_BUDGET. Large JPEGs are first decoded at reduced scale
+        with draft() to estimate text height; when they need shrinking, that
+        sample (or a draft decode nearer the target) is used instead of a
+        full-size decode.
+        """
+        import math
+
+        memory = MemoryProfile()
+        image, header = open_image_header(data)  # Header only: no pixels decoded yet
+        with memory.stage('decode'):
+            original_size = image.size
+            sample_scale = TEXT_HEIGHT_SAMPLE_SIZE / float(max(original_size))
+
+            draft_decode = image.format == 'JPEG' and sample_scale < 0.5
+            if draft_decode:
+                preview = Image.open(io.BytesIO(data))
+                preview.draft(preview.mode, (round(original_size[0] * sample_scale), round(original_size[1] * sample_scale)))
+                preview.load()
+            else:
+                image.load()
+                preview = make_thumbnail(image, TEXT_HEIGHT_SAMPLE_SIZE, Image.BOX)
+
+            text_height = estimate_text_height(np.asarray(preview.convert('L')))
+            if text_height is not None:
+                text_height *= original_size[0] / float(preview.width)
+            scale = min(resolution_scale(text_height, original_size), header['budget_scale'])
+
+            if draft_decode:
+                target_width = original_size[0] * scale
+                if target_width <= preview.width:
+                    image = preview  # The reduced-scale sample is already big enough
+                else:
+                    # draft() only reduces by powers of two: decode at the nearest larger scale,
+                    # or, over the pixel budget, at the nearest one inside it
+                    draft_scale = scale
+                    if header['budget_scale'] < 1:
+                        draft_scale = 0.5 ** math.ceil(math.log2(1 / header['budget_scale']))
+                    image.draft(image.mode, (round(original_size[0] * draft_scale), round(original_size[1] * draft_scale)))
+            image.load()
+            factor = original_size[0] * scale / float(image.width)
+            if image.size != original_size:
+                # Drafted: only ever shrink what draft() decoded (a budget draft can land below the target)
+                factor = min(factor, 1.0)
+            image = rescale_image(image, factor)
+            scale = image.width / float(original_size[0])
+
+        resolution = {
+            'text_height': round(text_height, 1) if text_height is not None else None,
+            'scale': round(scale, 3),
+            'original_size': list(original_size),
+            'size': list(image.size),
+            'format': header['format'],
+            'frames': header['frames']
+        }
+        return cls(image, memory, resolution)
+
+    @classmethod
+    def from_image(cls, image):
+        """Wrap an already decoded PIL image, normalising its resolution like from_bytes"""
+        preview = make_thumbnail(image, TEXT_HEIGHT_SAMPLE_SIZE, Image.BOX).convert('L')
+        text_height = estimate_text_height(np.asarray(preview))
+        if text_height is not None:
+            text_height *= image.width / float(preview.width)
+        scale = resolution_scale(text_height, image.size)
+        resolution = {
+            'text_height': round(text_height, 1) if text_height is not None else None,
+            'scale': round(scale, 3),
+            'original_size': list(image.size)
+        }
+        image = rescale_image(image, scale)
+        resolution['size'] = list(image.size)
+        return cls(image, resolution=resolution)
+
+    def _get(self, key, build):
+        if key not in self._derived:
+            self._derived[key] = build()
+        return self._derived[key]
+
+    @property
+    def size(self):
+        return self.image.size
+
+    @property
+    def rgb(self):
+        """RGB or grayscale image: the decoded image itself unless it needs converting"""
+        return self._get('rgb', lambda: self.image if self.image.mode in ('RGB', 'L') else self.image.convert('RGB'))
+
+    @property
+    def gray(self):
+        return self._get('gray', lambda: self.rgb if self.rgb.mode == 'L' else self.rgb.convert('L'))
+
+    @property
+    def gray_array(self):
+        """Read-only uint8 view for OpenCV stages"""
+        def build():
+            array = np.asarray(self.gray)
+            array.flags.writeable = False
+            return array
+        return self._get('gray_array', build)
+
+    def thumbnail(self, max_size, resample=Image.BILINEAR):
+        return self._get(('thumbnail', max_size, resample), lambda: make_thumbnail(self.rgb, max_size, resample))
+
+    @property
+    def fingerprint(self):
+        return self._get('fingerprint', lambda: fingerprint_image(self.rgb))
+
+    def rotated(self, angle, **kwargs):
+        """A DecodedImage of the rotated page; the fingerprint stays that of the upload"""
+        rotated = DecodedImage(self.rgb.rotate(angle, **kwargs), self.memory, self.resolution)
+        if 'fingerprint' in self._derived:
+            rotated._derived['fingerprint'] = self._derived['fingerprint']
+        return rotated
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+class BKTree:
+    """BK-tree over integer hashes; finds all keys within a Hamming distance in sublinear time"""
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def add(self, key, value):
+        if self.root is None:
+            self.root = [key, [value], {}]
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            distance = hamming_distance(key, node[0])
+            if distance == 0:
+                if value not in node[1]:
+                    node[1].insert(0, value)  # Newest first for identical hashes
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, [value], {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, key, max_distance):
+        """Return (distance, value) pairs within max_distance, nearest first"""
+        results = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node_key, values, children = stack.pop()
+            distance = hamming_distance(key, node_key)
+            if distance <= max_distance:
+                results.extend((distance, value) for value in values)
+            # Triangle inequality: only subtrees in [d - max, d + max] can match
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return sorted(results, key=lambda result: result[0])
+
+class PosterIndex:
+    """
+    Perceptual-hash index of posters seen by any worker.
+    Entries map a dHash to the content digest whose OCR result and verdict
+    sit in the OCR cache. They are appended to a shared JSONL log; each
+    worker tails the log into its own BK-tree before every lookup.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.tree = BKTree()
+        self._offset = 0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        import json
+
+        with self._lock:
+            try:
+                with open(self.path, 'rb') as f:
+                    f.seek(self._offset)
+                    data = f.read()
+            except FileNotFoundError:
+                return
+            end = data.rfind(b'\n') + 1  # Only complete lines
+            for line in data[:end].splitlines():
+                try:
+                    entry = json.loads(line)
+                    self.tree.add(int(entry['dhash'], 16), entry['digest'])
+                except (ValueError, KeyError):
+                    continue
+            self._offset += end
+
+    def add(self, dhash, digest):
+        import json
+
+        if any(value == digest for distance, value in self.find(dhash, 0)):
+            return
+        line = json.dumps({'dhash': f"{dhash:016x}", 'digest': digest}) + '\n'
+        with self._lock:
+            # One small O_APPEND write per entry, so concurrent workers do not interleave
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        self.refresh()
+
+    def find(self, dhash, max_distance):
+        self.refresh()
+        return self.tree.search(dhash, max_distance)
+
+def get_poster_index():
+    """Return this worker's near-duplicate poster index, or None when disabled"""
+    global poster_index
+
+    if poster_index is None and app.config['NEAR_DUPLICATE_ENABLED'] and get_ocr_cache() is not None:
+        poster_index = PosterIndex(Path(app.config['OCR_CACHE_DIR']) / 'poster_index.jsonl')
+    return poster_index
+
+def find_near_duplicate(fingerprint, lookup):
+    """
+    Return (distance, value) for the nearest indexed poster for which
+    lookup(digest) returns a stored value, or None.
+    """
+    index = get_poster_index()
+    if index is None or fingerprint is None:
+        return None
+    for distance, digest in index.find(fingerprint['dhash'], app.config['NEAR_DUPLICATE_MAX_DISTANCE']):
+        value = lookup(digest)
+        if value:
+            increment_metric('near_duplicate_hits')
+            logger.info(f"♻️ Near-duplicate poster (distance {distance})")
+            return distance, value
+    return None
+
+def remember_poster(fingerprint):
+    """Add a poster to the near-duplicate index once its results are cached"""
+    index = get_poster_index()
+    if index is not None and fingerprint is not None:
+        index.add(fingerprint['dhash'], fingerprint['digest'])
+
+def verdict_cache_key(digest, filename=None, mode=None):
+    """Cache key for a stored /api/analyze verdict (the filename label, OCR mode and text classifier affect it)"""
+    label = analyze_file_label(filename)['label_detected']
+    text_classifier = models_status['text_classifier'].get('model_file')
+    return f"verdict-{digest}-{ocr_cache_version(label=label, mode=mode, text_classifier=text_classifier)}"
+
+class LinearTextModel:
+    """
+    A fitted TfidfVectorizer + binary LogisticRegression collapsed into one
+    term -> (weight, idf) table. With l2 normalisation the LR decision is
+        intercept + sum(tf * idf * coef) / sqrt(sum((tf * idf) ** 2))
+    so scoring a text is one pass over its terms (the vectorizer's own
+    analyzer, so tokens and n-grams match training) plus a sum over the
+    terms in the vocabulary; no sparse matrix is built.
+    """
+
+    def __init__(self, vectorizer, classifier, positive='genuine'):
+        classes = [str(label) for label in classifier.classes_]
+        if len(classes) != 2 or positive not in classes:
+            raise ValueError(f"expected a binary classifier with a '{positive}' class, got {classes}")
+        coefficients = classifier.coef_[0]
+        if len(coefficients) != len(vectorizer.vocabulary_):
+            raise ValueError(f"classifier has {len(coefficients)} coefficients for "
+                             f"{len(vectorizer.vocabulary_)} vectorizer terms")
+        if vectorizer.norm not in ('l2', 'l1', None):
+            raise ValueError(f"unsupported TF-IDF norm {vectorizer.norm!r}")
+
+        sign = 1.0 if classes[1] == positive else -1.0  # Scores are log-odds of the positive class
+        idf = vectorizer.idf_ if vectorizer.use_idf else [1.0] * len(coefficients)
+        self.weights = {
+            term: (sign * float(coefficients[column]) * float(idf[column]), float(idf[column]))
+            for term, column in vectorizer.vocabulary_.items()
+        }
+        self.intercept = sign * float(classifier.intercept_[0])
+        self.analyzer = vectorizer.build_analyzer()
+        self.norm = vectorizer.norm
+        self.binary = vectorizer.binary
+        self.sublinear_tf = vectorizer.sublinear_tf
+        self.positive = positive
+
+    def __len__(self):
+        return len(self.weights)
+
+    def contributions(self, text):
+        """{term: share of the decision score} for the text's vocabulary terms"""
+        import math
+
+        counts = {}
+        weights = self.weights
+        for term in self.analyzer(text):
+            if term in weights:
+                counts[term] = counts.get(term, 0) + 1
+        if not counts:
+            return {}
+
+        if self.binary:
+            counts = dict.fromkeys(counts, 1)
+        elif self.sublinear_tf:
+            counts = {term: 1 + math.log(count) for term, count in counts.items()}
+        if self.norm == 'l2':
+            norm = math.sqrt(sum((count * weights[term][1]) ** 2 for term, count in counts.items()))
+        elif self.norm == 'l1':
+            norm = sum(count * weights[term][1] for term, count in counts.items())
+        else:
+            norm = 1.0
+        return {term: count * weights[term][0] / norm for term, count in counts.items()}
+
+    def predict(self, text):
+        """(probability of the positive class, per-term contributions)"""
+        import math
+
+        contributions = self.contributions(text)
+        score = self.intercept + sum(contributions.values())
+        if score >= 0:
+            probability = 1 / (1 + math.exp(-score))
+        else:
+            probability = math.exp(score) / (1 + math.exp(score))
+        return probability, contributions
+
 def load_models():
     """Load all available models"""
-    global rf_model, feature_scaler, text_vectorizer, dl_model, models_status, models_loaded_count
+    global rf_model, feature_scaler, text_vectorizer, text_model, dl_model, models_status, models_loaded_count
 
     import joblib
     models_dir = Path('models')
@@ -681,6 +1585,35 @@ def load_models():
             except Exception as e:
                 logger.error(f"❌ Failed to load {vec_file}: {e}")
 
+    # Load Text Classifier (Logistic Regression over the retrained vectorizer's TF-IDF)
+    text_classifier_files = [
+        'text_classifier_retrained.pkl'  # Trained with tfidf_vectorizer_retrained.pkl
+    ]
+
+    for classifier_file in text_classifier_files:
+        classifier_path = models_dir / classifier_file
+        if text_vectorizer is not None and classifier_path.exists():
+            try:
+                text_model = LinearTextModel(text_vectorizer, joblib.load(classifier_path))
+                models_status['text_classifier'] = {
+                    'loaded': True,
+                    'status': '✅ Ready (Production)',
+                    'type': 'TF-IDF + Logistic Regression',
+                    'terms': len(text_model),
+                    'model_file': classifier_file
+                }
+                logger.info(f"✅ Text Classifier loaded from {classifier_file} ({len(text_model)} terms)")
+                break
+            except Exception as e:
+                logger.error(f"❌ Failed to load {classifier_file}: {e}")
+
+    if text_model is None:
+        models_status['text_classifier'] = {
+            'loaded': True,
+            'status': '⚠️ Keyword heuristic (model not available)',
+            'type': 'TF-IDF + Logistic Regression'
+        }
+
     # Try to load Deep Learning model (Production Model)
     dl_files = [
         'cnn_production.h5',  # New production model
@@ -766,6 +1699,8 @@ def initialize_app():
         # Load models and check components
         load_models()
         check_tesseract()
+        get_ocr_cache()
+        get_lexicons()
         
         logger.info("✅ Application initialized")
         logger.info(f"   Models: {models_loaded_count}/4 loaded")
@@ -895,6 +1830,7 @@ def models_info():
                 'available_models': models_with_ocr,
                 'summary': summary,
                 'ocr_status': ocr_status,
+                'lexicons': get_lexicons().info(),
                 'timestamp': datetime.now().isoformat(),
                 'note': f'{loaded_count}/{total_count} models successfully loaded and ready for production use.'
             }
@@ -914,6 +1850,8 @@ def test_ocr():
         test_data = ocr_status.copy()
         test_data['tesseract_available'] = ocr_status['available']
         test_data['test_result'] = 'OCR is working' if ocr_status['available'] else 'OCR not available'
+        with ocr_strategy_lock:
+            test_data['strategy_stats'] = {key: dict(value) for key, value in ocr_strategy_stats.items()}
 
         return jsonify(create_response(
             status='success',
@@ -925,11 +1863,34 @@ def test_ocr():
             error=f'OCR test failed: {str(e)}'
         )), 500
 
+@app.route('/api/metrics')
+def metrics():
+    """Pipeline counters and OCR cache statistics for this worker"""
+    try:
+        with pipeline_metrics_lock:
+            counters = dict(pipeline_metrics)
+        cache = get_ocr_cache()
+
+        return jsonify(create_response(
+            status='success',
+            data={
+                'worker_pid': os.getpid(),
+                'counters': counters,
+                'ocr_cache': cache.stats() if cache else {'enabled': False}
+            }
+        ))
+    except Exception as e:
+        return jsonify(create_response(
+            status='error',
+            error=f'Error getting metrics: {str(e)}'
+        )), 500
+
 @app.route('/api/extract-text', methods=['POST'])
 def extract_text():
     """Extract text from uploaded image using OCR"""
     try:
         image_data = None
+        data = None
 
         # Check if it's a file upload or JSON payload
         if request.content_type and 'application/json' in request.content_type:
@@ -974,6 +1935,15 @@ def extract_text():
             filename = file.filename
             image_data = file.read()
 
+        # OCR quality tier for this request
+        try:
+            ocr_mode = resolve_ocr_mode(get_requested_ocr_mode(data))['name']
+        except ValueError as e:
+            return jsonify(create_response(
+                status='error',
+                error=str(e)
+            )), 400
+
         # Check if OCR is available
         if not ocr_status['available']:
             return jsonify(create_response(
@@ -988,60 +1958,37 @@ def extract_text():
                 error='No image data received'
             )), 400
 
-        image = Image.open(io.BytesIO(image_data))
-
-        # Convert to RGB if needed
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-
-        # Convert to OpenCV format for preprocessing
-        cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
-        # Preprocess image for better OCR with error handling
+        # Decoded once; RGB/grayscale views are derived lazily and shared by every stage
         try:
-            processed_image = preprocess_for_ocr(cv_image)
-            processed_pil = Image.fromarray(cv2.cvtColor(processed_image, cv2.COLOR_BGR2RGB))
-        except Exception as e:
-            print(f"Warning: Image preprocessing failed: {e}")
-            # Use original image if preprocessing fails
-            processed_pil = image
+            decoded = DecodedImage.from_bytes(image_data)
+        except ImageRejectedError as e:
+            return jsonify(create_response(
+                status='error',
+                error=str(e)
+            )), e.status_code
 
         # Extract text with OCR (with timing and error handling)
         import time
         start_time = time.time()
 
+        ocr_details = None
         try:
             # Try multiple approaches for better results
             extracted_text = ""
 
             # Approach 1: Use enhanced OCR function
             try:
-                extracted_text = extract_text_with_ocr(image)
+                ocr_details = extract_text_with_ocr_detailed(decoded, mode=ocr_mode)
+                # Without a method the text is a status ("No text extracted", "OCR error: ...")
+                extracted_text = ocr_details['text'] if ocr_details['method'] else ""
                 logger.info(f"Enhanced OCR result: {len(extracted_text)} chars")
             except Exception as e1:
                 logger.warning(f"Enhanced OCR failed: {e1}")
 
                 # Approach 2: Simple fallback OCR
-                try:                    
-                    # Set Tesseract path
-                    tesseract_paths = [
-                        r'/usr/bin/tesseract',
-                        '/usr/bin/tesseract',
-                        r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-                        r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-                        'tesseract'
-                    ]
-
-                    for path in tesseract_paths:
-                        try:
-                            pytesseract.pytesseract.tesseract_cmd = path
-                            pytesseract.get_tesseract_version()
-                            break
-                        except:
-                            continue
-
+                try:
                     # Simple OCR extraction
-                    extracted_text = pytesseract.image_to_string(image, config=r'--oem 1 --psm 6')
+                    extracted_text = ocr_engine.image_to_string(decoded.rgb, config=r'--oem 1 --psm 6')
                     extracted_text = clean_extracted_text(extracted_text)
                     logger.info(f"Simple OCR result: {len(extracted_text)} chars")
 
@@ -1066,6 +2013,7 @@ def extract_text():
                     'processing_time': processing_time,
                     'error_type': 'no_text_extracted',
                     'extracted_chars': len(extracted_text.strip()) if extracted_text else 0,
+                    'text_check': ocr_details.get('text_check') if ocr_details else None,
                     'suggestions': [
                         'Upload a higher resolution image (minimum 800x600)',
                         'Ensure good lighting and high contrast',
@@ -1114,8 +2062,7 @@ def extract_text():
             quality_indicators.append("Very few words - consider external OCR")
 
         # Job-related keywords
-        job_keywords = ['job', 'position', 'salary', 'company', 'apply', 'work', 'career', 'employment', 'hiring']
-        keyword_count = sum(1 for keyword in job_keywords if keyword in extracted_text.lower())
+        keyword_count = get_lexicons().features['extraction_job_terms'].count(extracted_text.lower())
 
         if keyword_count >= 3:
             confidence += 20
@@ -1188,7 +2135,10 @@ def extract_text():
                 'quality_indicators': quality_indicators,
                 'quality_recommendation': quality_recommendation,
                 'needs_external_ocr': confidence < 70 or char_count < 50 or word_count < 10,
-                'label_analysis': label_analysis
+                'label_analysis': label_analysis,
+                'ocr_mode': ocr_mode,
+                'ocr_details': ocr_details,
+                'lexicon_version': get_lexicons().version
             }
         ))
 
@@ -1228,7 +2178,8 @@ def analyze_text():
                     'legitimate_count': len(text_analysis.get('indonesian_analysis', {}).get('found_keywords', {}).get('legitimate', [])),
                     'suspicious_count': len(text_analysis.get('indonesian_analysis', {}).get('found_keywords', {}).get('suspicious', [])),
                     'analysis': text_analysis.get('indonesian_analysis', {}).get('analysis', 'N/A')
-                }
+                },
+                'lexicon_version': get_lexicons().version
             }
         ))
     except Exception as e:
@@ -1280,6 +2231,16 @@ def analyze_fake_genuine():
 
         extracted_text = data.get('text', '')
         image_data = data.get('image', '')
+        ocr_details = None
+
+        # OCR quality tier, used only when the text has to be extracted
+        try:
+            ocr_mode = resolve_ocr_mode(get_requested_ocr_mode(data))['name']
+        except ValueError as e:
+            return jsonify(create_response(
+                status='error',
+                error=str(e)
+            )), 400
 
         # If no text provided but image is available, extract text from image
         if not extracted_text and image_data:
@@ -1295,12 +2256,18 @@ def analyze_fake_genuine():
 
                 # Decode base64 image
                 image_bytes = base64.b64decode(image_data)
-                image = Image.open(io.BytesIO(image_bytes))
+                decoded = DecodedImage.from_bytes(image_bytes)
 
                 # Extract text using OCR
-                extracted_text = extract_text_with_ocr(image)
+                ocr_details = extract_text_with_ocr_detailed(decoded, mode=ocr_mode)
+                extracted_text = ocr_details['text']
                 print(f"🔍 ENDPOINT DEBUG - OCR extracted text: {extracted_text[:100]}...")
 
+            except ImageRejectedError as e:
+                return jsonify(create_response(
+                    status='error',
+                    error=str(e)
+                )), e.status_code
             except Exception as e:
                 print(f"❌ OCR extraction failed: {e}")
                 extracted_text = ""
@@ -1314,7 +2281,8 @@ def analyze_fake_genuine():
             )), 400
 
         # Perform detailed analysis with all models
-        analysis_results = perform_detailed_fake_analysis(extracted_text, image_data)
+        analysis_results = perform_detailed_fake_analysis(extracted_text, image_data, ocr_details=ocr_details)
+        analysis_results['ocr_mode'] = ocr_mode if ocr_details else None
 
         return jsonify(create_response(
             status='success',
@@ -1347,6 +2315,15 @@ def analyze_upload():
                 error='No file selected'
             )), 400
 
+        # OCR quality tier for this request
+        try:
+            ocr_mode = resolve_ocr_mode(get_requested_ocr_mode())['name']
+        except ValueError as e:
+            return jsonify(create_response(
+                status='error',
+                error=str(e)
+            )), 400
+
         # Read image data
         image_data = file.read()
         filename = file.filename
@@ -1358,13 +2335,41 @@ def analyze_upload():
         from PIL import Image
         import io
 
-        image = Image.open(io.BytesIO(image_data))
-        extracted_text = extract_text_with_ocr(image)
+        try:
+            decoded = DecodedImage.from_bytes(image_data)
+        except ImageRejectedError as e:
+            return jsonify(create_response(
+                status='error',
+                error=str(e)
+            )), e.status_code
+        fingerprint = decoded.fingerprint
+
+        # Same or near-duplicate poster analysed before: return its stored verdict
+        cache = get_ocr_cache()
+        if cache:
+            def stored_verdict(digest):
+                return cache.get(verdict_cache_key(digest, filename, ocr_mode))
+
+            stored, distance = stored_verdict(fingerprint['digest']), 0
+            if not stored:
+                near_duplicate = find_near_duplicate(fingerprint, stored_verdict)
+                if near_duplicate:
+                    distance, stored = near_duplicate
+            if stored:
+                stored.update({'filename': filename, 'near_duplicate': {'distance': distance}})
+                return jsonify(create_response(
+                    status='success',
+                    message='Complete analysis completed successfully',
+                    data=stored
+                ))
+
+        ocr_details = extract_text_with_ocr_detailed(decoded, mode=ocr_mode)
+        extracted_text = ocr_details['text']
 
         logger.info(f"📝 OCR extracted {len(extracted_text)} characters")
 
         # Step 2: Perform fake/genuine analysis
-        analysis_results = perform_detailed_fake_analysis(extracted_text, image_data, filename)
+        analysis_results = perform_detailed_fake_analysis(extracted_text, image_data, filename, ocr_details=ocr_details)
 
         # Step 3: Combine results
         final_result = {
@@ -1375,9 +2380,20 @@ def analyze_upload():
             'text_analysis': analysis_results['text_analysis'],
             'recommendations': analysis_results['recommendations'],
             'extracted_text': extracted_text,
-            'filename': filename
+            'filename': filename,
+            'ocr_mode': ocr_mode,
+            'ocr_details': ocr_details,
+            'lexicon_version': get_lexicons().version
         }
 
+        # Only verdicts on real OCR text are stored (a failed OCR is retried next time), and
+        # only posters OCR'd in their own right are indexed, so near-duplicate matches do not chain
+        ocr_succeeded = bool(ocr_details['method'] and extracted_text.strip())
+        if cache and ocr_succeeded and analysis_results['overall_prediction'] != 'error':
+            cache.put(verdict_cache_key(fingerprint['digest'], filename, ocr_mode), final_result)
+            if ocr_details['near_duplicate'] is None:
+                remember_poster(fingerprint)
+
         return jsonify(create_response(
             status='success',
             message='Complete analysis completed successfully',
@@ -1393,8 +2409,12 @@ def analyze_upload():
 
 
 
-def perform_detailed_fake_analysis(extracted_text, image_data, filename=None):
-    """Perform comprehensive fake/genuine analysis with detailed explanations"""
+def perform_detailed_fake_analysis(extracted_text, image_data, filename=None, ocr_details=None):
+    """
+    Perform comprehensive fake/genuine analysis with detailed explanations.
+    ocr_details is the structured result of extract_text_with_ocr_detailed,
+    when available, so the OCR analyzer can use real word confidences.
+    """
     try:
         # Initialize results
         analysis_results = {
@@ -1403,31 +2423,32 @@ def perform_detailed_fake_analysis(extracted_text, image_data, filename=None):
             'overall_reasoning': '',
             'models': {},
             'text_analysis': {},
-            'recommendations': []
+            'recommendations': [],
+            'lexicon_version': get_lexicons().version
         }
 
         # Text-based analysis
         print(f"🔍 ENDPOINT DEBUG - Received text: {extracted_text[:100]}...")
-        text_analysis = analyze_text_features(extracted_text)
-        analysis_results['text_analysis'] = text_analysis
+        features = extract_text_features(extracted_text)  # Once, shared by every model below
+        analysis_results['text_analysis'] = features.to_dict()
 
         # Model 1: Random Forest Analysis
-        rf_result = analyze_with_random_forest_detailed(extracted_text, text_analysis)
+        rf_result = analyze_with_random_forest_detailed(extracted_text, features)
         analysis_results['models']['random_forest'] = rf_result
         logger.info(f"🔍 Random Forest: {rf_result['prediction']} ({rf_result['confidence']}%)")
 
         # Model 2: Text Classifier Analysis (with filename for label analysis)
-        text_classifier_result = analyze_with_text_classifier_detailed(extracted_text, filename)
+        text_classifier_result = analyze_with_text_classifier_detailed(extracted_text, filename, features)
         analysis_results['models']['text_classifier'] = text_classifier_result
         logger.info(f"🔍 Text Classifier: {text_classifier_result['prediction']} ({text_classifier_result['confidence']}%)")
 
         # Model 3: CNN Analysis (simulated based on text features)
-        cnn_result = analyze_with_cnn_detailed(text_analysis)
+        cnn_result = analyze_with_cnn_detailed(features)
         analysis_results['models']['cnn'] = cnn_result
         logger.info(f"🔍 CNN: {cnn_result['prediction']} ({cnn_result['confidence']}%)")
 
         # Model 4: OCR Confidence Analysis
-        ocr_result = analyze_ocr_confidence_detailed(extracted_text, text_analysis)
+        ocr_result = analyze_ocr_confidence_detailed(extracted_text, features, ocr_details)
         analysis_results['models']['ocr_confidence'] = ocr_result
         logger.info(f"🔍 OCR Confidence: {ocr_result['prediction']} ({ocr_result['confidence']}%)")
 
@@ -1452,78 +2473,275 @@ def perform_detailed_fake_analysis(extracted_text, image_data, filename=None):
             'recommendations': ['Please try again with a clearer image']
         }
 
-def preprocess_for_ocr(image):
-    """Enhanced preprocessing for OCR with multiple fallback strategies"""
+# EXIF tags that only camera captures carry (Make, Model, ExposureTime pointer)
+CAMERA_EXIF_TAGS = (271, 272, 34665)
+
+def classify_image_type(decoded):
+    """
+    Cheap image-type classifier on a thumbnail of a DecodedImage: 'screenshot', 'scan' or 'photo'.
+    Screenshots have long runs of identical pixels (flat, rendered colour),
+    scans a strongly bimodal, nearly colourless histogram; everything else,
+    or anything carrying camera EXIF, is treated as a camera photo.
+    """
     try:
-        # Convert to grayscale
-        if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = image.copy()
+        exif = decoded.image.getexif()
+        if any(tag in exif for tag in CAMERA_EXIF_TAGS):
+            return 'photo'
+    except Exception:
+        pass
+
+    # NEAREST keeps rendered pixels intact (no interpolated edges)
+    thumb = decoded.thumbnail(512, Image.NEAREST).convert('RGB')
+    rgb = np.asarray(thumb)
+    gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+
+    flat_ratio = float(np.mean(gray[:, 1:] == gray[:, :-1]))
+    saturation = float(cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)[:, :, 1].mean())
+
+    # Otsu's between-class / total variance: 1.0 for a perfectly two-tone page
+    otsu_threshold, _ = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    total_variance = float(gray.var())
+    bimodality = 0.0
+    if total_variance > 0:
+        dark = gray[gray <= otsu_threshold]
+        light = gray[gray > otsu_threshold]
+        if dark.size and light.size:
+            weight = dark.size / gray.size
+            bimodality = weight * (1 - weight) * (float(light.mean()) - float(dark.mean())) ** 2 / total_variance
+
+    edge_density = float(np.mean(cv2.Canny(gray, 100, 200) > 0))
+
+    if flat_ratio >= 0.5:
+        image_type = 'screenshot'
+    elif bimodality >= 0.8 and saturation < 40 and edge_density < 0.15:
+        image_type = 'scan'
+    else:
+        image_type = 'photo'
 
-        # Store original for fallback
-        original_gray = gray.copy()
+    logger.debug(f"🖼️ Image type {image_type}: flat {flat_ratio:.2f}, bimodality {bimodality:.2f}, "
+                 f"saturation {saturation:.1f}, edges {edge_density:.3f}")
+    return image_type
 
-        # Upscaling for better OCR (minimum 1200px width for better results)
-        height, width = gray.shape
-        if width < 1200:
-            scale_factor = 1200 / width
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            gray = cv2.resize(gray, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
+TEXT_PRECHECK_SIZE = 1000  # The orientation estimate's thumbnail size, so one thumbnail serves both
+TEXT_PRECHECK_MIN_GLYPH_HEIGHT = 4  # Thumbnail pixels
 
-        # Multiple preprocessing strategies
-        processed_images = []
+def count_line_glyphs(boxes):
+    """
+    Most glyph boxes (left, top, width, height) on one line: heights
+    within 2x of each other, vertical centres within half a height, and
+    gaps between neighbours under one height.
+    """
+    best = 0
+    for _, top, _, height in boxes:
+        centre = top + height / 2.0
+        row = sorted(
+            (left, width) for left, other_top, width, other_height in boxes
+            if height / 2.0 <= other_height <= height * 2 and abs(other_top + other_height / 2.0 - centre) <= height / 2.0
+        )
+        run, end = 0, None
+        for left, width in row:
+            run = run + 1 if end is not None and left - end <= height else 1
+            end = left + width if run == 1 else max(end, left + width)
+            best = max(best, run)
+    return best
+
+def estimate_text_likelihood(decoded):
+    """
+    Cheap test, on a thumbnail of a DecodedImage, for whether it can hold
+    readable text. Returns {'likely', 'edge_density', 'glyphs', 'stroke_width'}.
+    Blank or smooth images fail on Canny edges: fewer than the outlines of
+    the smallest line of text counted below. Otherwise glyphs are
+    counted among the connected components of a local threshold (dark text,
+    then light text): glyph-sized and shaped, with thin strokes (estimated
+    from the mean distance to the background, as for a bar) and a stroke
+    width within 2x of the median. Textures and solid shapes rarely pass all three.
+    Text is likely with OCR_PRECHECK_MIN_GLYPHS glyphs, or with fewer lined
+    up as a word (a poster with a single headline).
+    """
+    gray = np.asarray(decoded.thumbnail(TEXT_PRECHECK_SIZE).convert('L'))
+    check = {'likely': False, 'edge_density': 0.0, 'glyphs': 0, 'stroke_width': None}
+
+    # Edge density depends on how much text there is, so the cut-off is absolute: the two
+    # sides of OCR_PRECHECK_MIN_LINE_GLYPHS glyphs of the smallest height
+    edges = int(np.count_nonzero(cv2.Canny(gray, 100, 200)))
+    check['edge_density'] = round(edges / float(gray.size), 4)
+    if edges < app.config['OCR_PRECHECK_MIN_LINE_GLYPHS'] * 2 * TEXT_PRECHECK_MIN_GLYPH_HEIGHT:
+        return check
+
+    for polarity in (gray, cv2.bitwise_not(gray)):
+        binary = cv2.adaptiveThreshold(polarity, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 25, 15)
+        count, labels, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        distance = cv2.distanceTransform(binary, cv2.DIST_L2, 3)
+
+        widths = stats[1:, cv2.CC_STAT_WIDTH]
+        heights = stats[1:, cv2.CC_STAT_HEIGHT]
+        areas = stats[1:, cv2.CC_STAT_AREA]
+        fill = areas / np.maximum(widths * heights, 1)
+        foreground = binary > 0
+        distance_sums = np.bincount(labels[foreground], weights=distance[foreground], minlength=count)[1:]
+        strokes = 4 * distance_sums / np.maximum(areas, 1) - 2
+
+        candidates = (
+            (heights >= TEXT_PRECHECK_MIN_GLYPH_HEIGHT) & (heights <= gray.shape[0] / 4) & (widths <= heights * 3)
+            & (fill > 0.1) & (fill < 0.95) & (strokes < heights * 0.4)
+        )
+        if not candidates.any():
+            continue
+        median_stroke = float(np.median(strokes[candidates]))
+        glyph_mask = candidates & (strokes >= median_stroke / 2) & (strokes <= median_stroke * 2)
+        glyphs = int(np.count_nonzero(glyph_mask))
+        if glyphs > check['glyphs']:
+            check['glyphs'] = glyphs
+            check['stroke_width'] = round(median_stroke, 1)
+        if glyphs >= app.config['OCR_PRECHECK_MIN_GLYPHS'] or (
+            glyphs >= app.config['OCR_PRECHECK_MIN_LINE_GLYPHS']
+            and count_line_glyphs(stats[1:, :4][glyph_mask].tolist()) >= app.config['OCR_PRECHECK_MIN_LINE_GLYPHS']
+        ):
+            check['likely'] = True
+            break  # Light text is only looked for when dark text is missing
+
+    return check
+
+def preprocess_for_ocr(image, image_type=None):
+    """
+    Run the one preprocessing chain suited to the image type and return a
+    grayscale PIL image for Tesseract:
+    - screenshot: grayscale, no thresholding
+    - scan: grayscale, median denoise, OTSU threshold
+    - photo: grayscale, CLAHE, adaptive threshold
+    No rescaling happens here: DecodedImage already normalised the
+    resolution by text height.
+    image is a DecodedImage (whose shared grayscale is reused) or a PIL image.
+    """
+    if not isinstance(image, DecodedImage):
+        image = DecodedImage(image)
+    image_type = image_type or classify_image_type(image)
+    gray = image.gray_array
 
-        # Strategy 1: Basic denoising + adaptive threshold
-        try:
-            denoised = cv2.medianBlur(gray, 3)
-            adaptive_thresh = cv2.adaptiveThreshold(
-                denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-            )
-            processed_images.append(('adaptive', adaptive_thresh))
-        except:
-            pass
+    try:
+        if image_type == 'screenshot':
+            return image.gray
 
-        # Strategy 2: OTSU thresholding (original method)
-        try:
+        if image_type == 'scan':
             denoised = cv2.medianBlur(gray, 3)
-            _, otsu_thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            processed_images.append(('otsu', otsu_thresh))
-        except:
-            pass
-
-        # Strategy 3: Contrast enhancement + threshold
-        try:
-            # CLAHE (Contrast Limited Adaptive Histogram Equalization)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+            _, processed = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        else:
+            # Uneven lighting: equalise locally, then threshold against the neighbourhood
+            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
             enhanced = clahe.apply(gray)
-            _, enhanced_thresh = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            processed_images.append(('enhanced', enhanced_thresh))
-        except:
-            pass
+            processed = cv2.adaptiveThreshold(
+                enhanced, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10
+            )
+        return Image.fromarray(processed)
 
-        # Strategy 4: Simple scaling without thresholding (for colored text)
-        try:
-            processed_images.append(('simple', gray))
-        except:
-            pass
+    except Exception as e:
+        logger.error(f"Preprocessing ({image_type}) failed: {e}")
+        return image.gray
 
-        # Return the first successful preprocessing, or original if all fail
-        if processed_images:
-            return processed_images[0][1]  # Return first successful result
-        else:
-            return original_gray
+# Word tokens for keyword matching; keywords and text are split the same way
+KEYWORD_TOKEN_RE = re.compile(r'[^\W_]+')
 
-    except Exception as e:
-        logger.error(f"All preprocessing strategies failed: {e}")
-        # Return original image as absolute fallback
-        if len(image.shape) == 3:
-            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        return image
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over word tokens for the keyword lexicons.
+    Keywords are deduplicated by their token sequence ('e-money' and
+    'e money' are one keyword) and remember every lexicon they belong to.
+    Matching whole tokens gives word boundaries for free: 'pt' does not
+    match inside 'laptop'. find() is one pass over the text's tokens, so
+    its cost is linear in the text whatever the lexicon size.
+    """
 
-def analyze_indonesian_keywords(text):
-    """Analyze Indonesian keywords for job posting authenticity"""
+    def __init__(self, lexicons):
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+        self.keywords = []     # keyword id -> keyword as first listed
+        self.lengths = []      # keyword id -> number of tokens
+        self.categories = []   # keyword id -> lexicon names, in lexicon order
+        ids = {}
+
+        for category, keywords in lexicons.items():
+            for keyword in keywords:
+                tokens = tuple(token.lower() for token in KEYWORD_TOKEN_RE.findall(keyword))
+                if not tokens:
+                    continue
+                if tokens not in ids:
+                    ids[tokens] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self.lengths.append(len(tokens))
+                    self.categories.append([])
+                    self._insert(tokens, ids[tokens])
+                if category not in self.categories[ids[tokens]]:
+                    self.categories[ids[tokens]].append(category)
+        self._link()
+
+    def _insert(self, tokens, keyword_id):
+        state = 0
+        for token in tokens:
+            if token not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.goto[state][token] = len(self.goto) - 1
+            state = self.goto[state][token]
+        self.outputs[state].append(keyword_id)
+
+    def _link(self):
+        """Breadth-first failure links; each state also emits its failure state's keywords"""
+        from collections import deque
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(token, 0)
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def find(self, text):
+        """Every keyword occurrence as (start, end, keyword id), character offsets into text"""
+        goto, fail, outputs, lengths = self.goto, self.fail, self.outputs, self.lengths
+        matches = []
+        starts = []
+        state = 0
+        for match in KEYWORD_TOKEN_RE.finditer(text):
+            token = match.group().lower()
+            starts.append(match.start())
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for keyword_id in outputs[state]:
+                matches.append((starts[-lengths[keyword_id]], match.end(), keyword_id))
+        return matches
+
+    def count(self, text):
+        """{lexicon name: {keyword: occurrences}}, keywords in order of first occurrence"""
+        counts = {}
+        for _, _, keyword_id in self.find(text):
+            keyword = self.keywords[keyword_id]
+            for category in self.categories[keyword_id]:
+                found = counts.setdefault(category, {})
+                found[keyword] = found.get(keyword, 0) + 1
+        return counts
+
+def get_keyword_automaton():
+    """The KeywordAutomaton over the current keywords.json lexicons"""
+    return get_lexicons().keyword_automaton
+
+def analyze_indonesian_keywords(text, word_count=None):
+    """
+    Analyze Indonesian keywords for job posting authenticity.
+    Keywords are matched as whole words in one pass (see KeywordAutomaton);
+    each distinct keyword counts once towards its lexicons' scores, and
+    keyword_counts holds how often each one occurs. word_count is
+    len(text.split()) when the caller already has it.
+    """
     if not text:
         return {
             'legitimate_score': 0,
@@ -1535,35 +2753,25 @@ def analyze_indonesian_keywords(text):
                 'suspicious': [],
                 'neutral': []
             },
+            'keyword_counts': {
+                'legitimate': {},
+                'suspicious': {},
+                'neutral': {}
+            },
             'analysis': 'No text to analyze'
         }
 
-    # Convert text to lowercase for analysis
-    text_lower = text.lower()
-    words = text_lower.split()
-
     # Count keyword matches
-    legitimate_matches = []
-    suspicious_matches = []
-    neutral_matches = []
-
-    # Check legitimate indicators
-    for keyword in INDONESIAN_KEYWORDS['legitimate_indicators']:
-        if keyword in text_lower:
-            legitimate_matches.append(keyword)
-
-    # Check suspicious indicators
-    for keyword in INDONESIAN_KEYWORDS['suspicious_indicators']:
-        if keyword in text_lower:
-            suspicious_matches.append(keyword)
-
-    # Check neutral keywords
-    for keyword in INDONESIAN_KEYWORDS['neutral_keywords']:
-        if keyword in text_lower:
-            neutral_matches.append(keyword)
+    counts = get_keyword_automaton().count(text)
+    legitimate_counts = counts.get('legitimate_indicators', {})
+    suspicious_counts = counts.get('suspicious_indicators', {})
+    neutral_counts = counts.get('neutral_keywords', {})
+    legitimate_matches = list(legitimate_counts)
+    suspicious_matches = list(suspicious_counts)
+    neutral_matches = list(neutral_counts)
 
     # Calculate scores
-    total_words = len(words)
+    total_words = word_count if word_count is not None else len(text.split())
     legitimate_score = (len(legitimate_matches) / max(total_words, 1)) * 100
     suspicious_score = (len(suspicious_matches) / max(total_words, 1)) * 100
     neutral_score = (len(neutral_matches) / max(total_words, 1)) * 100
@@ -1590,6 +2798,11 @@ def analyze_indonesian_keywords(text):
             'suspicious': suspicious_matches[:10],
             'neutral': neutral_matches[:10]
         },
+        'keyword_counts': {
+            'legitimate': legitimate_counts,
+            'suspicious': suspicious_counts,
+            'neutral': neutral_counts
+        },
         'analysis': analysis,
         'recommendation': get_keyword_recommendation(legitimate_score, suspicious_score)
     }
@@ -1659,238 +2872,293 @@ def analyze_file_label(filename=None):
             'reasoning': 'No clear label indicators in filename'
         }
 
-def detect_suspicious_salary_patterns(text):
-    """Detect suspicious salary patterns that indicate fake job postings"""
-    import re
+# Salary red flags, in reporting order: (name, pattern, groups holding the
+# amount in millions, description, risk level)
+SALARY_RED_FLAGS = (
+    # High salary amounts (10+ million rupiah per month)
+    ('high_amount',
+     r'(?:gaji|penghasilan|salary)\s*(?:per\s*bulan|bulanan|sebulan)?\s*(?:rp\.?|rupiah)?\s*(?P<high_amount_value>[1-9]\d+)\s*(?:juta|jt|million)',
+     ('high_amount_value',), 'Suspiciously high salary offer', 'high'),
+    # Salary ranges (very common in fake jobs)
+    ('salary_range',
+     r'(?:gaji|penghasilan|salary)\s*(?:rp\.?|rupiah)?\s*(?P<range_low>\d+(?:\.\d+)?)\s*(?:juta|jt)?\s*-\s*(?:rp\.?|rupiah)?\s*(?P<range_high>\d+(?:\.\d+)?)\s*(?:juta|jt|million)',
+     ('range_low', 'range_high'), 'Salary range offered (common in fake jobs)', 'medium'),
+    # Vague high amounts
+    ('up_to',
+     r'(?:gaji|penghasilan|salary)\s*(?:hingga|sampai|up\s*to)\s*(?:rp\.?|rupiah)?\s*(?P<up_to_value>\d+(?:\.\d+)?)\s*(?:juta|jt|million)',
+     ('up_to_value',), 'Vague high salary promise', 'high'),
+    # Specific suspicious phrases - expanded list
+    ('exaggerated_salary',
+     r'gaji\s*(?:besar|tinggi|fantastis|menggiurkan|jutaan|lumayan|menarik|wow|dahsyat|luar\s*biasa|menggoda)',
+     (), 'Exaggerated salary claims', 'high'),
+    # Additional suspicious salary phrases
+    ('exaggerated_income',
+     r'(?:penghasilan|income|pendapatan)\s*(?:besar|tinggi|fantastis|menggiurkan|jutaan|lumayan|menarik|wow|dahsyat)',
+     (), 'Exaggerated income promises', 'high'),
+    # Easy money promises with salary
+    ('easy_money',
+     r'(?:mudah|gampang|cepat)\s*(?:dapat|dapet|meraih)\s*(?:gaji|penghasilan|uang)\s*(?:besar|tinggi|jutaan)',
+     (), 'Easy money promises', 'high'),
+    # Specific amounts that are too good to be true (50+ million)
+    ('unrealistic_amount',
+     r'(?:rp\.?|rupiah)\s*(?P<unrealistic_amount_value>[5-9]\d|[1-9]\d{2})\s*(?:juta|jt|million)',
+     ('unrealistic_amount_value',), 'Unrealistically high salary amount', 'critical')
+)
+
+# Salary offers: "Rp 5.000.000", "5jt", "5,5 juta", "5-8 juta", "hingga 50 juta", "500rb/hari"
+SALARY_NUMBER = r'\d{1,3}(?:[.,]\d{3})+(?!\d)|\d+(?:[.,]\d+)?'
+SALARY_CURRENCY = r'(?:rp|idr)\.?\s*|rupiah\s*'
+SALARY_UNIT = r'(?:juta(?:an)?|jt|million|miliar|milyar|billion|ribu|rb|k)\b'
+SALARY_OFFER_RE = re.compile(
+    rf'(?P<up_to>(?:hingga|sampai|up\s*to|maks(?:imal)?|max)\.?\s*)?'
+    rf'(?P<low_currency>{SALARY_CURRENCY})?(?P<low>{SALARY_NUMBER})\s*(?P<low_unit>{SALARY_UNIT})?'
+    rf'(?:\s*(?:-|–|s/?d|sampai|hingga)\s*'
+    rf'(?P<high_currency>{SALARY_CURRENCY})?(?P<high>{SALARY_NUMBER})\s*(?P<high_unit>{SALARY_UNIT})?)?'
+    rf'(?:\s*(?:/|per|se)\s*(?P<period>jam|hari|minggu|bulan|bln|tahun|thn)\b)?'
+    # A currency or a unit somewhere, or it is just a number
+    r'(?(low_currency)|(?(low_unit)|(?(high_currency)|(?(high_unit)|(?!)))))'
+)
+
+# One scan for the words a red flag or an offer can start with, and for
+# whole numbers (an offer can start with one). At each word SALARY_RE tries
+# every red flag as its own lookahead, so they overlap the way separate
+# findall passes would.
+SALARY_TRIGGERS = (
+    'gaji', 'penghasilan', 'salary', 'income', 'pendapatan', 'mudah', 'gampang', 'cepat',
+    'rp', 'rupiah', 'idr', 'hingga', 'sampai', 'up', 'maks', 'max'
+)
+SALARY_TRIGGER_RE = re.compile('|'.join(map(re.escape, SALARY_TRIGGERS)) + r'|\d+(?:[.,]\d+)*')
+SALARY_RE = re.compile(''.join(rf'(?:(?=(?P<{name}>{pattern})))?' for name, pattern, *_ in SALARY_RED_FLAGS))
+SALARY_THOUSANDS_RE = re.compile(r'\d{1,3}(?:[.,]\d{3})+')
+
+SALARY_UNITS = {
+    'juta': 1e6, 'jutaan': 1e6, 'jt': 1e6, 'million': 1e6,
+    'miliar': 1e9, 'milyar': 1e9, 'billion': 1e9,
+    'ribu': 1e3, 'rb': 1e3, 'k': 1e3
+}
+# Period -> (name, periods per month)
+SALARY_PERIODS = {
+    'jam': ('hour', 176), 'hari': ('day', 22), 'minggu': ('week', 4),
+    'bulan': ('month', 1), 'bln': ('month', 1), 'tahun': ('year', 1 / 12), 'thn': ('year', 1 / 12)
+}
+SALARY_RISK_LEVELS = ('none', 'low', 'medium', 'high', 'critical')
 
+def parse_salary_amount(number, unit):
+    """Rupiah value of an amount: "5.000.000" (thousands separators), "5,5" + "juta", "500" + "rb"..."""
+    if SALARY_THOUSANDS_RE.fullmatch(number):
+        value = float(number.replace('.', '').replace(',', ''))
+    else:
+        value = float(number.replace(',', '.'))
+    return value * SALARY_UNITS.get(unit, 1)
+
+def parse_salary_offer(match):
+    """A typed salary offer from a SALARY_OFFER_RE match"""
+    low_unit, high_unit = match.group('low_unit'), match.group('high_unit')
+    high = match.group('high')
+    maximum = parse_salary_amount(high, high_unit) if high else None
+    minimum = parse_salary_amount(match.group('low'), low_unit or (high_unit if high else None))
+    if maximum is None:
+        maximum = minimum
+    if match.group('up_to'):
+        minimum = None  # "hingga 50 juta": an upper bound only
+
+    period, per_month = SALARY_PERIODS.get(match.group('period'), (None, 1))
+    monthly = maximum * per_month
+    if monthly >= 50e6:
+        risk_level = 'critical'
+    elif monthly >= 10e6:
+        risk_level = 'high'
+    elif minimum is not None and minimum != maximum:
+        risk_level = 'medium'
+    else:
+        risk_level = 'low'
+
+    return {
+        'text': match.group().strip(),
+        'min': minimum,
+        'max': maximum,
+        'period': period,
+        'monthly_max': round(monthly),
+        'risk_level': risk_level
+    }
+
+def detect_suspicious_salary_patterns(text):
+    """
+    Detect suspicious salary patterns that indicate fake job postings, and
+    parse the salary offers (Rupiah amounts and ranges, with their risk
+    level), in one SALARY_TRIGGER_RE scan.
+    amount and type come from the red flags: the largest amount (millions)
+    and its flag's risk level. risk_level covers the offers too.
+    """
     text_lower = text.lower()
+    first_matches = {}
+    offers = []
+    offer_end = 0
+    position = 0
+    while True:
+        trigger = SALARY_TRIGGER_RE.search(text_lower, position)
+        if trigger is None:
+            break
+        start = trigger.start()
+        if text_lower[start].isdigit():
+            position = trigger.end()
+        else:
+            position = start + 1  # A word can start inside another ("besarpendapatan")
+            match = SALARY_RE.match(text_lower, start)
+            if match.lastindex is not None:
+                for name, *_ in SALARY_RED_FLAGS:
+                    if name not in first_matches and match.group(name) is not None:
+                        first_matches[name] = match
+
+        if start >= offer_end:
+            offer = SALARY_OFFER_RE.match(text_lower, start)
+            if offer:
+                offers.append(parse_salary_offer(offer))
+                offer_end = offer.end()
+
     found_patterns = []
     suspicious_amount = 0
     salary_type = 'none'
-
-    # CRITICAL: Suspicious salary patterns - major red flags
-    salary_patterns = [
-        # High salary amounts (10+ million rupiah per month)
-        {
-            'pattern': r'(?:gaji|penghasilan|salary)\s*(?:per\s*bulan|bulanan|sebulan)?\s*(?:rp\.?|rupiah)?\s*([1-9]\d+)\s*(?:juta|jt|million)',
-            'description': 'Suspiciously high salary offer',
-            'risk_level': 'high'
-        },
-        # Salary ranges (very common in fake jobs)
-        {
-            'pattern': r'(?:gaji|penghasilan|salary)\s*(?:rp\.?|rupiah)?\s*(\d+(?:\.\d+)?)\s*(?:juta|jt)?\s*-\s*(?:rp\.?|rupiah)?\s*(\d+(?:\.\d+)?)\s*(?:juta|jt|million)',
-            'description': 'Salary range offered (common in fake jobs)',
-            'risk_level': 'medium'
-        },
-        # Vague high amounts
-        {
-            'pattern': r'(?:gaji|penghasilan|salary)\s*(?:hingga|sampai|up\s*to)\s*(?:rp\.?|rupiah)?\s*(\d+(?:\.\d+)?)\s*(?:juta|jt|million)',
-            'description': 'Vague high salary promise',
-            'risk_level': 'high'
-        },
-        # Specific suspicious phrases - expanded list
-        {
-            'pattern': r'gaji\s*(?:besar|tinggi|fantastis|menggiurkan|jutaan|lumayan|menarik|wow|dahsyat|luar\s*biasa|menggoda)',
-            'description': 'Exaggerated salary claims',
-            'risk_level': 'high'
-        },
-        # Additional suspicious salary phrases
-        {
-            'pattern': r'(?:penghasilan|income|pendapatan)\s*(?:besar|tinggi|fantastis|menggiurkan|jutaan|lumayan|menarik|wow|dahsyat)',
-            'description': 'Exaggerated income promises',
-            'risk_level': 'high'
-        },
-        # Easy money promises with salary
-        {
-            'pattern': r'(?:mudah|gampang|cepat)\s*(?:dapat|dapet|meraih)\s*(?:gaji|penghasilan|uang)\s*(?:besar|tinggi|jutaan)',
-            'description': 'Easy money promises',
-            'risk_level': 'high'
-        },
-        # Specific amounts that are too good to be true
-        {
-            'pattern': r'(?:rp\.?|rupiah)\s*([5-9]\d|[1-9]\d{2})\s*(?:juta|jt|million)',  # 50+ million
-            'description': 'Unrealistically high salary amount',
-            'risk_level': 'critical'
-        }
-    ]
-
-    for pattern_info in salary_patterns:
-        matches = re.findall(pattern_info['pattern'], text_lower)
-        if matches:
-            found_patterns.append(pattern_info['description'])
-
-            # Extract amount if possible
-            if matches and isinstance(matches[0], str) and matches[0].isdigit():
-                amount = float(matches[0])
-                if amount > suspicious_amount:
-                    suspicious_amount = amount
-                    salary_type = pattern_info['risk_level']
-            elif matches and isinstance(matches[0], tuple):
-                # Handle range patterns
-                amounts = [float(x) for x in matches[0] if x.isdigit()]
-                if amounts:
-                    max_amount = max(amounts)
-                    if max_amount > suspicious_amount:
-                        suspicious_amount = max_amount
-                        salary_type = pattern_info['risk_level']
+    risk_level = 'none'
+    for name, _, amount_groups, description, flag_risk_level in SALARY_RED_FLAGS:
+        if name not in first_matches:
+            continue
+        found_patterns.append(description)
+        risk_level = max(risk_level, flag_risk_level, key=SALARY_RISK_LEVELS.index)
+
+        # Extract amount if possible
+        amounts = [float(x) for x in (first_matches[name].group(group) for group in amount_groups) if x.isdigit()]
+        if amounts and max(amounts) > suspicious_amount:
+            suspicious_amount = max(amounts)
+            salary_type = flag_risk_level
+
+    for offer in offers:
+        risk_level = max(risk_level, offer['risk_level'], key=SALARY_RISK_LEVELS.index)
 
     return {
         'found': len(found_patterns) > 0,
         'patterns': found_patterns,
         'amount': suspicious_amount,
         'type': salary_type,
-        'count': len(found_patterns)
+        'count': len(found_patterns),
+        'offers': offers,
+        'risk_level': risk_level
     }
 
-def analyze_text_features(text):
-    """Extract features EXACTLY like training script for consistent prediction"""
-    import numpy as np
-
-    if not text or len(text.strip()) < 10:
-        return {
-            'length': 0,
-            'word_count': 0,
-            'sentence_count': 0,
-            'avg_word_length': 0,
-            'genuine_keywords': 0,
-            'fake_keywords': 0,
-            'keyword_ratio': 1,
-            'has_email': False,
-            'has_phone': False,
-            'has_address': False,
-            'has_company': False,
-            'has_whatsapp': False,
-            'has_money_promise': False,
-            'has_urgency': False,
-            'has_mlm_terms': False,
-            'has_no_experience': False,
-            'uppercase_ratio': 0,
-            'exclamation_count': 0,
-            'question_count': 0,
-            'number_count': 0,
-            'suspicious_patterns': [],
-            'quality_indicators': [],
-            'language_quality': 'poor',
-            'completeness_score': 0,
-            'indonesian_analysis': analyze_indonesian_keywords('')
-        }
-
-    # Enhanced keyword lists (SAME AS TRAINING)
-    GENUINE_KEYWORDS = [
-        'pengalaman', 'kualifikasi', 'syarat', 'tanggung jawab', 'tunjangan',
-        'gaji', 'wawancara', 'lamaran', 'kandidat', 'posisi', 'lowongan',
-        'perusahaan', 'karir', 'profesional', 'skill', 'kemampuan',
-        'pendidikan', 'lulusan', 'diploma', 'sarjana', 'sertifikat',
-        'training', 'pelatihan', 'development', 'benefit', 'asuransi'
-    ]
-
-    FAKE_KEYWORDS = [
-        # Urgency/pressure words
-        'mudah', 'cepat', 'instant', 'langsung', 'tanpa modal', 'gratis',
-        'buruan', 'terbatas', 'deadline', 'segera', 'jangan sampai', 'terlewat',
-        'kesempatan emas', 'limited time', 'sekarang juga', 'hari ini',
-
-        # MLM/Scam indicators
-        'kerja rumah', 'work from home', 'online', 'part time', 'freelance',
-        'sampingan', 'tambahan', 'passive income', 'join', 'member',
-        'downline', 'upline', 'bonus', 'komisi', 'reward', 'cashback',
-
-        # Money promises
-        'jutaan', 'milyar', 'unlimited', 'tak terbatas', 'penghasilan besar',
-        'kaya', 'sukses', 'investasi', 'trading', 'forex', 'crypto', 'bitcoin',
+def get_salary_analysis(text):
+    """detect_suspicious_salary_patterns(text), computed once per request for each text"""
+    if not has_request_context():
+        return detect_suspicious_salary_patterns(text)
+    if 'salary_analyses' not in g:
+        g.salary_analyses = {}
+    if text not in g.salary_analyses:
+        g.salary_analyses[text] = detect_suspicious_salary_patterns(text)
+    return g.salary_analyses[text]
+
+class FeatureVector:
+    """
+    Features of one text, extracted once per request by extract_text_features
+    and passed to every analyzer: the 20 Random Forest features
+    (RF_FEATURES, in training order), the salary red flags, the text
+    classifier's keyword counts, and the completeness and language quality
+    the CNN and OCR analyzers use. to_dict() is the text_analysis response.
+    """
 
-        # Suspicious contact methods
-        'whatsapp', 'wa', 'telegram', 'dm', 'chat', 'hubungi', 'kontak',
-        'no interview', 'tanpa wawancara', 'langsung kerja', 'tanpa pengalaman'
-    ]
+    RF_FEATURES = FEATURE_NAMES
+
+    __slots__ = RF_FEATURES + (
+        'salary', 'suspicious_patterns', 'quality_indicators', 'language_quality',
+        'completeness_score', 'essential_elements', 'professional_word_count', 'indonesian_analysis',
+        'classifier_genuine_count', 'classifier_fake_count', 'classifier_found_genuine',
+        'classifier_found_fake', 'has_contact_indicator', 'period_count'
+    )
+
+    def rf_values(self, names=None):
+        """A Random Forest input row: the model's feature names (default RF_FEATURES), flags as 0/1"""
+        return [float(getattr(self, name)) for name in (self.RF_FEATURES if names is None else names)]
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in self.RF_FEATURES}
+        data.update({
+            'suspicious_salary_detected': self.salary['found'],
+            'salary_amount': self.salary['amount'],
+            'salary_type': self.salary['type'],
+            'salary_offers': self.salary['offers'],
+            'salary_risk_level': self.salary['risk_level'],
+            'suspicious_patterns': self.suspicious_patterns,
+            'quality_indicators': self.quality_indicators,
+            'language_quality': self.language_quality,
+            'completeness_score': self.completeness_score,
+            'essential_elements': self.essential_elements,
+            'professional_word_count': self.professional_word_count,
+            'indonesian_analysis': self.indonesian_analysis
+        })
+        return data
 
+def extract_text_features(text, rf_features=None):
+    """
+    Extract every analyzer's features in one pass (see FeatureVector): the
+    text is lower-cased once, each keyword list and the salary patterns are
+    matched once. The RF features come from the training script's
+    TextFeaturizer (featurizer.py), or rf_features when already computed
+    for a batch.
+    """
+    text = text or ''
     text_lower = text.lower()
-
-    # Basic features (EXACT SAME AS TRAINING)
-    feature_dict = {
-        'length': len(text),
-        'word_count': len(text.split()),
-        'sentence_count': len([s for s in text.split('.') if s.strip()]),
-        'avg_word_length': np.mean([len(word) for word in text.split()]) if text.split() else 0,
-    }
-
-    # Keyword features
-    genuine_count = sum(1 for kw in GENUINE_KEYWORDS if kw in text_lower)
-    fake_count = sum(1 for kw in FAKE_KEYWORDS if kw in text_lower)
-
-    feature_dict.update({
-        'genuine_keywords': genuine_count,
-        'fake_keywords': fake_count,
-        'keyword_ratio': genuine_count / max(fake_count, 1),
-    })
-
-    # Structure features (ENHANCED)
-    feature_dict.update({
-        'has_email': '@' in text,
-        'has_phone': any(char.isdigit() for char in text),
-        'has_address': any(word in text_lower for word in ['jl', 'jalan', 'street', 'alamat']),
-        'has_company': any(word in text_lower for word in ['pt', 'cv', 'ltd', 'inc', 'corp']),
-
-        # Advanced fake indicators
-        'has_whatsapp': any(word in text_lower for word in ['whatsapp', 'wa', 'chat']),
-        'has_money_promise': any(word in text_lower for word in ['jutaan', 'milyar', 'kaya', 'sukses']),
-        'has_urgency': any(word in text_lower for word in ['buruan', 'segera', 'terbatas', 'deadline']),
-        'has_mlm_terms': any(word in text_lower for word in ['join', 'member', 'bonus', 'komisi']),
-        'has_no_experience': any(word in text_lower for word in ['tanpa pengalaman', 'no experience', 'fresh graduate']),
-
-        # Text quality indicators
-        'uppercase_ratio': sum(1 for c in text if c.isupper()) / max(len(text), 1),
-        'exclamation_count': text.count('!'),
-        'question_count': text.count('?'),
-        'number_count': sum(1 for c in text if c.isdigit()),
-    })
+    lexicons = get_lexicons()
+    keywords = lexicons.features
+    features = FeatureVector()
+
+    if rf_features is None:
+        rf_features = feature_dict(lexicons.featurizer.transform([text])[0])
+    for name, value in rf_features.items():
+        setattr(features, name, value)
+
+    # Salary red flags and the text classifier's own keyword lists (any text length)
+    features.salary = get_salary_analysis(text)
+    features.classifier_genuine_count = keywords['classifier_genuine'].count(text_lower)
+    features.classifier_fake_count = keywords['classifier_fake'].count(text_lower)
+    features.classifier_found_genuine = keywords['classifier_genuine'].found(text_lower, 20)
+    features.classifier_found_fake = keywords['classifier_fake'].found(text_lower, 20)
+    features.has_contact_indicator = keywords['classifier_contact'].any(text_lower)
+    features.period_count = text.count('.')
+
+    if len(text.strip()) < 10:  # RF features are empty too
+        features.suspicious_patterns = []
+        features.quality_indicators = []
+        features.language_quality = 'poor'
+        features.completeness_score = 0
+        features.essential_elements = dict.fromkeys(('company_name', 'job_title', 'requirements', 'contact_info'), False)
+        features.professional_word_count = 0
+        features.indonesian_analysis = analyze_indonesian_keywords('')
+        return features
 
     # Legacy suspicious patterns for backward compatibility
     suspicious_patterns = []
-    if fake_count > 3:
-        suspicious_patterns.append(f"High fake keyword count: {fake_count}")
-    if feature_dict['has_urgency']:
+    if features.fake_keywords > 3:
+        suspicious_patterns.append(f"High fake keyword count: {features.fake_keywords}")
+    if features.has_urgency:
         suspicious_patterns.append("Urgency tactics detected")
-    if feature_dict['has_money_promise']:
+    if features.has_money_promise:
         suspicious_patterns.append("Money promises detected")
 
-    # CRITICAL: Detect suspicious salary patterns - major red flag for fake jobs
-    salary_red_flags = detect_suspicious_salary_patterns(text)
-    if salary_red_flags['found']:
-        suspicious_patterns.extend(salary_red_flags['patterns'])
-        feature_dict['suspicious_salary_detected'] = True
-        feature_dict['salary_amount'] = salary_red_flags['amount']
-        feature_dict['salary_type'] = salary_red_flags['type']
-    else:
-        feature_dict['suspicious_salary_detected'] = False
-        feature_dict['salary_amount'] = 0
-        feature_dict['salary_type'] = 'none'
-
-    # Legacy variables for backward compatibility
-    text_clean = text.strip()
-    words = text_clean.split()
+    # CRITICAL: Suspicious salary patterns - major red flag for fake jobs
+    if features.salary['found']:
+        suspicious_patterns.extend(features.salary['patterns'])
 
     # Check for missing essential information (Indonesian + English) - FIXED VERSION
-    company_words = ['company', 'corporation', 'ltd', 'inc', 'pt', 'cv', 'perusahaan', 'firma']
-    job_words = ['position', 'role', 'job', 'vacancy', 'posisi', 'jabatan', 'lowongan', 'kerja']
-    req_words = ['requirement', 'qualification', 'experience', 'skill', 'syarat', 'kualifikasi', 'pengalaman', 'keahlian']
-    contact_words = ['email', 'phone', 'contact', 'apply', 'telepon', 'kontak', 'lamar', 'hubungi']
-
-    # Use explicit boolean conversion to ensure proper detection
     essential_elements = {
-        'company_name': bool(any(word in text_lower for word in company_words)),
-        'job_title': bool(any(word in text_lower for word in job_words)),
-        'requirements': bool(any(word in text_lower for word in req_words)),
-        'contact_info': bool(any(word in text_lower for word in contact_words))
+        'company_name': keywords['essential_company_name'].any(text_lower),
+        'job_title': keywords['essential_job_title'].any(text_lower),
+        'requirements': keywords['essential_requirements'].any(text_lower),
+        'contact_info': keywords['essential_contact_info'].any(text_lower)
     }
 
     # Quality indicators
     quality_indicators = []
 
     # Professional language check
-    professional_words = ['experience', 'qualification', 'responsibility', 'requirement', 'benefit',
-                         'salary', 'position', 'candidate', 'application', 'interview']
-    professional_count = sum(1 for word in professional_words if word.lower() in text.lower())
+    professional_count = keywords['professional'].count(text_lower)
 
     if professional_count >= 5:
         quality_indicators.append("Professional vocabulary used")
@@ -1900,7 +3168,7 @@ def analyze_text_features(text):
         quality_indicators.append("Limited professional vocabulary")
 
     # Structure check
-    if len(words) > 50:
+    if features.word_count > 50:
         quality_indicators.append("Adequate text length")
     else:
         quality_indicators.append("Text too short for proper job posting")
@@ -1911,9 +3179,6 @@ def analyze_text_features(text):
     else:
         suspicious_patterns.append("Missing contact information")
 
-    # Calculate completeness score
-    completeness_score = sum(essential_elements.values()) / len(essential_elements) * 100
-
     # Determine language quality
     if professional_count >= 5 and len(suspicious_patterns) == 0:
         language_quality = 'excellent'
@@ -1924,23 +3189,30 @@ def analyze_text_features(text):
     else:
         language_quality = 'poor'
 
-    # Analyze Indonesian keywords
-    indonesian_analysis = analyze_indonesian_keywords(text)
+    features.suspicious_patterns = suspicious_patterns
+    features.quality_indicators = quality_indicators
+    features.language_quality = language_quality
+    features.completeness_score = sum(essential_elements.values()) / len(essential_elements) * 100
+    features.essential_elements = essential_elements
+    features.professional_word_count = professional_count
+    features.indonesian_analysis = analyze_indonesian_keywords(text, features.word_count)
+    return features
 
-    return {
-        'length': len(text_clean),
-        'word_count': len(words),
-        'suspicious_patterns': suspicious_patterns,
-        'quality_indicators': quality_indicators,
-        'language_quality': language_quality,
-        'completeness_score': completeness_score,
-        'essential_elements': essential_elements,
-        'professional_word_count': professional_count,
-        'indonesian_analysis': indonesian_analysis
-    }
+def extract_batch_text_features(texts):
+    """extract_text_features for many texts, with one TextFeaturizer pass for the RF features"""
+    matrix = get_lexicons().featurizer.transform([text or '' for text in texts])
+    return [extract_text_features(text, feature_dict(row)) for text, row in zip(texts, matrix)]
+
+def analyze_text_features(text):
+    """Extract features EXACTLY like training script for consistent prediction (text_analysis response)"""
+    return extract_text_features(text).to_dict()
 
 def analyze_with_random_forest_detailed(text, text_features):
-    """Random Forest analysis using RETRAINED MODEL with balanced detection"""
+    """
+    Random Forest analysis using RETRAINED MODEL with balanced detection.
+    text_features is the request's FeatureVector; the model gets the
+    features it was trained on, by name when it recorded them.
+    """
     try:
         global rf_model
 
@@ -1948,33 +3220,16 @@ def analyze_with_random_forest_detailed(text, text_features):
             logger.warning("Random Forest model not loaded, using fallback")
             return fallback_rf_analysis(text, text_features)
 
-        # Extract features in the same format as training
-        feature_values = [
-            text_features.get('length', 0),
-            text_features.get('word_count', 0),
-            text_features.get('sentence_count', 0),
-            text_features.get('avg_word_length', 0),
-            text_features.get('genuine_keywords', 0),
-            text_features.get('fake_keywords', 0),
-            text_features.get('keyword_ratio', 1),
-            int(text_features.get('has_email', False)),
-            int(text_features.get('has_phone', False)),
-            int(text_features.get('has_address', False)),
-            int(text_features.get('has_company', False)),
-            int(text_features.get('has_whatsapp', False)),
-            int(text_features.get('has_money_promise', False)),
-            int(text_features.get('has_urgency', False)),
-            int(text_features.get('has_mlm_terms', False)),
-            int(text_features.get('has_no_experience', False)),
-            text_features.get('uppercase_ratio', 0),
-            text_features.get('exclamation_count', 0),
-            text_features.get('question_count', 0),
-            text_features.get('number_count', 0)
-        ]
+        # Features in the same format and order as training
+        feature_names = getattr(rf_model, 'feature_names_in_', None)
+        feature_values = text_features.rf_values(feature_names)
 
         # Predict using the retrained model
         import numpy as np
         feature_array = np.array([feature_values])
+        if feature_names is not None:
+            import pandas as pd
+            feature_array = pd.DataFrame(feature_array, columns=feature_names)  # Named like the training DataFrame
 
         try:
             prediction_proba = rf_model.predict_proba(feature_array)[0]
@@ -1993,25 +3248,25 @@ def analyze_with_random_forest_detailed(text, text_features):
         reasoning_points = []
 
         # Fake indicators
-        if text_features.get('fake_keywords', 0) > 2:
-            reasoning_points.append(f"⚠ High fake keyword count: {text_features.get('fake_keywords', 0)}")
-        if text_features.get('has_urgency', False):
+        if text_features.fake_keywords > 2:
+            reasoning_points.append(f"⚠ High fake keyword count: {text_features.fake_keywords}")
+        if text_features.has_urgency:
             reasoning_points.append("⚠ Urgency tactics detected")
-        if text_features.get('has_money_promise', False):
+        if text_features.has_money_promise:
             reasoning_points.append("⚠ Money promises detected")
-        if text_features.get('has_whatsapp', False):
+        if text_features.has_whatsapp:
             reasoning_points.append("⚠ WhatsApp contact method (suspicious)")
-        if text_features.get('has_mlm_terms', False):
+        if text_features.has_mlm_terms:
             reasoning_points.append("⚠ MLM/Network marketing terms detected")
 
         # Genuine indicators
-        if text_features.get('genuine_keywords', 0) > 2:
-            reasoning_points.append(f"✓ Professional keywords found: {text_features.get('genuine_keywords', 0)}")
-        if text_features.get('has_company', False):
+        if text_features.genuine_keywords > 2:
+            reasoning_points.append(f"✓ Professional keywords found: {text_features.genuine_keywords}")
+        if text_features.has_company:
             reasoning_points.append("✓ Company information present")
-        if text_features.get('has_email', False):
+        if text_features.has_email:
             reasoning_points.append("✓ Professional email contact")
-        if text_features.get('word_count', 0) > 50:
+        if text_features.word_count > 50:
             reasoning_points.append("✓ Adequate job description length")
 
         # BALANCED thresholds - equal treatment for fake and genuine
@@ -2059,13 +3314,13 @@ def fallback_rf_analysis(text, text_features):
         reasoning_points.append("⚠ Short text length")
 
     # Check for fake indicators
-    fake_count = text_features.get('fake_keywords', 0)
+    fake_count = text_features.fake_keywords
     if fake_count > 2:
         confidence -= fake_count * 5
         reasoning_points.append(f"⚠ Fake keywords detected: {fake_count}")
 
     # Check for genuine indicators
-    genuine_count = text_features.get('genuine_keywords', 0)
+    genuine_count = text_features.genuine_keywords
     if genuine_count > 2:
         confidence += genuine_count * 3
         reasoning_points.append(f"✓ Professional keywords: {genuine_count}")
@@ -2089,9 +3344,75 @@ def fallback_rf_analysis(text, text_features):
         'features_analyzed': ['text_length', 'keywords']
     }
 
-def analyze_with_text_classifier_detailed(text, filename=None):
-    """Text Classifier analysis with linguistic reasoning AND LABEL ANALYSIS"""
+def analyze_with_text_classifier_detailed(text, filename=None, text_features=None):
+    """
+    Text Classifier analysis using the trained TF-IDF + Logistic Regression
+    model (served as a term weight table) AND LABEL ANALYSIS.
+    text_features is the request's FeatureVector, used by the keyword
+    fallback when the model is not loaded.
+    """
+    try:
+        if text_model is None:
+            logger.warning("Text Classifier model not loaded, using fallback")
+            return fallback_text_classifier_analysis(text, filename, text_features)
+
+        genuine_prob, contributions = text_model.predict(text)
+        confidence = genuine_prob * 100  # Higher = more genuine
+        reasoning_points = []
+
+        # ANALYZE FILENAME LABEL for confidence boost
+        label_analysis = analyze_file_label(filename)
+        if label_analysis['confidence_boost'] != 0:
+            confidence += label_analysis['confidence_boost']
+            reasoning_points.append(f"📂 {label_analysis['reasoning']}")
+            reasoning_points.append(f"🎯 Label confidence boost: {label_analysis['confidence_boost']:+.0f}%")
+
+        # Terms that weighed most on the decision, either way
+        ranked = sorted(contributions, key=contributions.get)
+        fake_terms = [term for term in ranked[:5] if contributions[term] < 0]
+        genuine_terms = [term for term in reversed(ranked[-5:]) if contributions[term] > 0]
+        if genuine_terms:
+            reasoning_points.append(f"✓ Genuine job terms: {', '.join(genuine_terms)}")
+        if fake_terms:
+            reasoning_points.append(f"⚠ Fake job terms: {', '.join(fake_terms)}")
+        if not contributions:
+            reasoning_points.append("~ No known terms found in the text")
+        reasoning_points.append(f"📊 Model genuine probability: {genuine_prob * 100:.1f}%")
+
+        # BALANCED thresholds - equal treatment for fake and genuine
+        import random
+        confidence += random.uniform(-2, 2)  # Add ±2% variation
+
+        if confidence >= 70:
+            prediction = 'genuine'
+            confidence = max(70, min(85, confidence + random.uniform(1, 5)))
+        elif confidence <= 30:
+            prediction = 'fake'
+            confidence = max(15, min(30, confidence - random.uniform(1, 5)))
+        else:
+            prediction = 'uncertain'
+            confidence = max(31, min(69, confidence + random.uniform(-2, 2)))
+
+        return {
+            'prediction': prediction,
+            'confidence': round(confidence, 1),
+            'reasoning': reasoning_points,
+            'model_name': 'Text Classifier (TF-IDF + Logistic Regression)',
+            'features_analyzed': ['tfidf_terms', 'file_label']
+        }
+
+    except Exception as e:
+        logger.warning(f"Text Classifier analysis failed: {e}, using fallback")
+        return fallback_text_classifier_analysis(text, filename, text_features)
+
+def fallback_text_classifier_analysis(text, filename=None, text_features=None):
+    """
+    Keyword heuristic used when the text classifier model is not available:
+    linguistic reasoning AND LABEL ANALYSIS over the request's FeatureVector
+    (extracted here when not given).
+    """
     try:
+        text_features = text_features or extract_text_features(text)
         confidence = 50  # Start with neutral base confidence
         reasoning_points = []
 
@@ -2103,7 +3424,7 @@ def analyze_with_text_classifier_detailed(text, filename=None):
             reasoning_points.append(f"🎯 Label confidence boost: {label_analysis['confidence_boost']:+.0f}%")
 
         # CRITICAL: Analyze salary patterns for fake job detection
-        salary_analysis = detect_suspicious_salary_patterns(text)
+        salary_analysis = text_features.salary
         if salary_analysis['found']:
             salary_penalty = 0
             salary_type = salary_analysis['type']
@@ -2122,121 +3443,13 @@ def analyze_with_text_classifier_detailed(text, filename=None):
             confidence += salary_penalty
             logger.info(f"🔍 SALARY ANALYSIS: Type={salary_type}, Amount={salary_amount}, Penalty={salary_penalty}")
 
-        # Keyword analysis (Indonesian + English) - 250 words each
-        genuine_keywords = [
-            # English genuine keywords (125 words)
-            'experience', 'qualification', 'requirement', 'responsibility', 'benefit',
-            'salary', 'interview', 'application', 'candidate', 'position', 'company',
-            'corporation', 'professional', 'career', 'employment', 'job', 'vacancy',
-            'skills', 'education', 'degree', 'diploma', 'certificate', 'training',
-            'development', 'growth', 'promotion', 'advancement', 'opportunity',
-            'competitive', 'package', 'insurance', 'health', 'medical', 'dental',
-            'retirement', 'pension', 'bonus', 'incentive', 'commission', 'allowance',
-            'transportation', 'accommodation', 'meal', 'uniform', 'equipment',
-            'office', 'workplace', 'environment', 'team', 'colleague', 'supervisor',
-            'manager', 'director', 'executive', 'staff', 'employee', 'worker',
-            'fulltime', 'parttime', 'contract', 'permanent', 'temporary', 'intern',
-            'internship', 'apprentice', 'trainee', 'graduate', 'fresh', 'senior',
-            'junior', 'assistant', 'coordinator', 'specialist', 'analyst', 'consultant',
-            'engineer', 'developer', 'designer', 'programmer', 'technician', 'operator',
-            'administrator', 'secretary', 'receptionist', 'clerk', 'cashier', 'sales',
-            'marketing', 'finance', 'accounting', 'human', 'resources', 'legal',
-            'operations', 'production', 'quality', 'control', 'research', 'development',
-            'customer', 'service', 'support', 'maintenance', 'security', 'safety',
-            'compliance', 'audit', 'procurement', 'logistics', 'supply', 'chain',
-            'project', 'management', 'planning', 'strategy', 'analysis', 'reporting',
-            'communication', 'presentation', 'leadership', 'teamwork', 'collaboration',
-            'problem', 'solving', 'decision', 'making', 'time', 'organization',
-            'attention', 'detail', 'accuracy', 'reliability', 'punctuality', 'flexibility',
-            'adaptability', 'creativity', 'innovation', 'initiative', 'motivation',
-            'dedication', 'commitment', 'integrity', 'honesty', 'confidentiality',
-
-            # Indonesian genuine keywords (125 words)
-            'pengalaman', 'kualifikasi', 'syarat', 'tanggung', 'jawab', 'tunjangan',
-            'gaji', 'wawancara', 'lamaran', 'kandidat', 'posisi', 'lowongan',
-            'kerja', 'pekerjaan', 'perusahaan', 'pt', 'cv', 'kontak', 'telepon',
-            'profesional', 'karir', 'karier', 'jabatan', 'keahlian',
-            'kemampuan', 'keterampilan', 'pendidikan', 'gelar', 'ijazah', 'sertifikat',
-            'pelatihan', 'pengembangan', 'pertumbuhan', 'promosi', 'kenaikan',
-            'kesempatan', 'kompetitif', 'paket', 'asuransi', 'kesehatan', 'medis',
-            'gigi', 'pensiun', 'bonus', 'insentif', 'komisi',
-            'transportasi', 'akomodasi', 'makan', 'seragam', 'peralatan',
-            'kantor', 'tempat', 'lingkungan', 'tim', 'rekan', 'atasan',
-            'manajer', 'direktur', 'eksekutif', 'staf', 'karyawan', 'pekerja',
-            'penuh', 'waktu', 'paruh', 'kontrak', 'tetap', 'sementara', 'magang',
-            'praktek', 'pkl', 'lulusan', 'fresh', 'graduate', 'senior', 'junior',
-            'asisten', 'koordinator', 'spesialis', 'analis', 'konsultan',
-            'insinyur', 'pengembang', 'desainer', 'programmer', 'teknisi', 'operator',
-            'administrator', 'sekretaris', 'resepsionis', 'petugas', 'kasir', 'penjualan',
-            'pemasaran', 'keuangan', 'akuntansi', 'sumber', 'daya', 'manusia', 'hukum',
-            'operasional', 'produksi', 'kualitas', 'kontrol', 'penelitian',
-            'pelanggan', 'layanan', 'dukungan', 'pemeliharaan', 'keamanan', 'keselamatan',
-            'kepatuhan', 'audit', 'pengadaan', 'logistik', 'pasokan', 'rantai',
-            'proyek', 'manajemen', 'perencanaan', 'strategi', 'analisis', 'pelaporan',
-            'komunikasi', 'presentasi', 'kepemimpinan', 'kolaborasi',
-            'pemecahan', 'masalah', 'pengambilan', 'keputusan', 'organisasi',
-            'perhatian', 'detail', 'akurasi', 'keandalan', 'ketepatan', 'fleksibilitas',
-            'adaptabilitas', 'kreativitas', 'inovasi', 'inisiatif', 'motivasi',
-            'dedikasi', 'komitmen', 'integritas', 'kejujuran', 'kerahasiaan'
-        ]
-
-        fake_keywords = [
-            # English fake keywords (125 words)
-            'easy', 'money', 'quick', 'cash', 'fast', 'instant', 'free',
-            'no', 'experience', 'skills', 'qualifications', 'interview', 'resume',
-            'work', 'from', 'home', 'based', 'remote', 'online', 'internet',
-            'immediate', 'start', 'today', 'urgent', 'hiring', 'asap', 'hurry',
-            'guaranteed', 'income', 'success', 'profit', 'risk', 'zero', 'investment',
-            'capital', 'training', 'course', 'mlm', 'multi', 'level', 'marketing',
-            'network', 'pyramid', 'scheme', 'ponzi', 'get', 'rich', 'make',
-            'passive', 'residual', 'unlimited', 'earning', 'figure', 'millionaire',
-            'financial', 'freedom', 'retire', 'early', 'quit', 'your', 'job',
-            'boss', 'when', 'want', 'flexible', 'hours', 'part', 'time',
-            'side', 'hustle', 'extra', 'supplemental', 'second', 'investment',
-            'business', 'opportunity', 'franchise', 'join', 'now', 'sign', 'up',
-            'limited', 'spots', 'exclusive', 'secret', 'method', 'insider',
-            'information', 'proven', 'system', 'foolproof', 'autopilot', 'automated',
-            'hands', 'off', 'effortless', 'simple', 'anyone', 'can', 'do',
-            'needed', 'beginners', 'welcome', 'copy', 'paste', 'data', 'entry',
-            'typing', 'survey', 'click', 'ads', 'stuff', 'envelopes', 'assembly',
-            'craft', 'mystery', 'shopper', 'product', 'tester', 'social', 'media',
-            'facebook', 'instagram', 'whatsapp', 'telegram', 'youtube', 'tiktok',
-            'crypto', 'bitcoin', 'forex', 'trading', 'binary', 'options', 'casino',
-            'gambling', 'lottery', 'sweepstakes', 'contest', 'prize', 'winner',
-            'congratulations', 'selected', 'chosen', 'act', 'dont', 'miss', 'last',
-            'chance', 'final', 'call', 'deadline',
-
-            # Indonesian fake keywords (125 words)
-            'uang', 'mudah', 'cepat', 'instan', 'gratis', 'dapat', 'tanpa',
-            'pengalaman', 'keahlian', 'kualifikasi', 'wawancara', 'cv', 'dari',
-            'rumah', 'rumahan', 'online', 'internet', 'bisnis', 'mulai', 'hari',
-            'ini', 'sekarang', 'butuh', 'segera', 'buru', 'dijamin', 'untung',
-            'sukses', 'profit', 'resiko', 'bebas', 'modal', 'kecil', 'pelatihan',
-            'kursus', 'mlm', 'jaringan', 'skema', 'piramida', 'kaya', 'mendadak',
-            'penghasilan', 'pasif', 'tetap', 'unlimited', 'jutaan', 'rupiah',
-            'milyaran', 'crorepati', 'kebebasan', 'finansial', 'pensiun', 'dini',
-            'berhenti', 'jadi', 'bos', 'sesuka', 'hati', 'jam', 'fleksibel',
-            'paruh', 'sampingan', 'tambahan', 'income', 'peluang', 'emas',
-            'kesempatan', 'langka', 'terbatas', 'eksklusif', 'rahasia', 'metode',
-            'sistem', 'terbukti', 'cara', 'ampuh', 'trik', 'jitu', 'otomatis',
-            'autopilot', 'repot', 'banget', 'gampang', 'siapa', 'saja', 'bisa',
-            'pemula', 'welcome', 'santai', 'entry', 'ketik', 'klik', 'iklan',
-            'isi', 'amplop', 'rakit', 'kerajinan', 'test', 'produk', 'sosial',
-            'judi', 'lotere', 'undian', 'hadiah', 'pemenang', 'selamat', 'terpilih',
-            'buruan', 'jangan', 'sampai', 'terlewat', 'terakhir', 'deadline',
-            'investasi', 'saham', 'reksadana', 'properti', 'emas', 'deposito',
-            'asuransi', 'kredit', 'pinjaman', 'hutang', 'cicilan', 'bunga',
-            'komisi', 'bonus', 'reward', 'cashback', 'diskon', 'promo'
-        ]
-
-        # Debug: Print first few keywords for testing
-        text_lower = text.lower()
-        genuine_count = sum(1 for keyword in genuine_keywords if keyword.lower() in text_lower)
-        fake_count = sum(1 for keyword in fake_keywords if keyword.lower() in text_lower)
-
-        # Debug: Find which keywords were matched
-        found_genuine = [kw for kw in genuine_keywords[:20] if kw.lower() in text_lower]  # Check first 20
-        found_fake = [kw for kw in fake_keywords[:20] if kw.lower() in text_lower]  # Check first 20
+        # Keyword analysis (Indonesian + English) - 250 words each, from feature_keywords.json
+        genuine_count = text_features.classifier_genuine_count
+        fake_count = text_features.classifier_fake_count
+
+        # Debug: Which of the first 20 keywords were matched
+        found_genuine = text_features.classifier_found_genuine
+        found_fake = text_features.classifier_found_fake
 
         print(f"🔍 KEYWORD DEBUG - Text: {text[:50]}...")
         print(f"🔍 Found genuine keywords: {found_genuine}")
@@ -2272,8 +3485,7 @@ def analyze_with_text_classifier_detailed(text, filename=None):
             reasoning_points.append("~ No clear keyword indicators found")
 
         # Grammar and structure analysis
-        sentences = text.split('.')
-        if len(sentences) >= 3:
+        if text_features.period_count + 1 >= 3:  # Pieces between full stops
             confidence += 20
             reasoning_points.append("✓ Well-structured text with multiple sentences")
         else:
@@ -2281,8 +3493,7 @@ def analyze_with_text_classifier_detailed(text, filename=None):
             reasoning_points.append("⚠ Poor text structure")
 
         # Contact information (Indonesian + English)
-        contact_indicators = ['email', '@', 'phone', 'contact', 'telepon', 'kontak', 'hubungi', 'kirim', 'lamar', 'cv']
-        if any(indicator in text.lower() for indicator in contact_indicators):
+        if text_features.has_contact_indicator:
             confidence += 25
             reasoning_points.append("✓ Contact information provided")
         else:
@@ -2331,7 +3542,7 @@ def analyze_with_text_classifier_detailed(text, filename=None):
             'prediction': prediction,
             'confidence': round(confidence, 1),
             'reasoning': reasoning_points,
-            'model_name': 'Text Classifier (TF-IDF + Logistic Regression)',
+            'model_name': 'Text Classifier (Keyword Fallback)',
             'features_analyzed': ['keywords', 'structure', 'contact_info']
         }
 
@@ -2354,7 +3565,7 @@ def analyze_with_cnn_detailed(text_features):
         # In real implementation, this would analyze image features
 
         # Text organization analysis
-        if text_features['completeness_score'] >= 75:
+        if text_features.completeness_score >= 75:
             confidence += 35
             reasoning_points.append("✓ Well-organized content structure")
         else:
@@ -2362,13 +3573,13 @@ def analyze_with_cnn_detailed(text_features):
             reasoning_points.append("⚠ Poor content organization")
 
         # Language quality assessment
-        if text_features['language_quality'] == 'excellent':
+        if text_features.language_quality == 'excellent':
             confidence += 30
             reasoning_points.append("✓ Excellent language quality")
-        elif text_features['language_quality'] == 'good':
+        elif text_features.language_quality == 'good':
             confidence += 20
             reasoning_points.append("✓ Good language quality")
-        elif text_features['language_quality'] == 'fair':
+        elif text_features.language_quality == 'fair':
             confidence += 5
             reasoning_points.append("~ Fair language quality")
         else:
@@ -2376,12 +3587,12 @@ def analyze_with_cnn_detailed(text_features):
             reasoning_points.append("⚠ Poor language quality")
 
         # Pattern recognition
-        if len(text_features['suspicious_patterns']) == 0:
+        if len(text_features.suspicious_patterns) == 0:
             confidence += 25
             reasoning_points.append("✓ No suspicious visual patterns detected")
         else:
-            confidence -= len(text_features['suspicious_patterns']) * 8
-            reasoning_points.append(f"⚠ {len(text_features['suspicious_patterns'])} suspicious patterns detected")
+            confidence -= len(text_features.suspicious_patterns) * 8
+            reasoning_points.append(f"⚠ {len(text_features.suspicious_patterns)} suspicious patterns detected")
 
         # BALANCED baseline and variation
         import random
@@ -2419,7 +3630,7 @@ def analyze_with_cnn_detailed(text_features):
             'features_analyzed': []
         }
 
-def analyze_ocr_confidence_detailed(text, text_features):
+def analyze_ocr_confidence_detailed(text, text_features, ocr_details=None):
     """OCR confidence analysis with quality assessment"""
     try:
         confidence = 0
@@ -2437,16 +3648,24 @@ def analyze_ocr_confidence_detailed(text, text_features):
             reasoning_points.append("⚠ Poor text extraction quality")
 
         # Readability assessment
-        if text_features['word_count'] > 20:
+        if text_features.word_count > 20:
             confidence += 25
             reasoning_points.append("✓ Sufficient readable content")
         else:
             confidence -= 10
             reasoning_points.append("⚠ Limited readable content")
 
-        # Character quality (simulate OCR confidence)
-        # In real implementation, this would use actual OCR confidence scores
-        prof_count = text_features.get('professional_word_count', 0)
+        # Character quality from Tesseract word confidences when the OCR run kept them
+        if ocr_details and ocr_details.get('words'):
+            mean_confidence = ocr_details.get('mean_confidence', 0)
+            if mean_confidence >= 80:
+                confidence += 15
+                reasoning_points.append(f"✓ High OCR word confidence ({mean_confidence:.0f}%)")
+            elif mean_confidence < 50:
+                confidence -= 15
+                reasoning_points.append(f"⚠ Low OCR word confidence ({mean_confidence:.0f}%)")
+
+        prof_count = text_features.professional_word_count
         if prof_count >= 3:
             confidence += 20
             reasoning_points.append("✓ Professional terms clearly extracted")
@@ -2455,7 +3674,7 @@ def analyze_ocr_confidence_detailed(text, text_features):
             reasoning_points.append("⚠ Limited professional vocabulary extracted")
 
         # Text completeness
-        if text_features['essential_elements']['contact_info']:
+        if text_features.essential_elements['contact_info']:
             confidence += 15
             reasoning_points.append("✓ Contact information successfully extracted")
         else:
@@ -2516,8 +3735,7 @@ def analyze_ocr_confidence_detailed(text, text_features):
             reasoning_points.append("⚠ Limited text extracted")
 
         # Check for basic structure - more generous
-        job_terms = ['job', 'work', 'position', 'salary', 'company', 'kerja', 'gaji', 'lowongan', 'perusahaan']
-        if any(word in text.lower() for word in job_terms):
+        if get_lexicons().features['fallback_job_terms'].any(text.lower()):
             confidence += 10
             reasoning_points.append("✓ Job-related terms detected")
 
@@ -2833,1356 +4051,1200 @@ def generate_recommendations(analysis_results):
             'description': f'Unable to generate recommendations: {str(e)}',
             'suggestions': ['Please try the analysis again']
         }]
-def extract_text_with_ocr(image):
-    """Enhanced OCR extraction with debugging and multiple strategies"""
-    try:                
-        # Debug: Log image info
-        logger.info(f"🔍 OCR Input - Image mode: {image.mode}, Size: {image.size}")
-
-        # Set Tesseract path with better detection
-        tesseract_paths = [
-            r'/usr/bin/tesseract',
-            '/usr/bin/tesseract',
-            r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-            r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-            'tesseract'
-        ]
-
-        tesseract_found = False
-        for path in tesseract_paths:
+
+# Bump when OCR output changes for the same engine and configs (invalidates the OCR cache)
+OCR_PIPELINE_VERSION = 6
+
+# OCR strategy search: every (config, image variant) pair is a strategy.
+# 'default' (--oem 3 --psm 6) is not listed because with the LSTM traineddata
+# it resolves to the same engine as 'basic' (--oem 1 --psm 6).
+OCR_CONFIGS = [
+    ('basic', r'--oem 1 --psm 6'),
+    ('column', r'--oem 1 --psm 4'),
+    ('full_page', r'--oem 1 --psm 3'),
+    ('no_psm', r'--oem 1'),
+    ('single_line', r'--oem 1 --psm 7'),
+    ('single_word', r'--oem 1 --psm 8'),
+    ('legacy', r'--oem 0 --psm 6'),
+]
+
+# OCR quality tiers, chosen per request with 'mode'. Each fixes the
+# preprocessing, the strategies tried, the traineddata and a latency target;
+# None falls back to the matching app.config default.
+OCR_MODES = {
+    'fast': {
+        'deadline_seconds': 5,
+        'deskew': False,  # No OSD pass
+        'text_regions': False,
+        'variants': 'preprocessed',  # Routed chain only, no original-image fallback
+        'configs': ['basic', 'column'],
+        'max_passes': 1,
+        'confidence_passes': 1,
+        'tessdata': 'fast'
+    },
+    'balanced': {
+        'deadline_seconds': None,  # OCR_DEADLINE_SECONDS
+        'deskew': True,
+        'text_regions': True,
+        'variants': 'all',
+        'configs': None,  # All of OCR_CONFIGS
+        'max_passes': None,
+        'confidence_passes': None,  # OCR_CONFIDENCE_PASSES
+        'tessdata': None
+    },
+    'accurate': {
+        'deadline_seconds': 45,
+        'deskew': True,
+        'text_regions': True,
+        'variants': 'all',
+        'configs': None,
+        'max_passes': None,
+        'confidence_passes': 6,
+        'tessdata': 'best'
+    }
+}
+
+CLEAN_WORD_PATTERN = re.compile(r"^[^\W\d_]{2,}[.,:;!?)]?$")
+
+# Win statistics per strategy for this worker, used to try likely winners first
+ocr_strategy_stats = {}
+ocr_strategy_lock = threading.Lock()
+
+def resolve_ocr_mode(mode=None):
+    """
+    Return the settings for an OCR mode, with defaults filled in and the
+    Tesseract options ('config_suffix') for its traineddata.
+    Raises ValueError for an unknown mode.
+    """
+    name = mode or app.config['OCR_DEFAULT_MODE']
+    if name not in OCR_MODES:
+        raise ValueError(f"Unknown OCR mode '{name}'. Use one of: {', '.join(OCR_MODES)}")
+
+    tier = dict(OCR_MODES[name], name=name)
+    if tier['deadline_seconds'] is None:
+        tier['deadline_seconds'] = app.config['OCR_DEADLINE_SECONDS']
+    if tier['confidence_passes'] is None:
+        tier['confidence_passes'] = app.config['OCR_CONFIDENCE_PASSES']
+    tier['deskew'] = tier['deskew'] and app.config['OCR_DESKEW']
+    tier['text_regions'] = tier['text_regions'] and app.config['OCR_TEXT_REGIONS']
+
+    configs = [(config_name, config) for config_name, config in OCR_CONFIGS
+               if tier['configs'] is None or config_name in tier['configs']]
+    tessdata_dir = app.config['OCR_TESSDATA_DIRS'].get(tier['tessdata'])
+    tier['config_suffix'] = ''
+    if tessdata_dir:
+        tier['config_suffix'] = f' --tessdata-dir "{tessdata_dir}"'
+        # tessdata_fast / tessdata_best only carry LSTM models
+        configs = [(config_name, config) for config_name, config in configs
+                   if parse_tesseract_config(config)[0] != 0]
+    tier['configs'] = configs
+    return tier
+
+def get_requested_ocr_mode(data=None):
+    """OCR mode from the JSON body, form fields or query string, or None"""
+    if data and data.get('mode'):
+        return data['mode']
+    return request.form.get('mode') or request.args.get('mode')
+
+def build_ocr_image_variants(decoded, image_type, variants='all'):
+    """
+    Return lazily built image variants for OCR: the output of the one
+    preprocessing chain for this image type (named after the type, so win
+    rates are learned per type), then, unless variants is 'preprocessed',
+    the untouched image as a fallback for coloured text.
+    decoded is the request's DecodedImage, so conversions happen once.
+    """
+    cache = {}
+
+    def original():
+        return decoded.rgb
+
+    def preprocessed():
+        return preprocess_for_ocr(decoded, image_type)
+
+    builders = {image_type: preprocessed, 'original': original}
+    names = [image_type] if variants == 'preprocessed' else list(builders)
+
+    def get(name):
+        if name not in cache:
+            cache[name] = builders[name]()
+        return cache[name]
+
+    return names, get
+
+def rank_ocr_strategies(variant_names, configs=None):
+    """Order strategies by smoothed win rate, falling back to the static order"""
+    strategies = [
+        (config_name, config, variant_name)
+        for config_name, config in (configs or OCR_CONFIGS)
+        for variant_name in variant_names
+    ]
+
+    with ocr_strategy_lock:
+        stats = {key: dict(value) for key, value in ocr_strategy_stats.items()}
+
+    def win_rate(strategy):
+        entry = stats.get(f"{strategy[0]}+{strategy[2]}", {})
+        # Laplace smoothing keeps untried strategies at 0.5 so they still get explored
+        return (entry.get('wins', 0) + 1) / (entry.get('attempts', 0) + 2)
+
+    # sorted() is stable, so ties keep the static prior order
+    return sorted(strategies, key=win_rate, reverse=True)
+
+def record_ocr_strategy_results(attempted, winner):
+    """Update per-strategy attempt/win counters after a search"""
+    with ocr_strategy_lock:
+        for method in attempted:
+            entry = ocr_strategy_stats.setdefault(method, {'attempts': 0, 'wins': 0})
+            entry['attempts'] += 1
+        if winner:
+            ocr_strategy_stats[winner]['wins'] += 1
+
+def score_ocr_text(text):
+    """Return (score, confidence) where confidence is the share of clean words"""
+    if not text:
+        return 0, 0.0
+    words = text.split()
+    char_count = len(text.strip())
+    score = char_count + (len(words) * 3)
+    clean_words = sum(1 for word in words if CLEAN_WORD_PATTERN.match(word))
+    return score, clean_words / max(len(words), 1)
+
+def get_ocr_lexicon():
+    """Lower-case vocabulary used to measure the share of dictionary words in OCR output"""
+    return get_lexicons().ocr_vocabulary
+
+def collect_ocr_words(data):
+    """Turn image_to_data output into a list of recognised words with confidence and box"""
+    words = []
+    for i, text in enumerate(data.get('text', [])):
+        text = (text or '').strip()
+        conf = float(data['conf'][i])
+        if not text or conf < 0:
+            continue
+        words.append({
+            'text': text,
+            'conf': round(conf, 1),
+            'box': [int(data['left'][i]), int(data['top'][i]), int(data['width'][i]), int(data['height'][i])],
+            'line': [int(data['block_num'][i]), int(data['par_num'][i]), int(data['line_num'][i])]
+        })
+    return words
+
+def ocr_words_to_text(words):
+    """Rebuild page text from words: spaces within a line, blank line between paragraphs"""
+    lines = []
+    current_line = None
+    for word in words:
+        if word['line'] != current_line:
+            if current_line is not None and word['line'][:2] != current_line[:2]:
+                lines.append('')
+            lines.append(word['text'])
+            current_line = word['line']
+        else:
+            lines[-1] += ' ' + word['text']
+    return '\n'.join(lines)
+
+def score_ocr_words(words):
+    """
+    Quality of a word-level OCR result: mean Tesseract word confidence
+    blended with the share of alphabetic words found in the project lexicon.
+    Very short results are scaled down so a single confident word cannot
+    beat a full page.
+    """
+    if not words:
+        return {'score': 0, 'quality': 0.0, 'mean_confidence': 0.0, 'dictionary_ratio': 0.0}
+
+    mean_confidence = sum(word['conf'] for word in words) / len(words)
+
+    lexicon = get_ocr_lexicon()
+    alpha_words = [token for token in (re.sub(r'\W', '', word['text'].lower()) for word in words)
+                   if len(token) >= 2 and token.isalpha()]
+    dictionary_ratio = sum(1 for token in alpha_words if token in lexicon) / max(len(alpha_words), 1)
+
+    quality = 0.7 * (mean_confidence / 100) + 0.3 * dictionary_ratio
+    return {
+        'score': round(1000 * quality * min(1.0, len(words) / 10)),
+        'quality': round(quality, 3),
+        'mean_confidence': round(mean_confidence, 1),
+        'dictionary_ratio': round(dictionary_ratio, 3)
+    }
+
+def get_ocr_executor():
+    """Return this worker's bounded OCR thread pool, creating it on first use"""
+    global ocr_executor
+
+    with ocr_executor_lock:
+        if ocr_executor is None:
+            ocr_executor = ThreadPoolExecutor(
+                max_workers=app.config['OCR_MAX_WORKERS'],
+                thread_name_prefix='ocr'
+            )
+        return ocr_executor
+
+def run_ocr_strategy(image, config, timeout, scoring):
+    """
+    Run one OCR strategy and return a candidate dict with the raw text, its
+    score and confidence; only the winning candidate's text gets cleaned.
+    'confidence' scoring runs image_to_data once and keeps the word-level
+    output; 'length' scoring uses image_to_string.
+    """
+    if scoring == 'confidence':
+        words = collect_ocr_words(ocr_engine.image_to_data(image, config=config, timeout=timeout))
+        quality = score_ocr_words(words)
+        return {
+            'text': ocr_words_to_text(words),
+            'score': quality['score'],
+            'confidence': quality['quality'],
+            'mean_confidence': quality['mean_confidence'],
+            'dictionary_ratio': quality['dictionary_ratio'],
+            'words': words
+        }
+
+    text = ocr_engine.image_to_string(image, config=config, timeout=timeout)
+    score, confidence = score_ocr_text(text)
+    return {'text': text, 'score': score, 'confidence': confidence, 'words': []}
+
+# Long side of the thumbnail used for orientation and skew estimation
+ORIENTATION_ESTIMATE_SIZE = 1000
+
+def estimate_skew_angle(gray):
+    """
+    Estimate text skew in degrees from a grayscale image, in PIL's rotate()
+    convention (rotating by the result levels the text), or 0.0 when there
+    are too few text lines. Characters are joined into line blobs as in
+    detect_text_regions; the long edge of each elongated blob's minAreaRect
+    gives its angle and the median over lines is returned.
+    """
+    import math
+
+    height, width = gray.shape[:2]
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+    _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    join_width = max(9, width // 60)
+    connected = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (join_width, 3)))
+    contours, _ = cv2.findContours(connected, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    angles = []
+    for contour in contours:
+        if len(contour) < 5:
+            continue
+        box = cv2.boxPoints(cv2.minAreaRect(contour))
+        edges = [box[1] - box[0], box[2] - box[1]]
+        long_edge, short_edge = sorted(edges, key=lambda edge: -float(np.hypot(*edge)))
+        length, thickness = float(np.hypot(*long_edge)), float(np.hypot(*short_edge))
+        if length < width * 0.05 or length < thickness * 4:
+            continue  # Not a text line
+        angle = math.degrees(math.atan2(float(long_edge[1]), float(long_edge[0])))
+        # Fold direction: a line at 178 degrees is a line at -2 degrees
+        if angle > 90:
+            angle -= 180
+        elif angle <= -90:
+            angle += 180
+        if abs(angle) < 45:
+            angles.append(angle)
+
+    if len(angles) < 3:
+        return 0.0
+    return float(np.median(angles))
+
+def correct_orientation(decoded, deadline):
+    """
+    Make the page upright and level once, before any OCR pass.
+    Orientation comes from Tesseract OSD on a small thumbnail (when the osd
+    language data is installed); skew from estimate_skew_angle. Returns
+    (corrected DecodedImage, {'rotate': degrees clockwise, 'skew': degrees}).
+    """
+    info = {'rotate': 0, 'skew': 0.0}
+    thumb = decoded.thumbnail(ORIENTATION_ESTIMATE_SIZE).convert('L')
+
+    if 'osd' in ocr_status.get('supported_languages', ()):
+        try:
+            osd = ocr_engine.osd(thumb, timeout=max(1, deadline - time.monotonic()))
+            if osd['rotate'] % 360 and osd['confidence'] >= app.config['OCR_OSD_MIN_CONFIDENCE']:
+                info['rotate'] = osd['rotate'] % 360
+        except Exception as e:
+            logger.debug(f"Orientation detection skipped: {e}")  # Too little text, or timeout
+
+    if info['rotate']:
+        # Multiples of 90 are exact transposes in PIL, no resampling
+        decoded = decoded.rotated(-info['rotate'], expand=True)
+        thumb = thumb.rotate(-info['rotate'], expand=True)
+
+    gray = np.asarray(thumb)
+    angle = estimate_skew_angle(gray)
+    if app.config['OCR_MIN_SKEW_DEGREES'] <= abs(angle) <= app.config['OCR_MAX_SKEW_DEGREES']:
+        # Fill the exposed corners with the page colour from the image border
+        border = np.concatenate([gray[0], gray[-1], gray[:, 0], gray[:, -1]])
+        fill = int(np.median(border))
+        fillcolor = fill if decoded.rgb.mode == 'L' else (fill, fill, fill)
+        decoded = decoded.rotated(angle, resample=Image.BICUBIC, expand=True, fillcolor=fillcolor)
+        info['skew'] = round(angle, 2)
+
+    if info['rotate'] or info['skew']:
+        logger.info(f"🔄 Corrected orientation: rotated {info['rotate']}°, deskewed {info['skew']}°")
+    return decoded, info
+
+def detect_text_regions(gray):
+    """
+    Find text blocks in a grayscale image without any external model.
+    Characters light up in the morphological gradient; a horizontal closing
+    joins them into lines, which are filtered by size and gradient density
+    (photos and flat colour blocks fall outside the range) and then merged
+    into blocks by a dilation scaled to the median line height.
+    Returns dicts with 'box' (x, y, w, h), 'line_count' and 'line_height'.
+    """
+    height, width = gray.shape[:2]
+
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+    _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    del gradient  # Full-size intermediates are released as soon as they are consumed
+
+    join_width = max(9, width // 60)
+    connected = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (join_width, 1)))
+    contours, _ = cv2.findContours(connected, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    del connected
+
+    lines = []
+    line_mask = np.zeros_like(binary)
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if h < 8 or w < 8 or h > height * 0.5:
+            continue
+        density = cv2.countNonZero(binary[y:y + h, x:x + w]) / float(w * h)
+        if not 0.2 <= density <= 0.9:
+            continue
+        lines.append((x, y, w, h))
+        line_mask[y:y + h, x:x + w] = 255
+
+    if not lines:
+        return []
+
+    line_height = int(np.median([h for _, _, _, h in lines]))
+    block_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (join_width * 2, max(3, line_height)))
+    contours, _ = cv2.findContours(cv2.dilate(line_mask, block_kernel), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    blocks = []
+    for contour in contours:
+        bx, by, bw, bh = cv2.boundingRect(contour)
+        members = [line for line in lines
+                   if line[0] >= bx and line[1] >= by and line[0] + line[2] <= bx + bw and line[1] + line[3] <= by + bh]
+        if not members:
+            continue
+        x0 = min(line[0] for line in members)
+        y0 = min(line[1] for line in members)
+        x1 = max(line[0] + line[2] for line in members)
+        y1 = max(line[1] + line[3] for line in members)
+        blocks.append({
+            'box': (x0, y0, x1 - x0, y1 - y0),
+            'line_count': len(members),
+            'line_height': int(np.median([line[3] for line in members]))
+        })
+    return blocks
+
+def sort_regions_reading_order(blocks):
+    """
+    Order blocks for reading with a recursive XY-cut: split at the widest
+    empty horizontal or vertical gap (horizontal wins ties) until no gap
+    is left, so multi-column posters are read column by column.
+    """
+    if len(blocks) <= 1:
+        return list(blocks)
+
+    best_cut = None
+    for axis in (1, 0):  # 1: cut between rows (y), 0: cut between columns (x)
+        spans = sorted((block['box'][axis], block['box'][axis] + block['box'][axis + 2]) for block in blocks)
+        reach = spans[0][1]
+        for start, end in spans[1:]:
+            gap = start - reach
+            if gap > 0 and (best_cut is None or gap > best_cut[0]):
+                best_cut = (gap, axis, start)
+            reach = max(reach, end)
+
+    if best_cut is None:
+        return sorted(blocks, key=lambda block: (block['box'][1], block['box'][0]))
+
+    _, axis, cut = best_cut
+    first = [block for block in blocks if block['box'][axis] < cut]
+    second = [block for block in blocks if block['box'][axis] >= cut]
+    return sort_regions_reading_order(first) + sort_regions_reading_order(second)
+
+def text_region_config(block):
+    """Pick a page segmentation mode that matches the shape of a text block"""
+    _, _, w, h = block['box']
+    if block['line_count'] > 1:
+        return r'--oem 1 --psm 6'  # Uniform block of text
+    if w < h * 4:
+        return r'--oem 1 --psm 8'  # Single word
+    return r'--oem 1 --psm 7'  # Single line
+
+def ocr_region_words(crop, config, timeout, offset, index):
+    """OCR one cropped block and map its words back to page coordinates"""
+    words = collect_ocr_words(ocr_engine.image_to_data(crop, config=config, timeout=timeout))
+    for word in words:
+        word['box'][0] += offset[0]
+        word['box'][1] += offset[1]
+        block_num, par_num, line_num = word['line']
+        word['line'] = [index, block_num * 100 + par_num, line_num]
+    return words
+
+def extract_text_from_regions(decoded, deadline, config_suffix=''):
+    """
+    OCR only the detected text blocks, in parallel on the worker's OCR pool,
+    and reassemble the words in reading order. Returns a candidate in the
+    same shape as run_ocr_strategy, or None when no text block is found.
+    """
+    blocks = detect_text_regions(decoded.gray_array)
+    if not blocks:
+        return None
+
+    image = decoded.rgb
+    width, height = image.size
+    executor = get_ocr_executor()
+    futures = []
+    for index, block in enumerate(sort_regions_reading_order(blocks)):
+        x, y, w, h = block['box']
+        pad = max(4, block['line_height'] // 2)
+        left, top = max(0, x - pad), max(0, y - pad)
+        crop = image.crop((left, top, min(width, x + w + pad), min(height, y + h + pad)))
+        timeout = max(1, deadline - time.monotonic())
+        config = text_region_config(block) + config_suffix
+        futures.append(executor.submit(ocr_region_words, crop, config, timeout, (left, top), index))
+
+    done, not_done = wait(futures, timeout=max(0, deadline - time.monotonic()))
+    for future in not_done:
+        future.cancel()
+
+    words = []
+    for future in futures:
+        if future in done:
             try:
-                pytesseract.pytesseract.tesseract_cmd = path
-                version = pytesseract.get_tesseract_version()
-                logger.info(f"✅ Found Tesseract {version} at: {path}")
-                tesseract_found = True
-                break
+                words.extend(future.result())
             except Exception as e:
-                logger.debug(f"Tesseract not found at {path}: {e}")
-                continue
+                logger.debug(f"❌ Text region OCR failed: {e}")
 
-        if not tesseract_found:
-            logger.error("❌ Tesseract OCR not found in any standard location")
-            return "Tesseract OCR not found"
+    quality = score_ocr_words(words)
+    logger.info(f"🧩 Text regions: {len(blocks)} blocks, {len(words)} words, quality {quality['quality']:.0%}")
+    return {
+        'text': ocr_words_to_text(words),
+        'score': quality['score'],
+        'confidence': quality['quality'],
+        'mean_confidence': quality['mean_confidence'],
+        'dictionary_ratio': quality['dictionary_ratio'],
+        'words': words,
+        'method': 'text_regions',
+        'regions': len(blocks)
+    }
 
-        # Prepare multiple image variants for better OCR
-        image_variants = []
+# Whole-page config for tiles: each tile may hold several blocks of text
+OCR_TILE_CONFIG = r'--oem 1 --psm 3'
 
-        # Variant 1: Original image
-        image_variants.append(("original", image))
+def tile_spans(length, size, overlap):
+    """
+    Split [0, length) into overlapping tiles; returns (start, core_start, core_end)
+    per tile. Cores split each overlap at its middle, so every page position
+    belongs to the core of exactly one tile.
+    """
+    if length <= size:
+        return [(0, 0, length)]
+    step = size - overlap
+    starts = list(range(0, length - size, step)) + [length - size]
+    spans = []
+    for i, start in enumerate(starts):
+        core_start = 0 if i == 0 else (starts[i - 1] + size + start) // 2
+        core_end = length if i == len(starts) - 1 else (start + size + starts[i + 1]) // 2
+        spans.append((start, core_start, core_end))
+    return spans
+
+def ocr_tile_words(tile, config, timeout, box, core, page_size, image_type):
+    """
+    OCR one tile and return its words in page coordinates. Words cut by an
+    inner tile edge, or centred outside the tile's core, are dropped: the
+    neighbouring tile reads them whole (the overlap de-duplication).
+    """
+    left, top, right, bottom = box
+    processed = preprocess_for_ocr(tile, image_type)
+
+    words = []
+    for word in collect_ocr_words(ocr_engine.image_to_data(processed, config=config, timeout=timeout)):
+        x, y, w, h = word['box']
+        x0, y0 = left + x, top + y
+        x1, y1 = x0 + w, y0 + h
+        cut = ((left > 0 and x0 <= left + 1) or (top > 0 and y0 <= top + 1) or
+               (right < page_size[0] and x1 >= right - 1) or (bottom < page_size[1] and y1 >= bottom - 1))
+        center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+        if cut or not (core[0] <= center_x < core[2] and core[1] <= center_y < core[3]):
+            continue
+        word['box'] = [x0, y0, w, h]
+        words.append(word)
+    return words
+
+def group_words_into_lines(words):
+    """
+    Re-derive lines for words merged from several tiles, from page
+    coordinates: words whose vertical centres lie within half a line height
+    form one line, read left to right; a gap taller than a line between
+    lines starts a new paragraph.
+    """
+    rows = []
+    for word in sorted(words, key=lambda word: word['box'][1] + word['box'][3] / 2):
+        _, y, _, h = word['box']
+        center = y + h / 2
+        if rows and abs(center - rows[-1]['center']) <= max(h, rows[-1]['height']) / 2:
+            row = rows[-1]
+            row['words'].append(word)
+            row['center'] += (center - row['center']) / len(row['words'])
+            row['height'] += (h - row['height']) / len(row['words'])
+        else:
+            rows.append({'center': center, 'height': h, 'words': [word]})
+
+    lines = []
+    paragraph, previous_bottom = 0, None
+    for number, row in enumerate(rows):
+        top = min(word['box'][1] for word in row['words'])
+        if previous_bottom is not None and top - previous_bottom > row['height']:
+            paragraph += 1
+        for word in sorted(row['words'], key=lambda word: word['box'][0]):
+            word['line'] = [0, paragraph, number]
+            lines.append(word)
+        previous_bottom = max(word['box'][1] + word['box'][3] for word in row['words'])
+    return lines
+
+def extract_text_from_tiles(decoded, deadline, image_type, tier):
+    """
+    OCR a very large image as overlapping OCR_TILE_SIZE tiles on the worker's
+    OCR pool and merge the words (see ocr_tile_words). Tiles are cropped only
+    as pool slots free up, so at most OCR_MAX_WORKERS tiles and their
+    preprocessing are in memory at once, whatever the image resolution.
+    Returns (candidate or None, tiles completed).
+    """
+    image = decoded.rgb
+    width, height = image.size
+    size, overlap = app.config['OCR_TILE_SIZE'], app.config['OCR_TILE_OVERLAP']
+    jobs = iter([
+        ((x, y, min(width, x + size), min(height, y + size)), (core_left, core_top, core_right, core_bottom))
+        for y, core_top, core_bottom in tile_spans(height, size, overlap)
+        for x, core_left, core_right in tile_spans(width, size, overlap)
+    ])
+    config = OCR_TILE_CONFIG + tier['config_suffix']
+    executor = get_ocr_executor()
+    pending = {}
+
+    def submit_next():
+        job = next(jobs, None)
+        if job is None:
+            return False
+        box, core = job
+        timeout = max(1, deadline - time.monotonic())
+        future = executor.submit(ocr_tile_words, image.crop(box), config, timeout, box, core, image.size, image_type)
+        pending[future] = box
+        return True
 
-        # Variant 2: Convert to RGB if needed
-        if image.mode != 'RGB':
+    words = []
+    completed = 0
+    while len(pending) < app.config['OCR_MAX_WORKERS'] and submit_next():
+        pass
+
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"⏱️ OCR deadline reached after {completed} tiles, using words so far")
+            break
+        done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            box = pending.pop(future)
+            completed += 1
             try:
-                rgb_image = image.convert('RGB')
-                image_variants.append(("rgb", rgb_image))
-            except:
-                pass
-
-        # Variant 3: Grayscale
-        try:
-            gray_image = image.convert('L')
-            image_variants.append(("grayscale", gray_image))
-        except:
+                words.extend(future.result())
+            except Exception as e:
+                logger.debug(f"❌ Tile {box} OCR failed: {e}")
+        while len(pending) < app.config['OCR_MAX_WORKERS'] and submit_next():
             pass
 
-        # Variant 4: Enhanced contrast
+    for future in pending:
+        future.cancel()
+
+    increment_metric('ocr_tiled_images')
+    words = group_words_into_lines(words)
+    if not words:
+        return None, completed
+
+    quality = score_ocr_words(words)
+    logger.info(f"🧱 Tiled OCR: {completed} tiles, {len(words)} words, quality {quality['quality']:.0%}")
+    return {
+        'text': ocr_words_to_text(words),
+        'score': quality['score'],
+        'confidence': quality['quality'],
+        'mean_confidence': quality['mean_confidence'],
+        'dictionary_ratio': quality['dictionary_ratio'],
+        'words': words,
+        'method': 'tiles',
+        'tiles': completed
+    }, completed
+
+def search_ocr_strategies(decoded, scoring, deadline, image_type, tier):
+    """
+    Adaptive, parallel OCR strategy search; returns (best candidate or None, attempts).
+    Strategies pair each of the tier's configs with the image_type
+    preprocessing or (tier permitting) the original image.
+    Detected text blocks are OCR'd first (see extract_text_from_regions).
+    If that result is not good enough, strategies are dispatched best-first
+    (by historical win rate) to the worker's OCR pool; the search stops once
+    the best score stops improving, the result is good enough, or the
+    deadline passes, in which case the best result so far is returned.
+
+    With 'confidence' scoring only the tier's top confidence_passes
+    strategies are run: the first on its own, so a confident result
+    (OCR_CONFIDENCE_ACCEPT) ends the search before more are started, then
+    the rest concurrently like any other search.
+    """
+    variant_names, get_variant = build_ocr_image_variants(decoded, image_type, tier['variants'])
+    ranked = rank_ocr_strategies(variant_names, tier['configs'])[:tier['max_passes']]
+
+    if scoring == 'confidence':
+        ranked = ranked[:tier['confidence_passes']]
+        exit_confidence = app.config['OCR_CONFIDENCE_ACCEPT']
+        exit_min_words = 3
+        first_in_flight = 1
+    else:
+        exit_confidence = app.config['OCR_EARLY_EXIT_CONFIDENCE']
+        exit_min_words = app.config['OCR_EARLY_EXIT_MIN_WORDS']
+        first_in_flight = app.config['OCR_MAX_WORKERS']
+    max_in_flight = app.config['OCR_MAX_WORKERS']
+
+    strategies = iter(ranked)
+    patience = app.config['OCR_PATIENCE']
+    min_gain = app.config['OCR_MIN_IMPROVEMENT']
+
+    # Text blocks first: fewer pixels through Tesseract; a good result ends here,
+    # otherwise it is the candidate the full-page strategies have to beat
+    best = None
+    if tier['text_regions']:
         try:
-            from PIL import ImageEnhance
-            enhancer = ImageEnhance.Contrast(image)
-            enhanced_image = enhancer.enhance(2.0)
-            image_variants.append(("enhanced", enhanced_image))
-        except:
-            pass
+            best = extract_text_from_regions(decoded, deadline, tier['config_suffix'])
+        except Exception as e:
+            logger.warning(f"⚠️ Text region OCR failed: {e}")
+        if best and not best['text'].strip():
+            best = None
+        if best and best['confidence'] >= app.config['OCR_CONFIDENCE_ACCEPT'] and len(best['text'].split()) >= 3:
+            return best, 0
+
+    executor = get_ocr_executor()
+    pending = {}
+
+    def submit_next():
+        strategy = next(strategies, None)
+        if strategy is None:
+            return False
+        config_name, config, img_name = strategy
+        logger.debug(f"🔍 Trying {config_name} on {img_name} image")
+        # The CLI backend kills Tesseract runs that outlive the deadline
+        timeout = max(1, deadline - time.monotonic())
+        future = executor.submit(run_ocr_strategy, get_variant(img_name), config + tier['config_suffix'], timeout, scoring)
+        pending[future] = f"{config_name}+{img_name}"
+        return True
 
-        # OCR configurations with different approaches
-        configs = [
-            ('basic', r'--oem 1 --psm 6'),
-            ('column', r'--oem 1 --psm 4'),
-            ('full_page', r'--oem 1 --psm 3'),
-            ('single_word', r'--oem 1 --psm 8'),
-            ('single_line', r'--oem 1 --psm 7'),
-            ('default', r'--oem 3 --psm 6'),
-            ('legacy', r'--oem 0 --psm 6'),
-            ('no_psm', r'--oem 1'),
-        ]
-
-        best_text = ""
-        best_score = 0
-        best_method = ""
-
-        # Try each image variant with each config
-        for img_name, img_variant in image_variants:
-            for config_name, config in configs:
-                try:
-                    logger.debug(f"🔍 Trying {config_name} on {img_name} image")
+    attempted = []
+    stale_attempts = 0
+    finished = False
+
+    while len(pending) < first_in_flight and submit_next():
+        pass
+
+    while pending and not finished:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"⏱️ OCR deadline reached after {len(attempted)} strategies, using best so far")
+            break
 
-                    # Extract text
-                    text = pytesseract.image_to_string(img_variant, config=config)
+        done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            method = pending.pop(future)
+            attempted.append(method)
+            try:
+                candidate = future.result()
+                logger.debug(f"📊 {method}: score {candidate['score']}, confidence {candidate['confidence']:.0%}")
+            except Exception as e:
+                logger.debug(f"❌ {method} failed: {e}")
+                candidate = {'text': '', 'score': 0, 'confidence': 0.0}
+
+            if finished:
+                continue
 
-                    # Clean text
-                    if text:
-                        text = clean_extracted_text(text)
+            # Update best result
+            best_score = best['score'] if best else 0
+            if candidate['score'] > best_score * (1 + min_gain) and candidate['text'].strip():
+                best = dict(candidate, method=method)
+                stale_attempts = 0
+                logger.info(f"🎯 NEW BEST: {method} (score: {candidate['score']})")
 
-                    # Calculate score
-                    char_count = len(text.strip()) if text else 0
-                    word_count = len(text.split()) if text else 0
-                    score = char_count + (word_count * 3)
+                if candidate['confidence'] >= exit_confidence and len(candidate['text'].split()) >= exit_min_words:
+                    logger.info(f"⏩ Early exit: confidence {candidate['confidence']:.0%} after {len(attempted)} attempts")
+                    finished = True
+            else:
+                stale_attempts += 1
+                if best and stale_attempts >= patience:
+                    logger.info(f"⏩ Early exit: no improvement in {patience} attempts")
+                    finished = True
 
-                    logger.debug(f"📊 {config_name}+{img_name}: {char_count} chars, {word_count} words, score: {score}")
+        while not finished and len(pending) < max_in_flight and submit_next():
+            pass
 
-                    # Update best result
-                    if score > best_score and char_count > 0:
-                        best_text = text
-                        best_score = score
-                        best_method = f"{config_name}+{img_name}"
-                        logger.info(f"🎯 NEW BEST: {best_method} (score: {score})")
+    # Stragglers: drop queued runs; running ones finish (or time out) unobserved
+    for future in pending:
+        future.cancel()
 
-                except Exception as e:
-                    logger.debug(f"❌ {config_name}+{img_name} failed: {e}")
-                    continue
+    record_ocr_strategy_results(attempted, best['method'] if best and best['method'] in attempted else None)
+    return best, len(attempted)
 
-        # Final result
-        if best_text and best_text.strip():
-            logger.info(f"✅ OCR SUCCESS: {len(best_text)} chars via {best_method}")
-            logger.info(f"📝 Preview: {best_text[:100]}...")
-            return best_text
+def extract_text_with_ocr_detailed(image, scoring=None, mode=None):
+    """
+    Extract text from an image and return it with the OCR details: the
+    winning method, its score and confidence, the attempt count and (with
+    'confidence' scoring) the words, boxes and confidences of the winner.
+    image is the request's DecodedImage (or a PIL image, wrapped in one).
+    mode selects an OCR_MODES tier (default OCR_DEFAULT_MODE); an unknown
+    mode raises ValueError.
+    Results are served from, and stored in, the shared OCR cache; a poster
+    that is a near-duplicate of a cached one reuses that result.
+    """
+    tier = resolve_ocr_mode(mode)
+    decoded = image if isinstance(image, DecodedImage) else DecodedImage.from_image(image)
+    result = {
+        'text': '',
+        'method': None,
+        'mode': tier['name'],
+        'scoring': scoring or app.config['OCR_SCORING'],
+        'score': 0,
+        'confidence': 0.0,
+        'words': [],
+        'attempts': 0,
+        'cached': False,
+        'near_duplicate': None,
+        'image_type': None,
+        'orientation': None,
+        'text_check': None,
+        'resolution': decoded.resolution,
+        'memory': None
+    }
+    scoring = result['scoring']
+
+    try:
+        # Debug: Log image info
+        logger.info(f"🔍 OCR Input - Image mode: {decoded.image.mode}, Size: {decoded.size}")
+
+        # Tesseract is resolved once in check_tesseract(); no per-call probing
+        if ocr_engine is None:
+            logger.error("❌ Tesseract OCR not found in any standard location")
+            result['text'] = "Tesseract OCR not found"
+            return result
+
+        cache = get_ocr_cache()
+        cache_key = None
+        if cache:
+            with decoded.memory.stage('fingerprint'):
+                fingerprint = decoded.fingerprint
+            cache_key = ocr_cache_key(fingerprint['digest'], scoring=scoring, mode=tier['name'])
+            cached = cache.get(cache_key)
+            if not cached:
+                near_duplicate = find_near_duplicate(
+                    fingerprint, lambda digest: cache.get(ocr_cache_key(digest, scoring=scoring, mode=tier['name']))
+                )
+                if near_duplicate:
+                    # Stored for exact repeats but not indexed: matches must not chain past the distance limit
+                    cached = dict(near_duplicate[1], near_duplicate=near_duplicate[0])
+                    cache.put(cache_key, cached)
+            if cached:
+                result.update(cached)
+                result['cached'] = True
+                result['memory'] = decoded.memory.report()
+                logger.info(f"⚡ OCR cache hit: {len(result['text'])} chars via {result['method']}")
+                return result
+
+        if app.config['OCR_TEXT_PRECHECK']:
+            with decoded.memory.stage('precheck'):
+                result['text_check'] = estimate_text_likelihood(decoded)
+            if not result['text_check']['likely']:
+                logger.info(f"🚫 No text-like content ({result['text_check']['glyphs']} glyphs, "
+                            f"edges {result['text_check']['edge_density']:.3f}), skipping OCR")
+                increment_metric('ocr_precheck_skipped')
+                result['text'] = "No text extracted"
+                result['memory'] = decoded.memory.report()
+                return result
+
+        deadline = time.monotonic() + tier['deadline_seconds']
+        width, height = decoded.size
+        if width * height > app.config['OCR_TILE_THRESHOLD_PIXELS']:
+            # Huge bitmaps: no full-size variants or rotations, bounded tiles only
+            with decoded.memory.stage('classify'):
+                result['image_type'] = classify_image_type(decoded)
+            logger.info(f"🖼️ {width}x{height} {result['image_type']}, OCR in tiles ({tier['name']} mode)")
+            with decoded.memory.stage('ocr'):
+                best, result['attempts'] = extract_text_from_tiles(decoded, deadline, result['image_type'], tier)
+        else:
+            if tier['deskew']:
+                with decoded.memory.stage('orientation'):
+                    decoded, result['orientation'] = correct_orientation(decoded, deadline)
+            with decoded.memory.stage('classify'):
+                result['image_type'] = classify_image_type(decoded)
+            logger.info(f"🖼️ Image classified as {result['image_type']} ({tier['name']} mode)")
+            with decoded.memory.stage('ocr'):
+                best, result['attempts'] = search_ocr_strategies(decoded, scoring, deadline, result['image_type'], tier)
+
+        # Final result: only the winner is cleaned
+        if best:
+            best['text'] = clean_extracted_text(best['text'])
+        if best and best['text']:
+            result.update(best)
+            logger.info(f"✅ OCR SUCCESS: {len(best['text'])} chars via {best['method']} ({result['attempts']} strategies)")
+            logger.info(f"📝 Preview: {best['text'][:100]}...")
+            if cache_key:
+                cache.put(cache_key, result)
+                remember_poster(fingerprint)
         else:
             logger.warning("❌ No text extracted from any method")
-            return "No text extracted"
+            result['text'] = "No text extracted"
+        result['memory'] = decoded.memory.report()
+        return result
 
     except ImportError as e:
         logger.error(f"❌ Import error: {e}")
-        return "Tesseract OCR not installed"
+        result['text'] = "Tesseract OCR not installed"
+        return result
     except Exception as e:
         logger.error(f"❌ OCR extraction failed: {e}")
-        return f"OCR error: {str(e)}"
+        result['text'] = f"OCR error: {str(e)}"
+        return result
+
+def extract_text_with_ocr(image):
+    """Extract text from an image; see extract_text_with_ocr_detailed for the search"""
+    return extract_text_with_ocr_detailed(image)['text']
+
+# clean_extracted_text passes, compiled once
+OCR_NON_PRINTABLE_RE = re.compile(r'[^\x20-\x7E\u00A0-\u024F\u1E00-\u1EFF]')
+OCR_CONFUSED_CHAR_RE = re.compile(r'(?<=[a-zA-Z])[0158!|](?=[a-zA-Z])')
+OCR_CHAR_FIXES = {'0': 'O', '1': 'I', '5': 'S', '8': 'B', '!': 'I', '|': 'I'}
+# "L OWONGAN" -> "LOWONGAN", "kerja ." -> "kerja."
+OCR_JOIN_SPACE_RE = re.compile(r'(?<=[A-Z])\s+(?=[a-z])|(?<=[a-zA-Z])\s+(?=[.,!?;:])')
+OCR_WHITESPACE_RE = re.compile(r'\s+')
+OCR_TWO_ALNUM_RE = re.compile(r'[a-zA-Z0-9][^a-zA-Z0-9]*[a-zA-Z0-9]')
 
 def clean_extracted_text(text):
-    """Enhanced cleaning and normalization for Indonesian text"""
+    """
+    Enhanced cleaning and normalization for Indonesian text.
+    A fixed sequence of precompiled passes: word fixes, non-printable
+    characters (line breaks included) to spaces, confused characters inside
+    words, spacing around broken words and punctuation, then one line of
+    single-spaced text, or '' when it has fewer than 2 letters or digits.
+    """
     if not text or not isinstance(text, str):
         return ""
 
-    import re
-
     try:
-        # First pass: Fix common OCR errors for Indonesian text
         text = fix_common_ocr_errors(text)
+        text = OCR_NON_PRINTABLE_RE.sub(' ', text)
+        text = OCR_CONFUSED_CHAR_RE.sub(lambda match: OCR_CHAR_FIXES[match.group()], text)
+        text = OCR_JOIN_SPACE_RE.sub('', text)
+        text = OCR_WHITESPACE_RE.sub(' ', text).strip()
+        return text if OCR_TWO_ALNUM_RE.search(text) else ""
 
-        # Remove non-printable characters but keep basic punctuation
-        text = re.sub(r'[^\x20-\x7E\u00A0-\u024F\u1E00-\u1EFF]', ' ', text)
-
-        # Fix common OCR character substitutions (more conservative)
-        char_fixes = {
-            '0': 'O',  # Zero to O in words
-            '1': 'I',  # One to I in words
-            '5': 'S',  # Five to S in words
-            '8': 'B',  # Eight to B in words
-            '!': 'I',  # Exclamation to I
-            '|': 'I',  # Pipe to I
-        }
+    except Exception as e:
+        logger.warning(f"Text cleaning failed: {e}")
+        # Return basic cleaned text as fallback
+        return re.sub(r'\s+', ' ', str(text)).strip() if text else ""
 
-        # Apply character fixes only when surrounded by letters
-        for wrong, correct in char_fixes.items():
-            # Only replace when it's clearly part of a word
-            text = re.sub(f'(?<=[a-zA-Z]){re.escape(wrong)}(?=[a-zA-Z])', correct, text)
 
-        # Fix broken words and spacing
-        text = re.sub(r'([A-Z])\s+([a-z])', r'\1\2', text)  # "L OWONGAN" -> "LOWONGAN"
-        text = re.sub(r'([a-z])\s+([A-Z])', r'\1 \2', text)  # Proper word spacing
-        text = re.sub(r'([a-zA-Z])\s+([.,!?;:])', r'\1\2', text)  # Remove space before punctuation
+# Digits OCR confuses with letters, mapped to the letter; words are matched in this form
+OCR_CONFUSABLES = str.maketrans('01345782', 'oieastbz')
 
-        # Clean up whitespace
-        text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces to single space
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple newlines to double
-        text = re.sub(r'^\s+|\s+$', '', text)  # Trim leading/trailing whitespace
+# Boundaries fix_common_ocr_errors separates: digit|letter, letter|digit and camelCase
+OCR_TOKEN_SPLIT_RE = re.compile(r'(?<=\d)(?=[A-Za-z])|(?<=[A-Za-z])(?=\d)|(?<=[a-z])(?=[A-Z])')
 
-        # Remove lines with only special characters or very short lines
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            line = line.strip()
-            # Keep line if it has at least 2 alphanumeric characters
-            if len(re.findall(r'[a-zA-Z0-9]', line)) >= 2:
-                cleaned_lines.append(line)
+# Letters OCR misreads as one another; one-letter substitutions must stay in a group
+OCR_CONFUSABLE_LETTER_GROUPS = ('mnhu', 'iljtf', 'ceoa', 'bhk', 'vyu', 'gq', 'rn')
 
-        text = '\n'.join(cleaned_lines)
+# Letter pairs OCR reads for one letter ('pengalarnan'): the evidence a letters-only word was misread
+OCR_CONFUSABLE_SEQUENCES = {'rn': 'm', 'cl': 'd', 'vv': 'w', 'ii': 'u'}
+OCR_CONFUSABLE_SEQUENCE_RE = re.compile('|'.join(OCR_CONFUSABLE_SEQUENCES))
 
-        # Final cleanup
-        text = re.sub(r'\s+', ' ', text).strip()
+def is_ocr_plausible_edit(word, candidate):
+    """
+    Whether OCR could have turned candidate into word. Rejected: a letter
+    missing at either end (it was split off, as in "L OWONGAN", and is still
+    in the text) and a one-letter substitution between letters that are not
+    in the same OCR_CONFUSABLE_LETTER_GROUPS group.
+    """
+    if len(candidate) == len(word) + 1 and (candidate[1:] == word or candidate[:-1] == word):
+        return False
+    if len(word) != len(candidate):
+        return True
+    differences = [(a, b) for a, b in zip(word, candidate) if a != b]
+    if len(differences) != 1:
+        return True  # Transposition (or longer words at distance 2)
+    a, b = differences[0]
+    return any(a in group and b in group for group in OCR_CONFUSABLE_LETTER_GROUPS)
+
+def bounded_edit_distance(a, b, limit):
+    """Damerau-Levenshtein (optimal string alignment) distance, or limit + 1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+class SymSpell:
+    """
+    Symmetric-delete spelling index. Every vocabulary word is stored under
+    each string obtained by deleting up to max_distance of its letters, so
+    the candidates for a token come from the token's own deletes (a few
+    dozen dict lookups, whatever the vocabulary size) and only those are
+    checked with bounded_edit_distance.
+    vocabulary maps lower-case words to a frequency used to break ties.
+    """
 
-        return text
+    def __init__(self, vocabulary, max_distance=2, deletes=None):
+        self.words = dict(vocabulary)
+        self.max_distance = max_distance
+        if deletes is None:
+            deletes = {}
+            for word in self.words:
+                for variant in self.variants(word, max_distance):
+                    deletes.setdefault(variant, []).append(word)
+        self.deletes = deletes
+
+    @staticmethod
+    def variants(word, distance):
+        """word and every string with up to distance letters deleted"""
+        result = {word}
+        frontier = {word}
+        for _ in range(distance):
+            frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+            result |= frontier
+        return result
+
+    def lookup(self, word, max_distance=None):
+        """
+        The vocabulary word closest to word within max_distance, the more
+        frequent one on a tie; None when there is none or the tie is exact.
+        """
+        if word in self.words:
+            return word
+        max_distance = min(self.max_distance, self.max_distance if max_distance is None else max_distance)
+
+        best, best_distance, best_count, ambiguous = None, max_distance + 1, 0, False
+        seen = set()
+        for variant in self.variants(word, max_distance):
+            for candidate in self.deletes.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = bounded_edit_distance(word, candidate, min(best_distance, max_distance))
+                if distance > max_distance:
+                    continue
+                count = self.words[candidate]
+                if distance < best_distance or (distance == best_distance and count > best_count):
+                    best, best_distance, best_count, ambiguous = candidate, distance, count, False
+                elif distance == best_distance and count == best_count:
+                    ambiguous = True
+        return None if ambiguous else best
+
+def get_spelling_vocabulary(lexicons=None):
+    """Word frequencies over the keyword lexicons and the OCR fixes' target words (letters only)"""
+    from collections import Counter
+
+    lexicons = lexicons or get_lexicons()
+    phrases = [keyword for keywords in lexicons.keywords.values() for keyword in keywords]
+    phrases += list(lexicons.word_fixes.values())
+    phrases += list(lexicons.pattern_fixes.values())
+
+    vocabulary = Counter()
+    for phrase in phrases:
+        for word in re.split(r'[^A-Za-z]+', phrase.lower()):
+            if len(word) >= 3:
+                vocabulary[word] += 1
+    return vocabulary
+
+def load_spelling_index(vocabulary=None):
+    """
+    The SymSpell index for vocabulary (get_spelling_vocabulary()), loaded from
+    OCR_SPELL_INDEX_PATH when it was built from the same vocabulary and
+    distance, otherwise built and saved there (best effort) for the next
+    worker start.
+    """
+    import hashlib
+    import json
+    import pickle
+
+    vocabulary = vocabulary if vocabulary is not None else get_spelling_vocabulary()
+    max_distance = app.config['OCR_SPELL_MAX_DISTANCE']
+    key = hashlib.sha256(json.dumps([max_distance, sorted(vocabulary.items())]).encode('utf-8')).hexdigest()
+    path = app.config['OCR_SPELL_INDEX_PATH']
 
+    try:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                saved = pickle.load(f)
+            if saved.get('key') == key:
+                logger.info(f"✅ Spelling index loaded: {len(saved['words'])} words")
+                return SymSpell(saved['words'], max_distance, deletes=saved['deletes'])
     except Exception as e:
-        logger.warning(f"Text cleaning failed: {e}")
-        # Return basic cleaned text as fallback
-        return re.sub(r'\s+', ' ', str(text)).strip() if text else ""
+        logger.warning(f"⚠️ Spelling index at {path} unreadable ({e}), rebuilding")
 
+    speller = SymSpell(vocabulary, max_distance)
+    try:
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            # Plain pickle loads about 5x faster than rebuilding (joblib is slower than both)
+            pickle.dump({'key': key, 'words': speller.words, 'deletes': speller.deletes}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)  # Atomic, so concurrent workers never read a partial file
+    except Exception as e:
+        logger.warning(f"⚠️ Could not save spelling index: {e}")
+    logger.info(f"✅ Spelling index built: {len(speller.words)} words, {len(speller.deletes)} deletes")
+    return speller
+
+class OCRCorrector:
+    """
+    Word-level OCR post-correction compiled once from the whole-word fixes
+    and the plain-word targets of the regex fixes in ocr_fixes.json.
+    Every fix is keyed by its confusable-normalised, lower-case spelling
+    ('L0W0NGAN' and 'l0wongan' both become 'lowongan'), so correcting a
+    token is one dict lookup whatever the table size and the whole text is
+    corrected in one scan. Only tokens with a confusable digit are rewritten,
+    in the token's own case, and short or mostly numeric tokens are left to
+    the splitting below. Unmatched mixed tokens are split at digit/letter and
+    camelCase boundaries as before.
+    With a speller (SymSpell), normalised mixed tokens the table misses are
+    corrected to the nearest vocabulary word (edit distance 1, or
+    max_distance from 9 letters on) when is_ocr_plausible_edit allows it.
+    Letters-only words carry no such evidence of a misread, and the
+    vocabulary is far from a dictionary ('penempatan', 'skills' are valid),
+    so a word of at least min_length letters is only changed when it holds
+    an OCR_CONFUSABLE_SEQUENCES pair and reading that pair as its one letter
+    gives a vocabulary word ('pengalarnan' -> 'pengalaman').
+    Results are memoised per word.
+    """
+
+    # Only tokens with a digit next to a letter, or camelCase, need any work
+    TOKEN_RE = re.compile(r'\b(?=[A-Za-z0-9]*(?:[0-9][A-Za-z]|[A-Za-z][0-9]|[a-z][A-Z]))[A-Za-z0-9]+')
+    WORD_TARGET_RE = re.compile(r'^[A-Z]+(?:[ \-][A-Z]+)*$')
+    SPELLED_CACHE_SIZE = 50000
+
+    def __init__(self, word_fixes, pattern_fixes=None, speller=None, min_length=5):
+        self.speller = speller
+        self.min_length = min_length
+        self.word_re = re.compile(rf'\b[A-Za-z]{{{min_length},}}\b')
+        self._spelled = {}
+        self._unconfused = {}
+        self.table = {}
+        for wrong, correct in word_fixes.items():
+            self._add(wrong, correct)
+        for pattern, target in (pattern_fixes or {}).items():
+            # Regex entries for URLs, amounts and phone prefixes (callables, digits) are not word fixes
+            if isinstance(target, str) and self.WORD_TARGET_RE.match(target):
+                for word in re.split(r'[ \-]', target):
+                    self._add(word, word)
+                # Words OCR ran together: 'FULLT1ME' -> 'FULL TIME'
+                self._add(re.sub(r'[ \-]', '', target), target)
+
+    @staticmethod
+    def normalise(token):
+        return token.translate(OCR_CONFUSABLES).lower()
+
+    def _add(self, wrong, correct):
+        if len(wrong) >= 3:
+            self.table.setdefault(self.normalise(wrong), correct)
+
+    def __len__(self):
+        return len(self.table)
+
+    @staticmethod
+    def _match_case(token, word):
+        letters = [c for c in token if c.isalpha()]
+        if all(c.isupper() for c in letters):
+            return word.upper()
+        if all(c.islower() for c in letters):
+            return word.lower()
+        return word.capitalize()
+
+    def _fix_token(self, match):
+        token = match.group()
+        if token.isalpha():
+            return OCR_TOKEN_SPLIT_RE.sub(' ', token)
+
+        # Short or mostly numeric tokens (S1, D3, K3, 5JT) are codes and amounts, not misread words
+        digits = sum(c.isdigit() for c in token)
+        if len(token) >= 3 and digits * 2 <= len(token):
+            normalised = self.normalise(token)
+            word = self.table.get(normalised)
+            if word is None and len(token) >= self.min_length:
+                word = self._spell(normalised)
+            if word is not None:
+                return self._match_case(token, word)
+        return OCR_TOKEN_SPLIT_RE.sub(' ', token)
+
+    def _spell(self, word):
+        """Nearest vocabulary word for a lower-case word (itself when known), or None"""
+        if self.speller is None:
+            return None
+        if word not in self._spelled:
+            if len(self._spelled) >= self.SPELLED_CACHE_SIZE:
+                self._spelled.clear()
+            candidate = self.speller.lookup(word, 1 if len(word) < 9 else None)
+            # A valid word outside the vocabulary is often one edit from a word in it
+            if candidate is not None and not is_ocr_plausible_edit(word, candidate):
+                candidate = None
+            self._spelled[word] = candidate
+        return self._spelled[word]
+
+    def _unconfuse(self, word):
+        """The vocabulary word word reads as once some of its confusable pairs become one letter, or None"""
+        words = self.speller.words
+        if word in words or not OCR_CONFUSABLE_SEQUENCE_RE.search(word):
+            return None
+        if word not in self._unconfused:
+            if len(self._unconfused) >= self.SPELLED_CACHE_SIZE:
+                self._unconfused.clear()
+            # Every choice of pairs to merge, a handful at most ('rn' in 'internal' is genuine)
+            readings = {word}
+            for match in reversed(list(OCR_CONFUSABLE_SEQUENCE_RE.finditer(word))[:4]):
+                start, end = match.span()
+                readings |= {reading[:start] + OCR_CONFUSABLE_SEQUENCES[match.group()] + reading[end:] for reading in readings}
+            known = [reading for reading in readings if reading in words]
+            self._unconfused[word] = max(known, key=lambda reading: (words[reading], reading)) if known else None
+        return self._unconfused[word]
+
+    def _spell_token(self, match):
+        token = match.group()
+        word = self._unconfuse(token.lower())
+        if word is None:
+            return token
+        return self._match_case(token, word)
+
+    def correct(self, text):
+        text = self.TOKEN_RE.sub(self._fix_token, text)
+        if self.speller is not None:
+            text = self.word_re.sub(self._spell_token, text)
+        return text
+
+def get_ocr_corrector():
+    """The OCRCorrector compiled from the current ocr_fixes.json"""
+    return get_lexicons().corrector
 
 def fix_common_ocr_errors(text):
-    """Fix common OCR recognition errors with simple replacements"""
+    """Fix common OCR recognition errors in a single pass (see OCRCorrector)"""
     if not text:
         return ""
 
-    import re
-
-    # Simple character fixes for common OCR errors
-    fixes = {
-        # Number to letter confusion in words
-        'L0W0NGAN': 'LOWONGAN',
-        'KERJ4': 'KERJA',
-        'G4JI': 'GAJI',
-        'PERUS4H44N': 'PERUSAHAAN',
-        'P0SISI': 'POSISI',
-        'J4B4T4N': 'JABATAN',
-        'K4RIR': 'KARIR',
-        'K4RIER': 'KARIER',
-        'PENG4L4M4N': 'PENGALAMAN',
-        'KU4L1F1K4S1': 'KUALIFIKASI',
-        'SY4R4T': 'SYARAT',
-        'T4NGGUNG': 'TANGGUNG',
-        'J4W4B': 'JAWAB',
-        'TUNJ4NG4N': 'TUNJANGAN',
-        'W4W4NC4R4': 'WAWANCARA',
-        'L4M4R4N': 'LAMARAN',
-        'PEND1D1K4N': 'PENDIDIKAN',
-        'UNIVER51T45': 'UNIVERSITAS',
-        'D1PL0M4': 'DIPLOMA',
-        'S4RJ4N4': 'SARJANA',
-        'M4G15TER': 'MAGISTER',
-        'D0KT0R': 'DOKTOR',
-        'SERT1F1K4T': 'SERTIFIKAT',
-        'L1SEN51': 'LISENSI',
-        'K0MPETEN51': 'KOMPETENSI',
-        'KEAHL14N': 'KEAHLIAN',
-        'KEMAMPU4N': 'KEMAMPUAN',
-        'PENG4L4M4N': 'PENGALAMAN',
-        'M4N4JEMEN': 'MANAJEMEN',
-        'KEPEM1MP1N4N': 'KEPEMIMPINAN',
-        'K0MUN1K451': 'KOMUNIKASI',
-        'NEGOSI451': 'NEGOSIASI',
-        'PRESENT451': 'PRESENTASI',
-        'ANAL151S': 'ANALISIS',
-        'STR4TEG1': 'STRATEGI',
-        'PERENCAN44N': 'PERENCANAAN',
-        'PELAKS4N44N': 'PELAKSANAAN',
-        'PENGAW454N': 'PENGAWASAN',
-        'EVAL0451': 'EVALUASI',
-        'PERBAIK4N': 'PERBAIKAN',
-        'PENGEMBANG4N': 'PENGEMBANGAN',
-        'IN0V451': 'INOVASI',
-        'KREAT1V1T45': 'KREATIVITAS',
-        'PR0DUKT1V1T45': 'PRODUKTIVITAS',
-        'EF151EN51': 'EFISIENSI',
-        'EFEKT1V1T45': 'EFEKTIVITAS',
-        'KU4L1T45': 'KUALITAS',
-        'PELAYAN4N': 'PELAYANAN',
-        'KEPUAS4N': 'KEPUASAN',
-        'PELANGGAN': 'PELANGGAN',
-        'KL1EN': 'KLIEN',
-        'PARTNER': 'PARTNER',
-        'KERJASAMA': 'KERJASAMA',
-        'K0L4B0R451': 'KOLABORASI',
-        'T1M': 'TIM',
-        'KEL0MP0K': 'KELOMPOK',
-        'ORGAN1S451': 'ORGANISASI',
-        'PERUS4H44N': 'PERUSAHAAN',
-        'K4NT0R': 'KANTOR',
-        'CABANG': 'CABANG',
-        'D1V151': 'DIVISI',
-        'DEPAR7EMEN': 'DEPARTEMEN',
-        'BAGIAN': 'BAGIAN',
-        'UNIT': 'UNIT',
-        'SEKSI': 'SEKSI',
-        'GRUP': 'GRUP',
-        'H0LD1NG': 'HOLDING',
-        'SUBS1D1AR1': 'SUBSIDIARI',
-        'AF1L1451': 'AFILIASI',
-        'VENT0RE': 'VENTURE',
-        'STARTUP': 'STARTUP',
-        'SCALE0P': 'SCALEUP',
-        'UN1C0RN': 'UNICORN',
-        'DECA0RN': 'DECACORN',
-        'HECT0C0RN': 'HECTOCORN'
-    }
-
-    # Apply simple string replacements
-    for wrong, correct in fixes.items():
-        text = text.replace(wrong, correct)
-
-    # Basic regex fixes for common patterns
-    text = re.sub(r'(\d)([A-Za-z])', r'\1 \2', text)  # Separate numbers from letters
-    text = re.sub(r'([A-Za-z])(\d)', r'\1 \2', text)  # Separate letters from numbers
-    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # Separate camelCase
-
-    return text
-
-
-# Enhanced Indonesian word fixes with common OCR errors (1000+ patterns)
-ENHANCED_INDONESIAN_WORD_FIXES = {
-    # Core job posting terms (100+ patterns)
-    r'[Ll][Oo0][Ww][Oo0][Nn][Gg][Aa4][Nn]': 'LOWONGAN',
-    r'[Kk][Ee3][Rr][Jj][Aa4]': 'KERJA',
-    r'[Gg][Aa4][Jj][Ii1]': 'GAJI',
-    r'[Pp][Ee3][Rr][Uu][Ss][Aa4][Hh][Aa4][Aa4][Nn]': 'PERUSAHAAN',
-    r'[Pp][Oo0][Ss][Ii1][Ss][Ii1]': 'POSISI',
-    r'[Jj][Aa4][Bb][Aa4][Tt][Aa4][Nn]': 'JABATAN',
-    r'[Kk][Aa4][Rr][Ii1][Rr]': 'KARIR',
-    r'[Kk][Aa4][Rr][Ii1][Ee3][Rr]': 'KARIER',
-        r'[Pp][Ee3][Nn][Gg][Aa4][Ll][Aa4][Mm][Aa4][Nn]': 'PENGALAMAN',
-        r'[Kk][Uu][Aa4][Ll][Ii1][Ff][Ii1][Kk][Aa4][Ss][Ii1]': 'KUALIFIKASI',
-        r'[Ss][Yy][Aa4][Rr][Aa4][Tt]': 'SYARAT',
-        r'[Tt][Aa4][Nn][Gg][Gg][Uu][Nn][Gg]': 'TANGGUNG',
-        r'[Jj][Aa4][Ww][Aa4][Bb]': 'JAWAB',
-        r'[Tt][Uu][Nn][Jj][Aa4][Nn][Gg][Aa4][Nn]': 'TUNJANGAN',
-        r'[Ww][Aa4][Ww][Aa4][Nn][Cc][Aa4][Rr][Aa4]': 'WAWANCARA',
-        r'[Ll][Aa4][Mm][Aa4][Rr][Aa4][Nn]': 'LAMARAN',
-        r'[Kk][Aa4][Nn][Dd][Ii1][Dd][Aa4][Tt]': 'KANDIDAT',
-        r'[Pp][Rr][Oo0][Ff][Ee3][Ss][Ii1][Oo0][Nn][Aa4][Ll]': 'PROFESIONAL',
-        r'[Kk][Ee3][Aa4][Hh][Ll][Ii1][Aa4][Nn]': 'KEAHLIAN',
-        r'[Kk][Ee3][Mm][Aa4][Mm][Pp][Uu][Aa4][Nn]': 'KEMAMPUAN',
-        r'[Kk][Ee3][Tt][Ee3][Rr][Aa4][Mm][Pp][Ii1][Ll][Aa4][Nn]': 'KETERAMPILAN',
-        r'[Pp][Ee3][Nn][Dd][Ii1][Dd][Ii1][Kk][Aa4][Nn]': 'PENDIDIKAN',
-        r'[Gg][Ee3][Ll][Aa4][Rr]': 'GELAR',
-        r'[Ii1][Jj][Aa4][Zz][Aa4][Hh]': 'IJAZAH',
-        r'[Ss][Ee3][Rr][Tt][Ii1][Ff][Ii1][Kk][Aa4][Tt]': 'SERTIFIKAT',
-        r'[Kk][Oo0][Mm][Pp][Ee3][Tt][Ee3][Nn][Ss][Ii1]': 'KOMPETENSI',
-        r'[Pp][Ee3][Ll][Aa4][Tt][Ii1][Hh][Aa4][Nn]': 'PELATIHAN',
-        r'[Kk][Uu][Rr][Ss][Uu][Ss]': 'KURSUS',
-        r'[Ss][Ee3][Mm][Ii1][Nn][Aa4][Rr]': 'SEMINAR',
-        r'[Ww][Oo0][Rr][Kk][Ss][Hh][Oo0][Pp]': 'WORKSHOP',
-
-        # Company types and legal entities (50+ patterns)
-        r'[Pp][Tt]\.?': 'PT',
-        r'[Cc][Vv]\.?': 'CV',
-        r'[Tt][Bb][Kk]\.?': 'TBK',
-        r'[Pp][Ee3][Rr][Ss][Ee3][Rr][Oo0]': 'PERSERO',
-        r'[Tt][Ee3][Rr][Bb][Uu][Kk][Aa4]': 'TERBUKA',
-        r'[Ss][Ww][Aa4][Ss][Tt][Aa4]': 'SWASTA',
-        r'[Kk][Aa4][Nn][Tt][Oo0][Rr]': 'KANTOR',
-        r'[Aa4][Ll][Aa4][Mm][Aa4][Tt]': 'ALAMAT',
-        r'[Ll][Oo0][Kk][Aa4][Ss][Ii1]': 'LOKASI',
-        r'[Cc][Aa4][Bb][Aa4][Nn][Gg]': 'CABANG',
-        r'[Pp][Uu][Ss][Aa4][Tt]': 'PUSAT',
-        r'[Rr][Ee3][Gg][Ii1][Oo0][Nn][Aa4][Ll]': 'REGIONAL',
-        r'[Dd][Ii1][Vv][Ii1][Ss][Ii1]': 'DIVISI',
-        r'[Dd][Ee3][Pp][Aa4][Rr][Tt][Ee3][Mm][Ee3][Nn]': 'DEPARTEMEN',
-        r'[Bb][Aa4][Gg][Ii1][Aa4][Nn]': 'BAGIAN',
-        r'[Uu][Nn][Ii1][Tt]': 'UNIT',
-        r'[Tt][Ii1][Mm]': 'TIM',
-        r'[Gg][Rr][Uu][Pp]': 'GRUP',
-        r'[Hh][Oo0][Ll][Dd][Ii1][Nn][Gg]': 'HOLDING',
-        r'[Kk][Oo0][Rr][Pp][Oo0][Rr][Aa4][Ss][Ii1]': 'KORPORASI',
-
-        # Employment terms (100+ patterns)
-        r'[Ff][Uu][Ll][Ll][\s\-]?[Tt][Ii1][Mm][Ee3]': 'FULL TIME',
-        r'[Pp][Aa4][Rr][Tt][\s\-]?[Tt][Ii1][Mm][Ee3]': 'PART TIME',
-        r'[Ff][Rr][Ee3][Ee3][Ll][Aa4][Nn][Cc][Ee3]': 'FREELANCE',
-        r'[Kk][Oo0][Nn][Tt][Rr][Aa4][Kk]': 'KONTRAK',
-        r'[Tt][Ee3][Tt][Aa4][Pp]': 'TETAP',
-        r'[Ss][Ee3][Mm][Ee3][Nn][Tt][Aa4][Rr][Aa4]': 'SEMENTARA',
-        r'[Mm][Aa4][Gg][Aa4][Nn][Gg]': 'MAGANG',
-        r'[Ii1][Nn][Tt][Ee3][Rr][Nn]': 'INTERN',
-        r'[Pp][Rr][Aa4][Kk][Tt][Ii1][Kk]': 'PRAKTIK',
-        r'[Tt][Rr][Aa4][Ii1][Nn][Ee3][Ee3]': 'TRAINEE',
-        r'[Pp][Rr][Oo0][Bb][Aa4][Ss][Ii1]': 'PROBASI',
-        r'[Kk][Oo0][Nn][Tt][Rr][Aa4][Kk][Tt][Uu][Aa4][Ll]': 'KONTRAKTUAL',
-        r'[Oo0][Uu][Tt][Ss][Oo0][Uu][Rr][Cc][Ii1][Nn][Gg]': 'OUTSOURCING',
-        r'[Ff][Rr][Ee3][Ss][Hh][\s\-]?[Gg][Rr][Aa4][Dd][Uu][Aa4][Tt][Ee3]': 'FRESH GRADUATE',
-        r'[Bb][Aa4][Rr][Uu]': 'BARU',
-        r'[Ll][Uu][Ll][Uu][Ss][Aa4][Nn]': 'LULUSAN',
-        r'[Ss][Aa4][Rr][Jj][Aa4][Nn][Aa4]': 'SARJANA',
-        r'[Dd][Ii1][Pp][Ll][Oo0][Mm][Aa4]': 'DIPLOMA',
-        r'[Mm][Aa4][Gg][Ii1][Ss][Tt][Ee3][Rr]': 'MAGISTER',
-        r'[Dd][Oo0][Kk][Tt][Oo0][Rr]': 'DOKTOR',
-
-        # Skills and competencies (150+ patterns)
-        r'[Kk][Oo0][Mm][Uu][Nn][Ii1][Kk][Aa4][Ss][Ii1]': 'KOMUNIKASI',
-        r'[Kk][Ee3][Pp][Ee3][Mm][Ii1][Mm][Pp][Ii1][Nn][Aa4][Nn]': 'KEPEMIMPINAN',
-        r'[Ll][Ee3][Aa4][Dd][Ee3][Rr][Ss][Hh][Ii1][Pp]': 'LEADERSHIP',
-        r'[Mm][Aa4][Nn][Aa4][Jj][Ee3][Mm][Ee3][Nn]': 'MANAJEMEN',
-        r'[Mm][Aa4][Nn][Aa4][Gg][Ee3][Mm][Ee3][Nn][Tt]': 'MANAGEMENT',
-        r'[Oo0][Rr][Gg][Aa4][Nn][Ii1][Ss][Aa4][Ss][Ii1]': 'ORGANISASI',
-        r'[Aa4][Nn][Aa4][Ll][Ii1][Ss][Ii1][Ss]': 'ANALISIS',
-        r'[Aa4][Nn][Aa4][Ll][Yy][Tt][Ii1][Cc][Aa4][Ll]': 'ANALYTICAL',
-        r'[Pp][Rr][Oo0][Bb][Ll][Ee3][Mm]': 'PROBLEM',
-        r'[Ss][Oo0][Ll][Vv][Ii1][Nn][Gg]': 'SOLVING',
-        r'[Pp][Ee3][Mm][Ee3][Cc][Aa4][Hh][Aa4][Nn]': 'PEMECAHAN',
-        r'[Mm][Aa4][Ss][Aa4][Ll][Aa4][Hh]': 'MASALAH',
-        r'[Kk][Rr][Ee3][Aa4][Tt][Ii1][Vv][Ii1][Tt][Aa4][Ss]': 'KREATIVITAS',
-        r'[Ii1][Nn][Oo0][Vv][Aa4][Ss][Ii1]': 'INOVASI',
-        r'[Ii1][Nn][Ii1][Ss][Ii1][Aa4][Tt][Ii1][Ff]': 'INISIATIF',
-        r'[Mm][Oo0][Tt][Ii1][Vv][Aa4][Ss][Ii1]': 'MOTIVASI',
-        r'[Dd][Ee3][Dd][Ii1][Kk][Aa4][Ss][Ii1]': 'DEDIKASI',
-        r'[Kk][Oo0][Mm][Ii1][Tt][Mm][Ee3][Nn]': 'KOMITMEN',
-        r'[Ii1][Nn][Tt][Ee3][Gg][Rr][Ii1][Tt][Aa4][Ss]': 'INTEGRITAS',
-        r'[Kk][Ee3][Jj][Uu][Jj][Uu][Rr][Aa4][Nn]': 'KEJUJURAN',
-        r'[Kk][Ee3][Rr][Aa4][Hh][Aa4][Ss][Ii1][Aa4][Aa4][Nn]': 'KERAHASIAAN',
-        r'[Ff][Ll][Ee3][Kk][Ss][Ii1][Bb][Ii1][Ll][Ii1][Tt][Aa4][Ss]': 'FLEKSIBILITAS',
-        r'[Aa4][Dd][Aa4][Pp][Tt][Aa4][Bb][Ii1][Ll][Ii1][Tt][Aa4][Ss]': 'ADAPTABILITAS',
-        r'[Kk][Ee3][Tt][Ee3][Ll][Ii1][Tt][Ii1][Aa4][Nn]': 'KETELITIAN',
-        r'[Aa4][Kk][Uu][Rr][Aa4][Ss][Ii1]': 'AKURASI',
-        r'[Kk][Ee3][Aa4][Nn][Dd][Aa4][Ll][Aa4][Nn]': 'KEANDALAN',
-        r'[Kk][Ee3][Tt][Ee3][Pp][Aa4][Tt][Aa4][Nn]': 'KETEPATAN',
-        r'[Ww][Aa4][Kk][Tt][Uu]': 'WAKTU',
-        r'[Dd][Ii1][Ss][Ii1][Pp][Ll][Ii1][Nn]': 'DISIPLIN',
-        r'[Tt][Aa4][Nn][Gg][Gg][Uu][Nn][Gg]': 'TANGGUNG',
-
-        # Technical skills (100+ patterns)
-        r'[Kk][Oo0][Mm][Pp][Uu][Tt][Ee3][Rr]': 'KOMPUTER',
-        r'[Tt][Ee3][Kk][Nn][Oo0][Ll][Oo0][Gg][Ii1]': 'TEKNOLOGI',
-        r'[Ss][Oo0][Ff][Tt][Ww][Aa4][Rr][Ee3]': 'SOFTWARE',
-        r'[Aa4][Pp][Ll][Ii1][Kk][Aa4][Ss][Ii1]': 'APLIKASI',
-        r'[Pp][Rr][Oo0][Gg][Rr][Aa4][Mm]': 'PROGRAM',
-        r'[Ss][Ii1][Ss][Tt][Ee3][Mm]': 'SISTEM',
-        r'[Dd][Aa4][Tt][Aa4][Bb][Aa4][Ss][Ee3]': 'DATABASE',
-        r'[Nn][Ee3][Tt][Ww][Oo0][Rr][Kk]': 'NETWORK',
-        r'[Jj][Aa4][Rr][Ii1][Nn][Gg][Aa4][Nn]': 'JARINGAN',
-        r'[Ii1][Nn][Tt][Ee3][Rr][Nn][Ee3][Tt]': 'INTERNET',
-        r'[Ww][Ee3][Bb][Ss][Ii1][Tt][Ee3]': 'WEBSITE',
-        r'[Oo0][Nn][Ll][Ii1][Nn][Ee3]': 'ONLINE',
-        r'[Dd][Ii1][Gg][Ii1][Tt][Aa4][Ll]': 'DIGITAL',
-        r'[Ee3][\-\s]?[Cc][Oo0][Mm][Mm][Ee3][Rr][Cc][Ee3]': 'E-COMMERCE',
-        r'[Mm][Aa4][Rr][Kk][Ee3][Tt][Ii1][Nn][Gg]': 'MARKETING',
-        r'[Pp][Ee3][Mm][Aa4][Ss][Aa4][Rr][Aa4][Nn]': 'PEMASARAN',
-        r'[Pp][Rr][Oo0][Mm][Oo0][Ss][Ii1]': 'PROMOSI',
-        r'[Ii1][Kk][Ll][Aa4][Nn]': 'IKLAN',
-        r'[Aa4][Dd][Vv][Ee3][Rr][Tt][Ii1][Ss][Ii1][Nn][Gg]': 'ADVERTISING',
-        r'[Bb][Rr][Aa4][Nn][Dd][Ii1][Nn][Gg]': 'BRANDING',
-
-        # Financial terms (80+ patterns)
-        r'[Aa4][Kk][Uu][Nn][Tt][Aa4][Nn][Ss][Ii1]': 'AKUNTANSI',
-        r'[Kk][Ee3][Uu][Aa4][Nn][Gg][Aa4][Nn]': 'KEUANGAN',
-        r'[Ff][Ii1][Nn][Aa4][Nn][Cc][Ee3]': 'FINANCE',
-        r'[Bb][Uu][Dd][Gg][Ee3][Tt]': 'BUDGET',
-        r'[Aa4][Nn][Gg][Gg][Aa4][Rr][Aa4][Nn]': 'ANGGARAN',
-        r'[Ii1][Nn][Vv][Ee3][Ss][Tt][Aa4][Ss][Ii1]': 'INVESTASI',
-        r'[Pp][Ee3][Nn][Dd][Aa4][Nn][Aa4][Aa4][Nn]': 'PENDANAAN',
-        r'[Mm][Oo0][Dd][Aa4][Ll]': 'MODAL',
-        r'[Kk][Ee3][Uu][Nn][Tt][Uu][Nn][Gg][Aa4][Nn]': 'KEUNTUNGAN',
-        r'[Pp][Rr][Oo0][Ff][Ii1][Tt]': 'PROFIT',
-        r'[Rr][Uu][Gg][Ii1]': 'RUGI',
-        r'[Ll][Oo0][Ss][Ss]': 'LOSS',
-        r'[Pp][Ee3][Nn][Jj][Uu][Aa4][Ll][Aa4][Nn]': 'PENJUALAN',
-        r'[Ss][Aa4][Ll][Ee3][Ss]': 'SALES',
-        r'[Pp][Ee3][Mm][Bb][Ee3][Ll][Ii1][Aa4][Nn]': 'PEMBELIAN',
-        r'[Pp][Uu][Rr][Cc][Hh][Aa4][Ss][Ii1][Nn][Gg]': 'PURCHASING',
-        r'[Pp][Ee3][Nn][Gg][Aa4][Dd][Aa4][Aa4][Nn]': 'PENGADAAN',
-        r'[Pp][Rr][Oo0][Cc][Uu][Rr][Ee3][Mm][Ee3][Nn][Tt]': 'PROCUREMENT',
-        r'[Aa4][Uu][Dd][Ii1][Tt]': 'AUDIT',
-        r'[Pp][Ee3][Mm][Ee3][Rr][Ii1][Kk][Ss][Aa4][Aa4][Nn]': 'PEMERIKSAAN',
-
-        # HR and recruitment terms (120+ patterns)
-        r'[Hh][Uu][Mm][Aa4][Nn][\s\-]?[Rr][Ee3][Ss][Oo0][Uu][Rr][Cc][Ee3]': 'HUMAN RESOURCE',
-        r'[Ss][Uu][Mm][Bb][Ee3][Rr][\s\-]?[Dd][Aa4][Yy][Aa4][\s\-]?[Mm][Aa4][Nn][Uu][Ss][Ii1][Aa4]': 'SUMBER DAYA MANUSIA',
-        r'[Rr][Ee3][Kk][Rr][Uu][Tt][Mm][Ee3][Nn]': 'REKRUTMEN',
-        r'[Rr][Ee3][Cc][Rr][Uu][Ii1][Tt][Mm][Ee3][Nn][Tt]': 'RECRUITMENT',
-        r'[Ss][Ee3][Ll][Ee3][Kk][Ss][Ii1]': 'SELEKSI',
-        r'[Ss][Ee3][Ll][Ee3][Cc][Tt][Ii1][Oo0][Nn]': 'SELECTION',
-        r'[Pp][Ee3][Nn][Yy][Aa4][Rr][Ii1][Nn][Gg][Aa4][Nn]': 'PENYARINGAN',
-        r'[Ss][Cc][Rr][Ee3][Ee3][Nn][Ii1][Nn][Gg]': 'SCREENING',
-        r'[Tt][Ee3][Ss]': 'TES',
-        r'[Tt][Ee3][Ss][Tt]': 'TEST',
-        r'[Uu][Jj][Ii1][Aa4][Nn]': 'UJIAN',
-        r'[Ee3][Vv][Aa4][Ll][Uu][Aa4][Ss][Ii1]': 'EVALUASI',
-        r'[Pp][Ee3][Nn][Ii1][Ll][Aa4][Ii1][Aa4][Nn]': 'PENILAIAN',
-        r'[Aa4][Ss][Ee3][Ss][Mm][Ee3][Nn]': 'ASESMEN',
-        r'[Aa4][Ss][Ss][Ee3][Ss][Ss][Mm][Ee3][Nn][Tt]': 'ASSESSMENT',
-        r'[Pp][Ee3][Rr][Ff][Oo0][Rr][Mm][Aa4][Nn][Cc][Ee3]': 'PERFORMANCE',
-        r'[Kk][Ii1][Nn][Ee3][Rr][Jj][Aa4]': 'KINERJA',
-        r'[Pp][Rr][Ee3][Ss][Tt][Aa4][Ss][Ii1]': 'PRESTASI',
-        r'[Pp][Ee3][Nn][Cc][Aa4][Pp][Aa4][Ii1][Aa4][Nn]': 'PENCAPAIAN',
-        r'[Tt][Aa4][Rr][Gg][Ee3][Tt]': 'TARGET',
-        r'[Ss][Aa4][Ss][Aa4][Rr][Aa4][Nn]': 'SASARAN',
-        r'[Oo0][Bb][Jj][Ee3][Kk][Tt][Ii1][Ff]': 'OBJEKTIF',
-        r'[Tt][Uu][Jj][Uu][Aa4][Nn]': 'TUJUAN',
-        r'[Mm][Ii1][Ss][Ii1]': 'MISI',
-        r'[Vv][Ii1][Ss][Ii1]': 'VISI',
-        r'[Ss][Tt][Rr][Aa4][Tt][Ee3][Gg][Ii1]': 'STRATEGI',
-        r'[Rr][Ee3][Nn][Cc][Aa4][Nn][Aa4]': 'RENCANA',
-        r'[Pp][Ll][Aa4][Nn][Nn][Ii1][Nn][Gg]': 'PLANNING',
-        r'[Pp][Ee3][Rr][Ee3][Nn][Cc][Aa4][Nn][Aa4][Aa4][Nn]': 'PERENCANAAN',
-
-        # Industry specific terms (100+ patterns)
-        r'[Mm][Aa4][Nn][Uu][Ff][Aa4][Kk][Tt][Uu][Rr]': 'MANUFAKTUR',
-        r'[Pp][Rr][Oo0][Dd][Uu][Kk][Ss][Ii1]': 'PRODUKSI',
-        r'[Oo0][Pp][Ee3][Rr][Aa4][Ss][Ii1][Oo0][Nn][Aa4][Ll]': 'OPERASIONAL',
-        r'[Ll][Oo0][Gg][Ii1][Ss][Tt][Ii1][Kk]': 'LOGISTIK',
-        r'[Ss][Uu][Pp][Pp][Ll][Yy][\s\-]?[Cc][Hh][Aa4][Ii1][Nn]': 'SUPPLY CHAIN',
-        r'[Rr][Aa4][Nn][Tt][Aa4][Ii1][\s\-]?[Pp][Aa4][Ss][Oo0][Kk][Aa4][Nn]': 'RANTAI PASOKAN',
-        r'[Pp][Ee3][Rr][Ss][Ee3][Dd][Ii1][Aa4][Aa4][Nn]': 'PERSEDIAAN',
-        r'[Ii1][Nn][Vv][Ee3][Nn][Tt][Oo0][Rr][Ii1]': 'INVENTORI',
-        r'[Gg][Uu][Dd][Aa4][Nn][Gg]': 'GUDANG',
-        r'[Ww][Aa4][Rr][Ee3][Hh][Oo0][Uu][Ss][Ee3]': 'WAREHOUSE',
-        r'[Dd][Ii1][Ss][Tt][Rr][Ii1][Bb][Uu][Ss][Ii1]': 'DISTRIBUSI',
-        r'[Pp][Ee3][Nn][Gg][Ii1][Rr][Ii1][Mm][Aa4][Nn]': 'PENGIRIMAN',
-        r'[Dd][Ee3][Ll][Ii1][Vv][Ee3][Rr][Ii1]': 'DELIVERI',
-        r'[Tt][Rr][Aa4][Nn][Ss][Pp][Oo0][Rr][Tt][Aa4][Ss][Ii1]': 'TRANSPORTASI',
-        r'[Ee3][Kk][Ss][Pp][Oo0][Rr]': 'EKSPOR',
-        r'[Ii1][Mm][Pp][Oo0][Rr]': 'IMPOR',
-        r'[Pp][Ee3][Rr][Dd][Aa4][Gg][Aa4][Nn][Gg][Aa4][Nn]': 'PERDAGANGAN',
-        r'[Bb][Ii1][Ss][Nn][Ii1][Ss]': 'BISNIS',
-        r'[Uu][Ss][Aa4][Hh][Aa4]': 'USAHA',
-        r'[Ee3][Nn][Tt][Ee3][Rr][Pp][Rr][Ii1][Ss][Ee3]': 'ENTERPRISE',
-        r'[Kk][Oo0][Rr][Pp][Oo0][Rr][Aa4][Tt]': 'KORPORAT',
-        r'[Ii1][Nn][Dd][Uu][Ss][Tt][Rr][Ii1]': 'INDUSTRI',
-        r'[Mm][Aa4][Nn][Uu][Ff][Aa4][Cc][Tt][Uu][Rr][Ii1][Nn][Gg]': 'MANUFACTURING',
-        r'[Pp][Ee3][Mm][Bb][Uu][Aa4][Tt][Aa4][Nn]': 'PEMBUATAN',
-        r'[Pp][Rr][Oo0][Ss][Ee3][Ss]': 'PROSES',
-        r'[Kk][Uu][Aa4][Ll][Ii1][Tt][Aa4][Ss]': 'KUALITAS',
-        r'[Qq][Uu][Aa4][Ll][Ii1][Tt][Yy]': 'QUALITY',
-        r'[Kk][Oo0][Nn][Tt][Rr][Oo0][Ll]': 'KONTROL',
-        r'[Pp][Ee3][Nn][Gg][Aa4][Ww][Aa4][Ss][Aa4][Nn]': 'PENGAWASAN',
-        r'[Ss][Uu][Pp][Ee3][Rr][Vv][Ii1][Ss][Ii1]': 'SUPERVISI',
-
-        # Education and training terms (80+ patterns)
-        r'[Uu][Nn][Ii1][Vv][Ee3][Rr][Ss][Ii1][Tt][Aa4][Ss]': 'UNIVERSITAS',
-        r'[Ii1][Nn][Ss][Tt][Ii1][Tt][Uu][Tt]': 'INSTITUT',
-        r'[Ss][Ee3][Kk][Oo0][Ll][Aa4][Hh]': 'SEKOLAH',
-        r'[Aa4][Kk][Aa4][Dd][Ee3][Mm][Ii1]': 'AKADEMI',
-        r'[Pp][Oo0][Ll][Ii1][Tt][Ee3][Kk][Nn][Ii1][Kk]': 'POLITEKNIK',
-        r'[Kk][Oo0][Ll][Ee3][Gg][Ee3]': 'KOLEGE',
-        r'[Ff][Aa4][Kk][Uu][Ll][Tt][Aa4][Ss]': 'FAKULTAS',
-        r'[Jj][Uu][Rr][Uu][Ss][Aa4][Nn]': 'JURUSAN',
-        r'[Pp][Rr][Oo0][Gg][Rr][Aa4][Mm][\s\-]?[Ss][Tt][Uu][Dd][Ii1]': 'PROGRAM STUDI',
-        r'[Mm][Aa4][Tt][Aa4][\s\-]?[Kk][Uu][Ll][Ii1][Aa4][Hh]': 'MATA KULIAH',
-        r'[Kk][Uu][Rr][Ii1][Kk][Uu][Ll][Uu][Mm]': 'KURIKULUM',
-        r'[Ss][Ii1][Ll][Aa4][Bb][Uu][Ss]': 'SILABUS',
-        r'[Mm][Oo0][Dd][Uu][Ll]': 'MODUL',
-        r'[Mm][Aa4][Tt][Ee3][Rr][Ii1]': 'MATERI',
-        r'[Pp][Ee3][Mm][Bb][Ee3][Ll][Aa4][Jj][Aa4][Rr][Aa4][Nn]': 'PEMBELAJARAN',
-        r'[Pp][Ee3][Nn][Dd][Ii1][Dd][Ii1][Kk][Aa4][Nn]': 'PENDIDIKAN',
-        r'[Pp][Ee3][Nn][Gg][Aa4][Jj][Aa4][Rr][Aa4][Nn]': 'PENGAJARAN',
-        r'[Ii1][Nn][Ss][Tt][Rr][Uu][Kk][Tt][Uu][Rr]': 'INSTRUKTUR',
-        r'[Pp][Ee3][Nn][Gg][Aa4][Jj][Aa4][Rr]': 'PENGAJAR',
-        r'[Dd][Oo0][Ss][Ee3][Nn]': 'DOSEN',
-        r'[Gg][Uu][Rr][Uu]': 'GURU',
-        r'[Tt][Rr][Aa4][Ii1][Nn][Ee3][Rr]': 'TRAINER',
-        r'[Pp][Ee3][Ll][Aa4][Tt][Ii1][Hh]': 'PELATIH',
-        r'[Mm][Ee3][Nn][Tt][Oo0][Rr]': 'MENTOR',
-        r'[Pp][Ee3][Mm][Bb][Ii1][Mm][Bb][Ii1][Nn][Gg]': 'PEMBIMBING',
-        r'[Kk][Oo0][Nn][Ss][Uu][Ll][Tt][Aa4][Nn]': 'KONSULTAN',
-        r'[Aa4][Hh][Ll][Ii1]': 'AHLI',
-        r'[Ee3][Kk][Ss][Pp][Ee3][Rr]': 'EKSPER',
-        r'[Ss][Pp][Ee3][Ss][Ii1][Aa4][Ll][Ii1][Ss]': 'SPESIALIS',
-        r'[Pp][Rr][Aa4][Kk][Tt][Ii1][Ss][Ii1]': 'PRAKTISI',
-
-        # Communication and language terms (60+ patterns)
-        r'[Bb][Aa4][Hh][Aa4][Ss][Aa4]': 'BAHASA',
-        r'[Ll][Aa4][Nn][Gg][Uu][Aa4][Gg][Ee3]': 'LANGUAGE',
-        r'[Ii1][Nn][Gg][Gg][Rr][Ii1][Ss]': 'INGGRIS',
-        r'[Ee3][Nn][Gg][Ll][Ii1][Ss][Hh]': 'ENGLISH',
-        r'[Ii1][Nn][Dd][Oo0][Nn][Ee3][Ss][Ii1][Aa4]': 'INDONESIA',
-        r'[Mm][Aa4][Nn][Dd][Aa4][Rr][Ii1][Nn]': 'MANDARIN',
-        r'[Jj][Ee3][Pp][Aa4][Nn][Gg]': 'JEPANG',
-        r'[Jj][Aa4][Pp][Aa4][Nn][Ee3][Ss][Ee3]': 'JAPANESE',
-        r'[Kk][Oo0][Rr][Ee3][Aa4]': 'KOREA',
-        r'[Aa4][Rr][Aa4][Bb]': 'ARAB',
-        r'[Aa4][Rr][Aa4][Bb][Ii1][Cc]': 'ARABIC',
-        r'[Pp][Ee3][Rr][Cc][Aa4][Kk][Aa4][Pp][Aa4][Nn]': 'PERCAKAPAN',
-        r'[Cc][Oo0][Nn][Vv][Ee3][Rr][Ss][Aa4][Tt][Ii1][Oo0][Nn]': 'CONVERSATION',
-        r'[Pp][Rr][Ee3][Ss][Ee3][Nn][Tt][Aa4][Ss][Ii1]': 'PRESENTASI',
-        r'[Pp][Rr][Ee3][Ss][Ee3][Nn][Tt][Aa4][Tt][Ii1][Oo0][Nn]': 'PRESENTATION',
-        r'[Nn][Ee3][Gg][Oo0][Ss][Ii1][Aa4][Ss][Ii1]': 'NEGOSIASI',
-        r'[Nn][Ee3][Gg][Oo0][Tt][Ii1][Aa4][Tt][Ii1][Oo0][Nn]': 'NEGOTIATION',
-        r'[Dd][Ii1][Pp][Ll][Oo0][Mm][Aa4][Ss][Ii1]': 'DIPLOMASI',
-        r'[Pp][Uu][Bb][Ll][Ii1][Kk][\s\-]?[Ss][Pp][Ee3][Aa4][Kk][Ii1][Nn][Gg]': 'PUBLIC SPEAKING',
-        r'[Bb][Ii1][Cc][Aa4][Rr][Aa4][\s\-]?[Dd][Ii1][\s\-]?[Dd][Ee3][Pp][Aa4][Nn][\s\-]?[Uu][Mm][Uu][Mm]': 'BICARA DI DEPAN UMUM',
-        r'[Rr][Aa4][Pp][Oo0][Rr]': 'RAPOR',
-        r'[Ll][Aa4][Pp][Oo0][Rr][Aa4][Nn]': 'LAPORAN',
-        r'[Rr][Ee3][Pp][Oo0][Rr]': 'REPOR',
-        r'[Dd][Oo0][Kk][Uu][Mm][Ee3][Nn][Tt][Aa4][Ss][Ii1]': 'DOKUMENTASI',
-        r'[Aa4][Rr][Ss][Ii1][Pp]': 'ARSIP',
-        r'[Aa4][Rr][Cc][Hh][Ii1][Vv][Ee3]': 'ARCHIVE',
-        r'[Aa4][Dd][Mm][Ii1][Nn][Ii1][Ss][Tt][Rr][Aa4][Ss][Ii1]': 'ADMINISTRASI',
-        r'[Ss][Ee3][Kk][Rr][Ee3][Tt][Aa4][Rr][Ii1][Aa4][Tt]': 'SEKRETARIAT',
-        r'[Kk][Ll][Ee3][Rr][Ii1][Kk][Aa4][Ll]': 'KLERIKAL',
-        r'[Tt][Aa4][Tt][Aa4][\s\-]?[Uu][Ss][Aa4][Hh][Aa4]': 'TATA USAHA',
-
-        # Common OCR errors for numbers and symbols (100+ patterns)
-        r'[Oo0]': '0',
-        r'[Ii1][Ll]': '1',
-        r'[Zz]': '2',
-        r'[Ee3]': '3',
-        r'[Aa4]': '4',
-        r'[Ss]': '5',
-        r'[Gg]': '6',
-        r'[Tt]': '7',
-        r'[Bb]': '8',
-        r'[Gg]': '9',
-        r'[@]': 'a',
-        r'[#]': 'h',
-        r'[$]': 's',
-        r'[%]': 'x',
-        r'[&]': 'and',
-        r'[*]': 'x',
-        r'[+]': 'plus',
-        r'[-]': 'minus',
-        r'[=]': 'sama dengan',
-        r'[<]': 'kurang dari',
-        r'[>]': 'lebih dari',
-        r'[?]': 'tanya',
-        r'[!]': 'seru',
-        r'[:]': 'titik dua',
-        r'[;]': 'titik koma',
-        r'[,]': 'koma',
-        r'[.]': 'titik',
-        r'[/]': 'slash',
-        r'[\\]': 'backslash',
-        r'[|]': 'pipe',
-        r'[~]': 'tilde',
-        r'[`]': 'backtick',
-        r'[^]': 'caret',
-        r'[_]': 'underscore',
-
-        # Common misspellings and OCR errors for Indonesian words (200+ patterns)
-        r'[Pp][Ee3][Kk][Ee3][Rr][Jj][Aa4][Aa4][Nn]': 'PEKERJAAN',
-        r'[Pp][Ee3][Kk][Ee3][Rr][Jj][Aa4]': 'PEKERJA',
-        r'[Kk][Aa4][Rr][Yy][Aa4][Ww][Aa4][Nn]': 'KARYAWAN',
-        r'[Pp][Ee3][Gg][Aa4][Ww][Aa4][Ii1]': 'PEGAWAI',
-        r'[Ss][Tt][Aa4][Ff]': 'STAF',
-        r'[Tt][Ee3][Nn][Aa4][Gg][Aa4][\s\-]?[Kk][Ee3][Rr][Jj][Aa4]': 'TENAGA KERJA',
-        r'[Mm][Aa4][Nn][Aa4][Jj][Ee3][Rr]': 'MANAJER',
-        r'[Ss][Uu][Pp][Ee3][Rr][Vv][Aa4][Ii1][Ss][Oo0][Rr]': 'SUPERVISOR',
-        r'[Kk][Oo0][Oo0][Rr][Dd][Ii1][Nn][Aa4][Tt][Oo0][Rr]': 'KOORDINATOR',
-        r'[Aa4][Ss][Ii1][Ss][Tt][Ee3][Nn]': 'ASISTEN',
-        r'[Aa4][Dd][Mm][Ii1][Nn]': 'ADMIN',
-        r'[Oo0][Pp][Ee3][Rr][Aa4][Tt][Oo0][Rr]': 'OPERATOR',
-        r'[Tt][Ee3][Kk][Nn][Ii1][Ss][Ii1]': 'TEKNISI',
-        r'[Aa4][Nn][Aa4][Ll][Ii1][Ss]': 'ANALIS',
-        r'[Ss][Pp][Ee3][Ss][Ii1][Aa4][Ll][Ii1][Ss]': 'SPESIALIS',
-        r'[Kk][Oo0][Nn][Ss][Uu][Ll][Tt][Aa4][Nn]': 'KONSULTAN',
-        r'[Ee3][Nn][Jj][Ii1][Nn][Ii1][Rr]': 'ENGINEER',
-        r'[Ii1][Nn][Ss][Ii1][Nn][Yy][Uu][Rr]': 'INSINYUR',
-        r'[Aa4][Rr][Ss][Ii1][Tt][Ee3][Kk]': 'ARSITEK',
-        r'[Dd][Ee3][Ss][Aa4][Ii1][Nn][Ee3][Rr]': 'DESAINER',
-        r'[Pp][Rr][Oo0][Gg][Rr][Aa4][Mm][Ee3][Rr]': 'PROGRAMMER',
-        r'[Dd][Ee3][Vv][Ee3][Ll][Oo0][Pp][Ee3][Rr]': 'DEVELOPER',
-        r'[Aa4][Kk][Uu][Nn][Tt][Aa4][Nn]': 'AKUNTAN',
-        r'[Aa4][Uu][Dd][Ii1][Tt][Oo0][Rr]': 'AUDITOR',
-        r'[Mm][Aa4][Rr][Kk][Ee3][Tt][Ee3][Rr]': 'MARKETER',
-        r'[Ss][Aa4][Ll][Ee3][Ss]': 'SALES',
-        r'[Pp][Ee3][Nn][Jj][Uu][Aa4][Ll]': 'PENJUAL',
-        r'[Cc][Uu][Ss][Tt][Oo0][Mm][Ee3][Rr][\s\-]?[Ss][Ee3][Rr][Vv][Ii1][Cc][Ee3]': 'CUSTOMER SERVICE',
-        r'[Ll][Aa4][Yy][Aa4][Nn][Aa4][Nn][\s\-]?[Pp][Ee3][Ll][Aa4][Nn][Gg][Gg][Aa4][Nn]': 'LAYANAN PELANGGAN',
-        r'[Rr][Ee3][Ss][Ee3][Pp][Ss][Ii1][Oo0][Nn][Ii1][Ss]': 'RESEPSIONIS',
-        r'[Ss][Ee3][Kk][Uu][Rr][Ii1][Tt][Ii1]': 'SEKURITI',
-        r'[Ss][Aa4][Tt][Pp][Aa4][Mm]': 'SATPAM',
-        r'[Cc][Ll][Ee3][Aa4][Nn][Ii1][Nn][Gg][\s\-]?[Ss][Ee3][Rr][Vv][Ii1][Cc][Ee3]': 'CLEANING SERVICE',
-        r'[Oo0][Bb]': 'OB',
-        r'[Dd][Rr][Aa4][Ii1][Vv][Ee3][Rr]': 'DRIVER',
-        r'[Ss][Oo0][Pp][Ii1][Rr]': 'SOPIR',
-        r'[Kk][Uu][Rr][Ii1][Rr]': 'KURIR',
-        r'[Mm][Ee3][Ss][Ee3][Nn][Jj][Ee3][Rr]': 'MESSENGER',
-
-        # Benefits and compensation terms (100+ patterns)
-        r'[Bb][Oo0][Nn][Uu][Ss]': 'BONUS',
-        r'[Ii1][Nn][Ss][Ee3][Nn][Tt][Ii1][Ff]': 'INSENTIF',
-        r'[Kk][Oo0][Mm][Ii1][Ss][Ii1]': 'KOMISI',
-        r'[Tt][Hh][Rr]': 'THR',
-        r'[Tt][Uu][Nn][Jj][Aa4][Nn][Gg][Aa4][Nn][\s\-]?[Hh][Aa4][Rr][Ii1][\s\-]?[Rr][Aa4][Yy][Aa4]': 'TUNJANGAN HARI RAYA',
-        r'[Bb][Pp][Jj][Ss]': 'BPJS',
-        r'[Aa4][Ss][Uu][Rr][Aa4][Nn][Ss][Ii1]': 'ASURANSI',
-        r'[Kk][Ee3][Ss][Ee3][Hh][Aa4][Tt][Aa4][Nn]': 'KESEHATAN',
-        r'[Jj][Aa4][Mm][Ii1][Nn][Aa4][Nn][\s\-]?[Ss][Oo0][Ss][Ii1][Aa4][Ll]': 'JAMINAN SOSIAL',
-        r'[Cc][Uu][Tt][Ii1]': 'CUTI',
-        r'[Ll][Ii1][Bb][Uu][Rr]': 'LIBUR',
-        r'[Ii1][Zz][Ii1][Nn]': 'IZIN',
-        r'[Ss][Aa4][Kk][Ii1][Tt]': 'SAKIT',
-        r'[Mm][Ee3][Ll][Aa4][Hh][Ii1][Rr][Kk][Aa4][Nn]': 'MELAHIRKAN',
-        r'[Hh][Aa4][Jj][Ii1]': 'HAJI',
-        r'[Uu][Mm][Rr][Oo0][Hh]': 'UMROH',
-        r'[Pp][Ee3][Nn][Ss][Ii1][Uu][Nn]': 'PENSIUN',
-        r'[Pp][Ee3][Ss][Aa4][Nn][Gg][Oo0][Nn]': 'PESANGON',
-        r'[Tt][Rr][Aa4][Nn][Ss][Pp][Oo0][Rr][Tt]': 'TRANSPORT',
-        r'[Mm][Aa4][Kk][Aa4][Nn]': 'MAKAN',
-        r'[Mm][Ii1][Nn][Uu][Mm]': 'MINUM',
-        r'[Ss][Nn][Aa4][Cc][Kk]': 'SNACK',
-        r'[Kk][Aa4][Nn][Tt][Ii1][Nn]': 'KANTIN',
-        r'[Mm][Ee3][Ss]': 'MES',
-        r'[Aa4][Ss][Rr][Aa4][Mm][Aa4]': 'ASRAMA',
-        r'[Kk][Oo0][Ss]': 'KOS',
-        r'[Tt][Ee3][Mm][Pp][Aa4][Tt][\s\-]?[Tt][Ii1][Nn][Gg][Gg][Aa4][Ll]': 'TEMPAT TINGGAL',
-        r'[Rr][Uu][Mm][Aa4][Hh][\s\-]?[Dd][Ii1][Nn][Aa4][Ss]': 'RUMAH DINAS',
-        r'[Mm][Oo0][Bb][Ii1][Ll][\s\-]?[Dd][Ii1][Nn][Aa4][Ss]': 'MOBIL DINAS',
-        r'[Kk][Ee3][Nn][Dd][Aa4][Rr][Aa4][Aa4][Nn][\s\-]?[Dd][Ii1][Nn][Aa4][Ss]': 'KENDARAAN DINAS',
-        r'[Bb][Bb][Mm]': 'BBM',
-        r'[Bb][Aa4][Hh][Aa4][Nn][\s\-]?[Bb][Aa4][Kk][Aa4][Rr]': 'BAHAN BAKAR',
-        r'[Pp][Aa4][Rr][Kk][Ii1][Rr]': 'PARKIR',
-        r'[Tt][Oo0][Ll]': 'TOL',
-        r'[Uu][Aa4][Nn][Gg][\s\-]?[Ss][Aa4][Kk][Uu]': 'UANG SAKU',
-        r'[Uu][Aa4][Nn][Gg][\s\-]?[Jj][Aa4][Jj][Aa4][Nn]': 'UANG JAJAN',
-        r'[Tt][Uu][Nn][Jj][Aa4][Nn][Gg][Aa4][Nn][\s\-]?[Kk][Ee3][Hh][Aa4][Dd][Ii1][Rr][Aa4][Nn]': 'TUNJANGAN KEHADIRAN',
-        r'[Tt][Uu][Nn][Jj][Aa4][Nn][Gg][Aa4][Nn][\s\-]?[Kk][Ii1][Nn][Ee3][Rr][Jj][Aa4]': 'TUNJANGAN KINERJA',
-        r'[Tt][Uu][Nn][Jj][Aa4][Nn][Gg][Aa4][Nn][\s\-]?[Jj][Aa4][Bb][Aa4][Tt][Aa4][Nn]': 'TUNJANGAN JABATAN',
-        r'[Tt][Uu][Nn][Jj][Aa4][Nn][Gg][Aa4][Nn][\s\-]?[Kk][Ee3][Ll][Uu][Aa4][Rr][Gg][Aa4]': 'TUNJANGAN KELUARGA',
-        r'[Tt][Uu][Nn][Jj][Aa4][Nn][Gg][Aa4][Nn][\s\-]?[Aa4][Nn][Aa4][Kk]': 'TUNJANGAN ANAK',
-        r'[Tt][Uu][Nn][Jj][Aa4][Nn][Gg][Aa4][Nn][\s\-]?[Ii1][Ss][Tt][Rr][Ii1]': 'TUNJANGAN ISTRI',
-        r'[Bb][Ii1][Aa4][Yy][Aa4][\s\-]?[Ss][Ee3][Kk][Oo0][Ll][Aa4][Hh]': 'BIAYA SEKOLAH',
-        r'[Bb][Ii1][Aa4][Yy][Aa4][\s\-]?[Pp][Ee3][Nn][Dd][Ii1][Dd][Ii1][Kk][Aa4][Nn]': 'BIAYA PENDIDIKAN',
-        r'[Bb][Ee3][Aa4][Ss][Ii1][Ss][Ww][Aa4]': 'BEASISWA',
-        r'[Pp][Ee3][Ll][Aa4][Tt][Ii1][Hh][Aa4][Nn][\s\-]?[Gg][Rr][Aa4][Tt][Ii1][Ss]': 'PELATIHAN GRATIS',
-        r'[Kk][Uu][Rr][Ss][Uu][Ss][\s\-]?[Gg][Rr][Aa4][Tt][Ii1][Ss]': 'KURSUS GRATIS',
-        r'[Ss][Ee3][Rr][Tt][Ii1][Ff][Ii1][Kk][Aa4][Ss][Ii1][\s\-]?[Gg][Rr][Aa4][Tt][Ii1][Ss]': 'SERTIFIKASI GRATIS',
-
-        # Additional OCR patterns for numbers and symbols (200+ patterns)
-        r'[0Oo][0Oo]': '00',
-        r'[1IlL][1IlL]': '11',
-        r'[2Zz][2Zz]': '22',
-        r'[3Ee][3Ee]': '33',
-        r'[4Aa][4Aa]': '44',
-        r'[5Ss][5Ss]': '55',
-        r'[6Gg][6Gg]': '66',
-        r'[7Tt][7Tt]': '77',
-        r'[8Bb][8Bb]': '88',
-        r'[9Gg][9Gg]': '99',
-        r'[0Oo][1IlL]': '01',
-        r'[1IlL][0Oo]': '10',
-        r'[2Zz][0Oo]': '20',
-        r'[0Oo][2Zz]': '02',
-        r'[3Ee][0Oo]': '30',
-        r'[0Oo][3Ee]': '03',
-        r'[4Aa][0Oo]': '40',
-        r'[0Oo][4Aa]': '04',
-        r'[5Ss][0Oo]': '50',
-        r'[0Oo][5Ss]': '05',
-        r'[6Gg][0Oo]': '60',
-        r'[0Oo][6Gg]': '06',
-        r'[7Tt][0Oo]': '70',
-        r'[0Oo][7Tt]': '07',
-        r'[8Bb][0Oo]': '80',
-        r'[0Oo][8Bb]': '08',
-        r'[9Gg][0Oo]': '90',
-        r'[0Oo][9Gg]': '09',
-
-        # Phone number patterns (100+ patterns)
-        r'[0Oo][8Bb][1IlL]': '081',
-        r'[0Oo][8Bb][2Zz]': '082',
-        r'[0Oo][8Bb][3Ee]': '083',
-        r'[0Oo][8Bb][5Ss]': '085',
-        r'[0Oo][8Bb][7Tt]': '087',
-        r'[0Oo][8Bb][8Bb]': '088',
-        r'[0Oo][8Bb][9Gg]': '089',
-        r'[0Oo][2Zz][1IlL]': '021',
-        r'[0Oo][2Zz][2Zz]': '022',
-        r'[0Oo][2Zz][4Aa]': '024',
-        r'[0Oo][3Ee][1IlL]': '031',
-        r'[0Oo][6Gg][1IlL]': '061',
-        r'[0Oo][7Tt][4Aa]': '074',
-        r'[+][6Gg][2Zz]': '+62',
-        r'[\+][6Gg][2Zz]': '+62',
-        r'[6Gg][2Zz][8Bb]': '628',
-        r'[Ww][Aa4][\s\-]?[0Oo][8Bb]': 'WA 08',
-        r'[Ww][Hh][Aa4][Tt][Ss][Aa4][Pp][Pp][\s\-]?[0Oo][8Bb]': 'WHATSAPP 08',
-        r'[Tt][Ee3][Ll][Pp][\s\-]?[0Oo]': 'TELP 0',
-        r'[Tt][Ee3][Ll][Ee3][Pp][Oo0][Nn][\s\-]?[0Oo]': 'TELEPON 0',
-        r'[Hh][Pp][\s\-]?[0Oo][8Bb]': 'HP 08',
-        r'[Nn][Oo0][\s\-]?[Hh][Pp][\s\-]?[0Oo][8Bb]': 'NO HP 08',
-        r'[Nn][Oo0][Mm][Oo0][Rr][\s\-]?[0Oo][8Bb]': 'NOMOR 08',
-        r'[Kk][Oo0][Nn][Tt][Aa4][Kk][\s\-]?[0Oo][8Bb]': 'KONTAK 08',
-
-        # Email patterns (50+ patterns)
-        r'[@][Gg][Mm][Aa4][Ii1][Ll]': '@gmail',
-        r'[@][Yy][Aa4][Hh][Oo0][Oo0]': '@yahoo',
-        r'[@][Hh][Oo0][Tt][Mm][Aa4][Ii1][Ll]': '@hotmail',
-        r'[@][Oo0][Uu][Tt][Ll][Oo0][Oo0][Kk]': '@outlook',
-        r'[@][Ii1][Cc][Ll][Oo0][Uu][Dd]': '@icloud',
-        r'[Ee3][Mm][Aa4][Ii1][Ll][\s\-]?[@]': 'EMAIL @',
-        r'[Ee3][\-\s]?[Mm][Aa4][Ii1][Ll][\s\-]?[@]': 'E-MAIL @',
-        r'[Ss][Uu][Rr][Aa4][Tt][\s\-]?[Ee3][Ll][Ee3][Kk][Tt][Rr][Oo0][Nn][Ii1][Kk]': 'SURAT ELEKTRONIK',
-        r'[Aa4][Ll][Aa4][Mm][Aa4][Tt][\s\-]?[Ee3][Mm][Aa4][Ii1][Ll]': 'ALAMAT EMAIL',
-        r'[Kk][Ii1][Rr][Ii1][Mm][\s\-]?[Kk][Ee3]': 'KIRIM KE',
-        r'[Ss][Ee3][Nn][Dd][\s\-]?[Tt][Oo0]': 'SEND TO',
-
-        # Website and URL patterns (50+ patterns)
-        r'[Ww][Ww][Ww]\.': 'www.',
-        r'[Hh][Tt][Tt][Pp][:][/][/]': 'http://',
-        r'[Hh][Tt][Tt][Pp][Ss][:][/][/]': 'https://',
-        r'\.[\s]?[Cc][Oo0][Mm]': '.com',
-        r'\.[\s]?[Cc][Oo0]\.[\s]?[Ii1][Dd]': '.co.id',
-        r'\.[\s]?[Oo0][Rr][Gg]': '.org',
-        r'\.[\s]?[Nn][Ee3][Tt]': '.net',
-        r'\.[\s]?[Ii1][Nn][Ff][Oo0]': '.info',
-        r'\.[\s]?[Bb][Ii1][Zz]': '.biz',
-        r'[Ww][Ee3][Bb][Ss][Ii1][Tt][Ee3][\s\-]?[:][/][/]': 'WEBSITE ://',
-        r'[Ss][Ii1][Tt][Uu][Ss][\s\-]?[Ww][Ee3][Bb]': 'SITUS WEB',
-        r'[Ll][Aa4][Mm][Aa4][Nn][\s\-]?[Ww][Ee3][Bb]': 'LAMAN WEB',
-        r'[Aa4][Ll][Aa4][Mm][Aa4][Tt][\s\-]?[Ww][Ee3][Bb]': 'ALAMAT WEB',
-
-        # Social media patterns (50+ patterns)
-        r'[Ff][Aa4][Cc][Ee3][Bb][Oo0][Oo0][Kk]': 'FACEBOOK',
-        r'[Ii1][Nn][Ss][Tt][Aa4][Gg][Rr][Aa4][Mm]': 'INSTAGRAM',
-        r'[Tt][Ww][Ii1][Tt][Tt][Ee3][Rr]': 'TWITTER',
-        r'[Ll][Ii1][Nn][Kk][Ee3][Dd][Ii1][Nn]': 'LINKEDIN',
-        r'[Tt][Ii1][Kk][Tt][Oo0][Kk]': 'TIKTOK',
-        r'[Yy][Oo0][Uu][Tt][Uu][Bb][Ee3]': 'YOUTUBE',
-        r'[Ww][Hh][Aa4][Tt][Ss][Aa4][Pp][Pp]': 'WHATSAPP',
-        r'[Tt][Ee3][Ll][Ee3][Gg][Rr][Aa4][Mm]': 'TELEGRAM',
-        r'[Ll][Ii1][Nn][Ee3]': 'LINE',
-        r'[Ss][Kk][Yy][Pp][Ee3]': 'SKYPE',
-        r'[Zz][Oo0][Oo0][Mm]': 'ZOOM',
-        r'[Mm][Ee3][Dd][Ss][Oo0][Ss]': 'MEDSOS',
-        r'[Ss][Oo0][Ss][Mm][Ee3][Dd]': 'SOSMED',
-        r'[Ff][Bb]': 'FB',
-        r'[Ii1][Gg]': 'IG',
-        r'[Ww][Aa4]': 'WA',
-
-        # Currency and money patterns (100+ patterns)
-        r'[Rr][Pp]\.?[\s]?[1-9]': lambda m: 'Rp ' + m.group().replace('Rp', '').replace('.', '').strip(),
-        r'[Rr][Uu][Pp][Ii1][Aa4][Hh][\s]?[1-9]': lambda m: 'RUPIAH ' + m.group().replace('RUPIAH', '').strip(),
-        r'[Jj][Uu][Tt][Aa4]': 'JUTA',
-        r'[Mm][Ii1][Ll][Yy][Aa4][Rr]': 'MILYAR',
-        r'[Bb][Ii1][Ll][Ii1][Oo0][Nn]': 'BILIUN',
-        r'[Tt][Rr][Ii1][Ll][Ii1][Oo0][Nn]': 'TRILIUN',
-        r'[Rr][Ii1][Bb][Uu]': 'RIBU',
-        r'[Pp][Uu][Ll][Uu][Hh][\s\-]?[Rr][Ii1][Bb][Uu]': 'PULUH RIBU',
-        r'[Rr][Aa4][Tt][Uu][Ss][\s\-]?[Rr][Ii1][Bb][Uu]': 'RATUS RIBU',
-        r'[Dd][Oo0][Ll][Aa4][Rr]': 'DOLAR',
-        r'[Uu][Ss][Dd]': 'USD',
-        r'[Ee3][Uu][Rr]': 'EUR',
-        r'[Gg][Bb][Pp]': 'GBP',
-        r'[Jj][Pp][Yy]': 'JPY',
-        r'[Cc][Nn][Yy]': 'CNY',
-        r'[Ss][Gg][Dd]': 'SGD',
-        r'[Mm][Yy][Rr]': 'MYR',
-        r'[Tt][Hh][Bb]': 'THB',
-        r'[Pp][Hh][Pp]': 'PHP',
-        r'[Vv][Nn][Dd]': 'VND',
-        r'[Kk][Rr][Ww]': 'KRW',
-        r'[Ii1][Nn][Rr]': 'INR',
-        r'[Aa4][Uu][Dd]': 'AUD',
-        r'[Cc][Aa4][Dd]': 'CAD',
-        r'[Cc][Hh][Ff]': 'CHF',
-        r'[Nn][Zz][Dd]': 'NZD',
-        r'[Zz][Aa4][Rr]': 'ZAR',
-        r'[Bb][Rr][Ll]': 'BRL',
-        r'[Mm][Xx][Nn]': 'MXN',
-        r'[Rr][Uu][Bb]': 'RUB',
-        r'[Tt][Rr][Yy]': 'TRY',
-        r'[Aa4][Ee3][Dd]': 'AED',
-        r'[Ss][Aa4][Rr]': 'SAR',
-        r'[Qq][Aa4][Rr]': 'QAR',
-        r'[Kk][Ww][Dd]': 'KWD',
-        r'[Bb][Hh][Dd]': 'BHD',
-        r'[Oo0][Mm][Rr]': 'OMR',
-        r'[Jj][Oo0][Dd]': 'JOD',
-        r'[Ll][Bb][Pp]': 'LBP',
-        r'[Ee3][Gg][Pp]': 'EGP',
-        r'[Mm][Aa4][Dd]': 'MAD',
-        r'[Tt][Nn][Dd]': 'TND',
-        r'[Dd][Zz][Dd]': 'DZD',
-        r'[Ll][Yy][Dd]': 'LYD',
-        r'[Ss][Dd][Gg]': 'SDG',
-        r'[Ee3][Tt][Bb]': 'ETB',
-        r'[Kk][Ee3][Ss]': 'KES',
-        r'[Uu][Gg][Xx]': 'UGX',
-        r'[Tt][Zz][Ss]': 'TZS',
-        r'[Rr][Ww][Ff]': 'RWF',
-        r'[Bb][Ii1][Ff]': 'BIF',
-        r'[Dd][Jj][Ff]': 'DJF',
-        r'[Ee3][Rr][Nn]': 'ERN',
-        r'[Ss][Oo0][Ss]': 'SOS',
-        r'[Ss][Ss][Pp]': 'SSP',
-        r'[Cc][Dd][Ff]': 'CDF',
-        r'[Aa4][Oo0][Aa4]': 'AOA',
-        r'[Zz][Mm][Ww]': 'ZMW',
-        r'[Zz][Ww][Ll]': 'ZWL',
-        r'[Bb][Ww][Pp]': 'BWP',
-        r'[Ss][Zz][Ll]': 'SZL',
-        r'[Ll][Ss][Ll]': 'LSL',
-        r'[Nn][Aa4][Dd]': 'NAD',
-        r'[Mm][Gg][Aa4]': 'MGA',
-        r'[Mm][Uu][Rr]': 'MUR',
-        r'[Ss][Cc][Rr]': 'SCR',
-        r'[Kk][Mm][Ff]': 'KMF',
-        r'[Cc][Vv][Ee3]': 'CVE',
-        r'[Ss][Tt][Dd]': 'STD',
-        r'[Gg][Mm][Dd]': 'GMD',
-        r'[Gg][Nn][Ff]': 'GNF',
-        r'[Ss][Ll][Ll]': 'SLL',
-        r'[Ll][Rr][Dd]': 'LRD',
-        r'[Cc][Ii1][Vv]': 'CIV',
-        r'[Gg][Hh][Ss]': 'GHS',
-        r'[Nn][Gg][Nn]': 'NGN',
-        r'[Xx][Aa4][Ff]': 'XAF',
-        r'[Xx][Oo0][Ff]': 'XOF',
-        r'[Cc][Mm][Rr]': 'CMR',
-        r'[Tt][Dd]': 'TD',
-        r'[Cc][Aa4][Ff]': 'CAF',
-        r'[Gg][Qq]': 'GQ',
-        r'[Gg][Aa4]': 'GA',
-        r'[Cc][Gg]': 'CG',
-        r'[Cc][Dd]': 'CD',
-        r'[Ss][Tt]': 'ST',
-
-        # Date and time patterns (100+ patterns)
-        r'[Jj][Aa4][Nn][Uu][Aa4][Rr][Ii1]': 'JANUARI',
-        r'[Ff][Ee3][Bb][Rr][Uu][Aa4][Rr][Ii1]': 'FEBRUARI',
-        r'[Mm][Aa4][Rr][Ee3][Tt]': 'MARET',
-        r'[Aa4][Pp][Rr][Ii1][Ll]': 'APRIL',
-        r'[Mm][Ee3][Ii1]': 'MEI',
-        r'[Jj][Uu][Nn][Ii1]': 'JUNI',
-        r'[Jj][Uu][Ll][Ii1]': 'JULI',
-        r'[Aa4][Gg][Uu][Ss][Tt][Uu][Ss]': 'AGUSTUS',
-        r'[Ss][Ee3][Pp][Tt][Ee3][Mm][Bb][Ee3][Rr]': 'SEPTEMBER',
-        r'[Oo0][Kk][Tt][Oo0][Bb][Ee3][Rr]': 'OKTOBER',
-        r'[Nn][Oo0][Vv][Ee3][Mm][Bb][Ee3][Rr]': 'NOVEMBER',
-        r'[Dd][Ee3][Ss][Ee3][Mm][Bb][Ee3][Rr]': 'DESEMBER',
-        r'[Jj][Aa4][Nn]': 'JAN',
-        r'[Ff][Ee3][Bb]': 'FEB',
-        r'[Mm][Aa4][Rr]': 'MAR',
-        r'[Aa4][Pp][Rr]': 'APR',
-        r'[Jj][Uu][Nn]': 'JUN',
-        r'[Jj][Uu][Ll]': 'JUL',
-        r'[Aa4][Gg][Uu]': 'AGU',
-        r'[Ss][Ee3][Pp]': 'SEP',
-        r'[Oo0][Kk][Tt]': 'OKT',
-        r'[Nn][Oo0][Vv]': 'NOV',
-        r'[Dd][Ee3][Ss]': 'DES',
-        r'[Ss][Ee3][Nn][Ii1][Nn]': 'SENIN',
-        r'[Ss][Ee3][Ll][Aa4][Ss][Aa4]': 'SELASA',
-        r'[Rr][Aa4][Bb][Uu]': 'RABU',
-        r'[Kk][Aa4][Mm][Ii1][Ss]': 'KAMIS',
-        r'[Jj][Uu][Mm][Aa4][Tt]': 'JUMAT',
-        r'[Ss][Aa4][Bb][Tt][Uu]': 'SABTU',
-        r'[Mm][Ii1][Nn][Gg][Gg][Uu]': 'MINGGU',
-        r'[Mm][Oo0][Nn][Dd][Aa4][Yy]': 'MONDAY',
-        r'[Tt][Uu][Ee3][Ss][Dd][Aa4][Yy]': 'TUESDAY',
-        r'[Ww][Ee3][Dd][Nn][Ee3][Ss][Dd][Aa4][Yy]': 'WEDNESDAY',
-        r'[Tt][Hh][Uu][Rr][Ss][Dd][Aa4][Yy]': 'THURSDAY',
-        r'[Ff][Rr][Ii1][Dd][Aa4][Yy]': 'FRIDAY',
-        r'[Ss][Aa4][Tt][Uu][Rr][Dd][Aa4][Yy]': 'SATURDAY',
-        r'[Ss][Uu][Nn][Dd][Aa4][Yy]': 'SUNDAY',
-        r'[Pp][Aa4][Gg][Ii1]': 'PAGI',
-        r'[Ss][Ii1][Aa4][Nn][Gg]': 'SIANG',
-        r'[Ss][Oo0][Rr][Ee3]': 'SORE',
-        r'[Mm][Aa4][Ll][Aa4][Mm]': 'MALAM',
-        r'[Mm][Oo0][Rr][Nn][Ii1][Nn][Gg]': 'MORNING',
-        r'[Aa4][Ff][Tt][Ee3][Rr][Nn][Oo0][Oo0][Nn]': 'AFTERNOON',
-        r'[Ee3][Vv][Ee3][Nn][Ii1][Nn][Gg]': 'EVENING',
-        r'[Nn][Ii1][Gg][Hh][Tt]': 'NIGHT',
-        r'[Hh][Aa4][Rr][Ii1]': 'HARI',
-        r'[Tt][Aa4][Nn][Gg][Gg][Aa4][Ll]': 'TANGGAL',
-        r'[Bb][Uu][Ll][Aa4][Nn]': 'BULAN',
-        r'[Tt][Aa4][Hh][Uu][Nn]': 'TAHUN',
-        r'[Mm][Ii1][Nn][Gg][Gg][Uu]': 'MINGGU',
-        r'[Jj][Aa4][Mm]': 'JAM',
-        r'[Mm][Ee3][Nn][Ii1][Tt]': 'MENIT',
-        r'[Dd][Ee3][Tt][Ii1][Kk]': 'DETIK',
-        r'[Ww][Aa4][Kk][Tt][Uu]': 'WAKTU',
-        r'[Tt][Ii1][Mm][Ee3]': 'TIME',
-        r'[Dd][Aa4][Tt][Ee3]': 'DATE',
-        r'[Cc][Ll][Oo0][Cc][Kk]': 'CLOCK',
-        r'[Cc][Aa4][Ll][Ee3][Nn][Dd][Aa4][Rr]': 'CALENDAR',
-        r'[Ss][Cc][Hh][Ee3][Dd][Uu][Ll][Ee3]': 'SCHEDULE',
-        r'[Jj][Aa4][Dd][Ww][Aa4][Ll]': 'JADWAL',
-        r'[Aa4][Gg][Ee3][Nn][Dd][Aa4]': 'AGENDA',
-        r'[Pp][Ll][Aa4][Nn][Nn][Ii1][Nn][Gg]': 'PLANNING',
-        r'[Rr][Ee3][Nn][Cc][Aa4][Nn][Aa4]': 'RENCANA',
-        r'[Tt][Ii1][Mm][Ee3][Tt][Aa4][Bb][Ll][Ee3]': 'TIMETABLE',
-        r'[Dd][Ee3][Aa4][Dd][Ll][Ii1][Nn][Ee3]': 'DEADLINE',
-        r'[Bb][Aa4][Tt][Aa4][Ss][\s\-]?[Ww][Aa4][Kk][Tt][Uu]': 'BATAS WAKTU',
-        r'[Tt][Ee3][Nn][Gg][Gg][Aa4][Tt][\s\-]?[Ww][Aa4][Kk][Tt][Uu]': 'TENGGAT WAKTU',
-        r'[Dd][Uu][Rr][Aa4][Ss][Ii1]': 'DURASI',
-        r'[Pp][Ee3][Rr][Ii1][Oo0][Dd][Ee3]': 'PERIODE',
-        r'[Jj][Aa4][Nn][Gg][Kk][Aa4][\s\-]?[Ww][Aa4][Kk][Tt][Uu]': 'JANGKA WAKTU',
-        r'[Ll][Aa4][Mm][Aa4][\s\-]?[Ww][Aa4][Kk][Tt][Uu]': 'LAMA WAKTU',
-
-        # Location and address patterns (150+ patterns)
-        r'[Jj][Aa4][Ll][Aa4][Nn]': 'JALAN',
-        r'[Jj][Ll]\.?': 'JL',
-        r'[Gg][Aa4][Nn][Gg]': 'GANG',
-        r'[Gg][Gg]\.?': 'GG',
-        r'[Kk][Oo0][Mm][Pp][Ll][Ee3][Kk][Ss]': 'KOMPLEKS',
-        r'[Kk][Oo0][Mm][Pp]\.?': 'KOMP',
-        r'[Pp][Ee3][Rr][Uu][Mm][Aa4][Hh][Aa4][Nn]': 'PERUMAHAN',
-        r'[Pp][Ee3][Rr][Uu][Mm]\.?': 'PERUM',
-        r'[Bb][Ll][Oo0][Kk]': 'BLOK',
-        r'[Nn][Oo0][Mm][Oo0][Rr]': 'NOMOR',
-        r'[Nn][Oo0]\.?': 'NO',
-        r'[Rr][Tt]': 'RT',
-        r'[Rr][Ww]': 'RW',
-        r'[Kk][Ee3][Ll][Uu][Rr][Aa4][Hh][Aa4][Nn]': 'KELURAHAN',
-        r'[Kk][Ee3][Cc][Aa4][Mm][Aa4][Tt][Aa4][Nn]': 'KECAMATAN',
-        r'[Kk][Aa4][Bb][Uu][Pp][Aa4][Tt][Ee3][Nn]': 'KABUPATEN',
-        r'[Kk][Oo0][Tt][Aa4]': 'KOTA',
-        r'[Pp][Rr][Oo0][Vv][Ii1][Nn][Ss][Ii1]': 'PROVINSI',
-        r'[Kk][Oo0][Dd][Ee3][\s\-]?[Pp][Oo0][Ss]': 'KODE POS',
-        r'[Pp][Oo0][Ss][Tt][Aa4][Ll][\s\-]?[Cc][Oo0][Dd][Ee3]': 'POSTAL CODE',
-        r'[Zz][Ii1][Pp][\s\-]?[Cc][Oo0][Dd][Ee3]': 'ZIP CODE',
-        r'[Aa4][Ll][Aa4][Mm][Aa4][Tt]': 'ALAMAT',
-        r'[Aa4][Dd][Dd][Rr][Ee3][Ss][Ss]': 'ADDRESS',
-        r'[Ll][Oo0][Kk][Aa4][Ss][Ii1]': 'LOKASI',
-        r'[Ll][Oo0][Cc][Aa4][Tt][Ii1][Oo0][Nn]': 'LOCATION',
-        r'[Tt][Ee3][Mm][Pp][Aa4][Tt]': 'TEMPAT',
-        r'[Pp][Ll][Aa4][Cc][Ee3]': 'PLACE',
-        r'[Pp][Oo0][Ss][Ii1][Ss][Ii1]': 'POSISI',
-        r'[Pp][Oo0][Ss][Ii1][Tt][Ii1][Oo0][Nn]': 'POSITION',
-        r'[Kk][Oo0][Oo0][Rr][Dd][Ii1][Nn][Aa4][Tt]': 'KOORDINAT',
-        r'[Cc][Oo0][Oo0][Rr][Dd][Ii1][Nn][Aa4][Tt][Ee3]': 'COORDINATE',
-        r'[Ll][Aa4][Tt][Ii1][Tt][Uu][Dd][Ee3]': 'LATITUDE',
-        r'[Ll][Oo0][Nn][Gg][Ii1][Tt][Uu][Dd][Ee3]': 'LONGITUDE',
-        r'[Gg][Pp][Ss]': 'GPS',
-        r'[Mm][Aa4][Pp]': 'MAP',
-        r'[Pp][Ee3][Tt][Aa4]': 'PETA',
-        r'[Nn][Aa4][Vv][Ii1][Gg][Aa4][Ss][Ii1]': 'NAVIGASI',
-        r'[Nn][Aa4][Vv][Ii1][Gg][Aa4][Tt][Ii1][Oo0][Nn]': 'NAVIGATION',
-        r'[Aa4][Rr][Aa4][Hh]': 'ARAH',
-        r'[Dd][Ii1][Rr][Ee3][Cc][Tt][Ii1][Oo0][Nn]': 'DIRECTION',
-        r'[Jj][Aa4][Rr][Aa4][Kk]': 'JARAK',
-        r'[Dd][Ii1][Ss][Tt][Aa4][Nn][Cc][Ee3]': 'DISTANCE',
-        r'[Uu][Tt][Aa4][Rr][Aa4]': 'UTARA',
-        r'[Nn][Oo0][Rr][Tt][Hh]': 'NORTH',
-        r'[Ss][Ee3][Ll][Aa4][Tt][Aa4][Nn]': 'SELATAN',
-        r'[Ss][Oo0][Uu][Tt][Hh]': 'SOUTH',
-        r'[Tt][Ii1][Mm][Uu][Rr]': 'TIMUR',
-        r'[Ee3][Aa4][Ss][Tt]': 'EAST',
-        r'[Bb][Aa4][Rr][Aa4][Tt]': 'BARAT',
-        r'[Ww][Ee3][Ss][Tt]': 'WEST',
-        r'[Tt][Ee3][Nn][Gg][Aa4][Hh]': 'TENGAH',
-        r'[Cc][Ee3][Nn][Tt][Rr][Aa4][Ll]': 'CENTRAL',
-        r'[Pp][Uu][Ss][Aa4][Tt]': 'PUSAT',
-        r'[Cc][Ee3][Nn][Tt][Ee3][Rr]': 'CENTER',
-        r'[Pp][Ii1][Nn][Gg][Gg][Ii1][Rr]': 'PINGGIR',
-        r'[Tt][Ee3][Pp][Ii1]': 'TEPI',
-        r'[Ee3][Dd][Gg][Ee3]': 'EDGE',
-        r'[Ss][Uu][Dd][Uu][Tt]': 'SUDUT',
-        r'[Cc][Oo0][Rr][Nn][Ee3][Rr]': 'CORNER',
-        r'[Pp][Ee3][Rr][Ss][Ii1][Mm][Pp][Aa4][Nn][Gg][Aa4][Nn]': 'PERSIMPANGAN',
-        r'[Ii1][Nn][Tt][Ee3][Rr][Ss][Ee3][Cc][Tt][Ii1][Oo0][Nn]': 'INTERSECTION',
-        r'[Pp][Ee3][Rr][Ee3][Mm][Pp][Aa4][Tt][Aa4][Nn]': 'PEREMPATAN',
-        r'[Cc][Rr][Oo0][Ss][Ss][Rr][Oo0][Aa4][Dd]': 'CROSSROAD',
-        r'[Jj][Ee3][Mm][Bb][Aa4][Tt][Aa4][Nn]': 'JEMBATAN',
-        r'[Bb][Rr][Ii1][Dd][Gg][Ee3]': 'BRIDGE',
-        r'[Tt][Ee3][Rr][Oo0][Ww][Oo0][Nn][Gg][Aa4][Nn]': 'TEROWONGAN',
-        r'[Tt][Uu][Nn][Nn][Ee3][Ll]': 'TUNNEL',
-        r'[Ff][Ll][Yy][Oo0][Vv][Ee3][Rr]': 'FLYOVER',
-        r'[Uu][Nn][Dd][Ee3][Rr][Pp][Aa4][Ss][Ss]': 'UNDERPASS',
-        r'[Tt][Oo0][Ll]': 'TOL',
-        r'[Tt][Oo0][Ll][Ll]': 'TOLL',
-        r'[Jj][Aa4][Ll][Aa4][Nn][\s\-]?[Tt][Oo0][Ll]': 'JALAN TOL',
-        r'[Tt][Oo0][Ll][Ll][\s\-]?[Rr][Oo0][Aa4][Dd]': 'TOLL ROAD',
-        r'[Bb][Yy][Pp][Aa4][Ss][Ss]': 'BYPASS',
-        r'[Rr][Ii1][Nn][Gg][\s\-]?[Rr][Oo0][Aa4][Dd]': 'RING ROAD',
-        r'[Jj][Aa4][Ll][Aa4][Nn][\s\-]?[Ll][Ii1][Nn][Gg][Kk][Aa4][Rr]': 'JALAN LINGKAR',
-        r'[Aa4][Rr][Tt][Ee3][Rr][Ii1]': 'ARTERI',
-        r'[Kk][Oo0][Ll][Ee3][Kk][Tt][Oo0][Rr]': 'KOLEKTOR',
-        r'[Ll][Oo0][Kk][Aa4][Ll]': 'LOKAL',
-        r'[Nn][Aa4][Ss][Ii1][Oo0][Nn][Aa4][Ll]': 'NASIONAL',
-        r'[Pp][Rr][Oo0][Vv][Ii1][Nn][Ss][Ii1][Aa4][Ll]': 'PROVINSI',
-        r'[Kk][Aa4][Bb][Uu][Pp][Aa4][Tt][Ee3][Nn]': 'KABUPATEN',
-        r'[Kk][Oo0][Tt][Aa4]': 'KOTA',
-        r'[Dd][Ee3][Ss][Aa4]': 'DESA',
-        r'[Vv][Ii1][Ll][Ll][Aa4][Gg][Ee3]': 'VILLAGE',
-        r'[Kk][Aa4][Mm][Pp][Uu][Nn][Gg]': 'KAMPUNG',
-        r'[Hh][Aa4][Mm][Ll][Ee3][Tt]': 'HAMLET',
-        r'[Dd][Uu][Ss][Uu][Nn]': 'DUSUN',
-        r'[Pp][Aa4][Dd][Uu][Kk][Uu][Hh]': 'PADUKUH',
-        r'[Bb][Aa4][Nn][Jj][Aa4][Rr]': 'BANJAR',
-        r'[Ll][Ii1][Nn][Gg][Kk][Uu][Nn][Gg][Aa4][Nn]': 'LINGKUNGAN',
-        r'[Nn][Ee3][Ii1][Gg][Hh][Bb][Oo0][Rr][Hh][Oo0][Oo0][Dd]': 'NEIGHBORHOOD',
-        r'[Kk][Oo0][Mm][Uu][Nn][Ii1][Tt][Aa4][Ss]': 'KOMUNITAS',
-        r'[Cc][Oo0][Mm][Mm][Uu][Nn][Ii1][Tt][Yy]': 'COMMUNITY',
-        r'[Pp][Ee3][Rr][Kk][Aa4][Mm][Pp][Uu][Nn][Gg][Aa4][Nn]': 'PERKAMPUNGAN',
-        r'[Ss][Ee3][Tt][Tt][Ll][Ee3][Mm][Ee3][Nn][Tt]': 'SETTLEMENT',
-        r'[Pp][Ee3][Mm][Uu][Kk][Ii1][Mm][Aa4][Nn]': 'PEMUKIMAN',
-        r'[Rr][Ee3][Ss][Ii1][Dd][Ee3][Nn][Tt][Ii1][Aa4][Ll]': 'RESIDENTIAL',
-        r'[Kk][Oo0][Mm][Ee3][Rr][Ss][Ii1][Aa4][Ll]': 'KOMERSIAL',
-        r'[Cc][Oo0][Mm][Mm][Ee3][Rr][Cc][Ii1][Aa4][Ll]': 'COMMERCIAL',
-        r'[Ii1][Nn][Dd][Uu][Ss][Tt][Rr][Ii1][Aa4][Ll]': 'INDUSTRIAL',
-        r'[Pp][Ee3][Rr][Kk][Aa4][Nn][Tt][Oo0][Rr][Aa4][Nn]': 'PERKANTORAN',
-        r'[Oo0][Ff][Ff][Ii1][Cc][Ee3]': 'OFFICE',
-        r'[Bb][Ii1][Ss][Nn][Ii1][Ss]': 'BISNIS',
-        r'[Bb][Uu][Ss][Ii1][Nn][Ee3][Ss][Ss]': 'BUSINESS',
-
-        # Final batch of OCR patterns to reach 1000+ (200+ patterns)
-        r'[Aa4][Pp][Ll][Ii1][Kk][Aa4][Ss][Ii1][\s\-]?[Ff][Oo0][Rr][Mm]': 'APLIKASI FORM',
-        r'[Ff][Oo0][Rr][Mm][Uu][Ll][Ii1][Rr]': 'FORMULIR',
-        r'[Dd][Oo0][Kk][Uu][Mm][Ee3][Nn]': 'DOKUMEN',
-        r'[Dd][Oo0][Cc][Uu][Mm][Ee3][Nn][Tt]': 'DOCUMENT',
-        r'[Bb][Ee3][Rr][Kk][Aa4][Ss]': 'BERKAS',
-        r'[Ff][Aa4][Ii1][Ll]': 'FILE',
-        r'[Ff][Oo0][Ll][Dd][Ee3][Rr]': 'FOLDER',
-        r'[Dd][Ii1][Rr][Ee3][Kk][Tt][Oo0][Rr][Ii1]': 'DIREKTORI',
-        r'[Dd][Ii1][Rr][Ee3][Cc][Tt][Oo0][Rr][Yy]': 'DIRECTORY',
-        r'[Aa4][Rr][Ss][Ii1][Pp]': 'ARSIP',
-        r'[Aa4][Rr][Cc][Hh][Ii1][Vv][Ee3]': 'ARCHIVE',
-        r'[Bb][Aa4][Cc][Kk][Uu][Pp]': 'BACKUP',
-        r'[Cc][Aa4][Dd][Aa4][Nn][Gg][Aa4][Nn]': 'CADANGAN',
-        r'[Cc][Oo0][Pp][Yy]': 'COPY',
-        r'[Ss][Aa4][Ll][Ii1][Nn][Aa4][Nn]': 'SALINAN',
-        r'[Dd][Uu][Pp][Ll][Ii1][Kk][Aa4][Tt]': 'DUPLIKAT',
-        r'[Dd][Uu][Pp][Ll][Ii1][Cc][Aa4][Tt][Ee3]': 'DUPLICATE',
-        r'[Oo0][Rr][Ii1][Gg][Ii1][Nn][Aa4][Ll]': 'ORIGINAL',
-        r'[Aa4][Ss][Ll][Ii1]': 'ASLI',
-        r'[Aa4][Uu][Tt][Hh][Ee3][Nn][Tt][Ii1][Cc]': 'AUTHENTIC',
-        r'[Vv][Ee3][Rr][Ii1][Ff][Ii1][Ee3][Dd]': 'VERIFIED',
-        r'[Tt][Ee3][Rr][Vv][Ee3][Rr][Ii1][Ff][Ii1][Kk][Aa4][Ss][Ii1]': 'TERVERIFIKASI',
-        r'[Vv][Aa4][Ll][Ii1][Dd][Aa4][Tt][Ee3][Dd]': 'VALIDATED',
-        r'[Tt][Ee3][Rr][Vv][Aa4][Ll][Ii1][Dd][Aa4][Ss][Ii1]': 'TERVALIDASI',
-        r'[Cc][Oo0][Nn][Ff][Ii1][Rr][Mm][Ee3][Dd]': 'CONFIRMED',
-        r'[Tt][Ee3][Rr][Kk][Oo0][Nn][Ff][Ii1][Rr][Mm][Aa4][Ss][Ii1]': 'TERKONFIRMASI',
-        r'[Aa4][Pp][Pp][Rr][Oo0][Vv][Ee3][Dd]': 'APPROVED',
-        r'[Dd][Ii1][Ss][Ee3][Tt][Uu][Jj][Uu][Ii1]': 'DISETUJUI',
-        r'[Rr][Ee3][Jj][Ee3][Cc][Tt][Ee3][Dd]': 'REJECTED',
-        r'[Dd][Ii1][Tt][Oo0][Ll][Aa4][Kk]': 'DITOLAK',
-        r'[Pp][Ee3][Nn][Dd][Ii1][Nn][Gg]': 'PENDING',
-        r'[Mm][Ee3][Nn][Uu][Nn][Gg][Gg][Uu]': 'MENUNGGU',
-        r'[Pp][Rr][Oo0][Cc][Ee3][Ss][Ss][Ii1][Nn][Gg]': 'PROCESSING',
-        r'[Mm][Ee3][Mm][Pp][Rr][Oo0][Ss][Ee3][Ss]': 'MEMPROSES',
-        r'[Cc][Oo0][Mm][Pp][Ll][Ee3][Tt][Ee3][Dd]': 'COMPLETED',
-        r'[Ss][Ee3][Ll][Ee3][Ss][Aa4][Ii1]': 'SELESAI',
-        r'[Ff][Ii1][Nn][Ii1][Ss][Hh][Ee3][Dd]': 'FINISHED',
-        r'[Ss][Ee3][Ll][Ee3][Ss][Aa4][Ii1]': 'SELESAI',
-        r'[Ss][Tt][Aa4][Rr][Tt][Ee3][Dd]': 'STARTED',
-        r'[Dd][Ii1][Mm][Uu][Ll][Aa4][Ii1]': 'DIMULAI',
-        r'[Ss][Tt][Oo0][Pp][Pp][Ee3][Dd]': 'STOPPED',
-        r'[Dd][Ii1][Hh][Ee3][Nn][Tt][Ii1][Kk][Aa4][Nn]': 'DIHENTIKAN',
-        r'[Pp][Aa4][Uu][Ss][Ee3][Dd]': 'PAUSED',
-        r'[Dd][Ii1][Jj][Ee3][Dd][Aa4]': 'DIJEDA',
-        r'[Rr][Ee3][Ss][Uu][Mm][Ee3][Dd]': 'RESUMED',
-        r'[Dd][Ii1][Ll][Aa4][Nn][Jj][Uu][Tt][Kk][Aa4][Nn]': 'DILANJUTKAN',
-        r'[Cc][Aa4][Nn][Cc][Ee3][Ll][Ll][Ee3][Dd]': 'CANCELLED',
-        r'[Dd][Ii1][Bb][Aa4][Tt][Aa4][Ll][Kk][Aa4][Nn]': 'DIBATALKAN',
-        r'[Pp][Oo0][Ss][Tt][Pp][Oo0][Nn][Ee3][Dd]': 'POSTPONED',
-        r'[Dd][Ii1][Tt][Uu][Nn][Dd][Aa4]': 'DITUNDA',
-        r'[Dd][Ee3][Ll][Aa4][Yy][Ee3][Dd]': 'DELAYED',
-        r'[Tt][Ee3][Rr][Tt][Uu][Nn][Dd][Aa4]': 'TERTUNDA',
-        r'[Ss][Cc][Hh][Ee3][Dd][Uu][Ll][Ee3][Dd]': 'SCHEDULED',
-        r'[Dd][Ii1][Jj][Aa4][Dd][Ww][Aa4][Ll][Kk][Aa4][Nn]': 'DIJADWALKAN',
-        r'[Pp][Ll][Aa4][Nn][Nn][Ee3][Dd]': 'PLANNED',
-        r'[Dd][Ii1][Rr][Ee3][Nn][Cc][Aa4][Nn][Aa4][Kk][Aa4][Nn]': 'DIRENCANAKAN',
-        r'[Oo0][Rr][Gg][Aa4][Nn][Ii1][Zz][Ee3][Dd]': 'ORGANIZED',
-        r'[Dd][Ii1][Oo0][Rr][Gg][Aa4][Nn][Ii1][Ss][Aa4][Ss][Ii1][Kk][Aa4][Nn]': 'DIORGANISASIKAN',
-        r'[Aa4][Rr][Rr][Aa4][Nn][Gg][Ee3][Dd]': 'ARRANGED',
-        r'[Dd][Ii1][Aa4][Tt][Uu][Rr]': 'DIATUR',
-        r'[Pp][Rr][Ee3][Pp][Aa4][Rr][Ee3][Dd]': 'PREPARED',
-        r'[Dd][Ii1][Ss][Ii1][Aa4][Pp][Kk][Aa4][Nn]': 'DISIAPKAN',
-        r'[Rr][Ee3][Aa4][Dd][Yy]': 'READY',
-        r'[Ss][Ii1][Aa4][Pp]': 'SIAP',
-        r'[Uu][Nn][Rr][Ee3][Aa4][Dd][Yy]': 'UNREADY',
-        r'[Tt][Ii1][Dd][Aa4][Kk][\s\-]?[Ss][Ii1][Aa4][Pp]': 'TIDAK SIAP',
-        r'[Aa4][Vv][Aa4][Ii1][Ll][Aa4][Bb][Ll][Ee3]': 'AVAILABLE',
-        r'[Tt][Ee3][Rr][Ss][Ee3][Dd][Ii1][Aa4]': 'TERSEDIA',
-        r'[Uu][Nn][Aa4][Vv][Aa4][Ii1][Ll][Aa4][Bb][Ll][Ee3]': 'UNAVAILABLE',
-        r'[Tt][Ii1][Dd][Aa4][Kk][\s\-]?[Tt][Ee3][Rr][Ss][Ee3][Dd][Ii1][Aa4]': 'TIDAK TERSEDIA',
-        r'[Aa4][Cc][Cc][Ee3][Ss][Ss][Ii1][Bb][Ll][Ee3]': 'ACCESSIBLE',
-        r'[Dd][Aa4][Pp][Aa4][Tt][\s\-]?[Dd][Ii1][Aa4][Kk][Ss][Ee3][Ss]': 'DAPAT DIAKSES',
-        r'[Ii1][Nn][Aa4][Cc][Cc][Ee3][Ss][Ss][Ii1][Bb][Ll][Ee3]': 'INACCESSIBLE',
-        r'[Tt][Ii1][Dd][Aa4][Kk][\s\-]?[Dd][Aa4][Pp][Aa4][Tt][\s\-]?[Dd][Ii1][Aa4][Kk][Ss][Ee3][Ss]': 'TIDAK DAPAT DIAKSES',
-        r'[Rr][Ee3][Aa4][Cc][Hh][Aa4][Bb][Ll][Ee3]': 'REACHABLE',
-        r'[Dd][Aa4][Pp][Aa4][Tt][\s\-]?[Dd][Ii1][Jj][Aa4][Nn][Gg][Kk][Aa4][Uu]': 'DAPAT DIJANGKAU',
-        r'[Uu][Nn][Rr][Ee3][Aa4][Cc][Hh][Aa4][Bb][Ll][Ee3]': 'UNREACHABLE',
-        r'[Tt][Ii1][Dd][Aa4][Kk][\s\-]?[Dd][Aa4][Pp][Aa4][Tt][\s\-]?[Dd][Ii1][Jj][Aa4][Nn][Gg][Kk][Aa4][Uu]': 'TIDAK DAPAT DIJANGKAU',
-        r'[Cc][Oo0][Nn][Nn][Ee3][Cc][Tt][Ee3][Dd]': 'CONNECTED',
-        r'[Tt][Ee3][Rr][Hh][Uu][Bb][Uu][Nn][Gg]': 'TERHUBUNG',
-        r'[Dd][Ii1][Ss][Cc][Oo0][Nn][Nn][Ee3][Cc][Tt][Ee3][Dd]': 'DISCONNECTED',
-        r'[Tt][Ee3][Rr][Pp][Uu][Tt][Uu][Ss]': 'TERPUTUS',
-        r'[Oo0][Nn][Ll][Ii1][Nn][Ee3]': 'ONLINE',
-        r'[Dd][Aa4][Rr][Ii1][Nn][Gg]': 'DARING',
-        r'[Oo0][Ff][Ff][Ll][Ii1][Nn][Ee3]': 'OFFLINE',
-        r'[Ll][Uu][Rr][Ii1][Nn][Gg]': 'LURING',
-        r'[Aa4][Cc][Tt][Ii1][Vv][Ee3]': 'ACTIVE',
-        r'[Aa4][Kk][Tt][Ii1][Ff]': 'AKTIF',
-        r'[Ii1][Nn][Aa4][Cc][Tt][Ii1][Vv][Ee3]': 'INACTIVE',
-        r'[Tt][Ii1][Dd][Aa4][Kk][\s\-]?[Aa4][Kk][Tt][Ii1][Ff]': 'TIDAK AKTIF',
-        r'[Ee3][Nn][Aa4][Bb][Ll][Ee3][Dd]': 'ENABLED',
-        r'[Dd][Ii1][Aa4][Kk][Tt][Ii1][Ff][Kk][Aa4][Nn]': 'DIAKTIFKAN',
-        r'[Dd][Ii1][Ss][Aa4][Bb][Ll][Ee3][Dd]': 'DISABLED',
-        r'[Dd][Ii1][Nn][Oo0][Nn][Aa4][Kk][Tt][Ii1][Ff][Kk][Aa4][Nn]': 'DINONAKTIFKAN',
-        r'[Ww][Oo0][Rr][Kk][Ii1][Nn][Gg]': 'WORKING',
-        r'[Bb][Ee3][Kk][Ee3][Rr][Jj][Aa4]': 'BEKERJA',
-        r'[Bb][Rr][Oo0][Kk][Ee3][Nn]': 'BROKEN',
-        r'[Rr][Uu][Ss][Aa4][Kk]': 'RUSAK',
-        r'[Ff][Uu][Nn][Cc][Tt][Ii1][Oo0][Nn][Aa4][Ll]': 'FUNCTIONAL',
-        r'[Bb][Ee3][Rr][Ff][Uu][Nn][Gg][Ss][Ii1]': 'BERFUNGSI',
-        r'[Dd][Yy][Ss][Ff][Uu][Nn][Cc][Tt][Ii1][Oo0][Nn][Aa4][Ll]': 'DYSFUNCTIONAL',
-        r'[Tt][Ii1][Dd][Aa4][Kk][\s\-]?[Bb][Ee3][Rr][Ff][Uu][Nn][Gg][Ss][Ii1]': 'TIDAK BERFUNGSI',
-        r'[Oo0][Pp][Ee3][Rr][Aa4][Tt][Ii1][Oo0][Nn][Aa4][Ll]': 'OPERATIONAL',
-        r'[Oo0][Pp][Ee3][Rr][Aa4][Ss][Ii1][Oo0][Nn][Aa4][Ll]': 'OPERASIONAL',
-        r'[Nn][Oo0][Nn][\s\-]?[Oo0][Pp][Ee3][Rr][Aa4][Tt][Ii1][Oo0][Nn][Aa4][Ll]': 'NON-OPERATIONAL',
-        r'[Tt][Ii1][Dd][Aa4][Kk][\s\-]?[Oo0][Pp][Ee3][Rr][Aa4][Ss][Ii1][Oo0][Nn][Aa4][Ll]': 'TIDAK OPERASIONAL',
-        r'[Rr][Uu][Nn][Nn][Ii1][Nn][Gg]': 'RUNNING',
-        r'[Bb][Ee3][Rr][Jj][Aa4][Ll][Aa4][Nn]': 'BERJALAN',
-        r'[Ss][Tt][Oo0][Pp][Pp][Ee3][Dd]': 'STOPPED',
-        r'[Bb][Ee3][Rr][Hh][Ee3][Nn][Tt][Ii1]': 'BERHENTI',
-        r'[Mm][Oo0][Vv][Ii1][Nn][Gg]': 'MOVING',
-        r'[Bb][Ee3][Rr][Gg][Ee3][Rr][Aa4][Kk]': 'BERGERAK',
-        r'[Ss][Tt][Aa4][Tt][Ii1][Oo0][Nn][Aa4][Rr][Yy]': 'STATIONARY',
-        r'[Dd][Ii1][Aa4][Mm]': 'DIAM',
-        r'[Mm][Oo0][Bb][Ii1][Ll][Ee3]': 'MOBILE',
-        r'[Bb][Ee3][Rr][Gg][Ee3][Rr][Aa4][Kk]': 'BERGERAK',
-        r'[Ii1][Mm][Mm][Oo0][Bb][Ii1][Ll][Ee3]': 'IMMOBILE',
-        r'[Tt][Ii1][Dd][Aa4][Kk][\s\-]?[Bb][Ee3][Rr][Gg][Ee3][Rr][Aa4][Kk]': 'TIDAK BERGERAK',
-        r'[Ff][Ll][Ee3][Xx][Ii1][Bb][Ll][Ee3]': 'FLEXIBLE',
-        r'[Ff][Ll][Ee3][Kk][Ss][Ii1][Bb][Ee3][Ll]': 'FLEKSIBEL',
-        r'[Rr][Ii1][Gg][Ii1][Dd]': 'RIGID',
-        r'[Kk][Aa4][Kk][Uu]': 'KAKU',
-        r'[Ss][Oo0][Ff][Tt]': 'SOFT',
-        r'[Ll][Uu][Nn][Aa4][Kk]': 'LUNAK',
-        r'[Hh][Aa4][Rr][Dd]': 'HARD',
-        r'[Kk][Ee3][Rr][Aa4][Ss]': 'KERAS',
-        r'[Ss][Mm][Oo0][Oo0][Tt][Hh]': 'SMOOTH',
-        r'[Hh][Aa4][Ll][Uu][Ss]': 'HALUS',
-        r'[Rr][Oo0][Uu][Gg][Hh]': 'ROUGH',
-        r'[Kk][Aa4][Ss][Aa4][Rr]': 'KASAR',
-        r'[Cc][Ll][Ee3][Aa4][Nn]': 'CLEAN',
-        r'[Bb][Ee3][Rr][Ss][Ii1][Hh]': 'BERSIH',
-        r'[Dd][Ii1][Rr][Tt][Yy]': 'DIRTY',
-        r'[Kk][Oo0][Tt][Oo0][Rr]': 'KOTOR',
-        r'[Ff][Rr][Ee3][Ss][Hh]': 'FRESH',
-        r'[Ss][Ee3][Gg][Aa4][Rr]': 'SEGAR',
-        r'[Ss][Tt][Aa4][Ll][Ee3]': 'STALE',
-        r'[Bb][Aa4][Ss][Ii1]': 'BASI',
-        r'[Nn][Ee3][Ww]': 'NEW',
-        r'[Bb][Aa4][Rr][Uu]': 'BARU',
-        r'[Oo0][Ll][Dd]': 'OLD',
-        r'[Ll][Aa4][Mm][Aa4]': 'LAMA',
-        r'[Mm][Oo0][Dd][Ee3][Rr][Nn]': 'MODERN',
-        r'[Tt][Rr][Aa4][Dd][Ii1][Tt][Ii1][Oo0][Nn][Aa4][Ll]': 'TRADITIONAL',
-        r'[Tt][Rr][Aa4][Dd][Ii1][Ss][Ii1][Oo0][Nn][Aa4][Ll]': 'TRADISIONAL',
-        r'[Cc][Oo0][Nn][Tt][Ee3][Mm][Pp][Oo0][Rr][Aa4][Rr][Yy]': 'CONTEMPORARY',
-        r'[Kk][Oo0][Nn][Tt][Ee3][Mm][Pp][Oo0][Rr][Ee3][Rr]': 'KONTEMPORER',
-        r'[Cc][Ll][Aa4][Ss][Ss][Ii1][Cc]': 'CLASSIC',
-        r'[Kk][Ll][Aa4][Ss][Ii1][Kk]': 'KLASIK',
-        r'[Vv][Ii1][Nn][Tt][Aa4][Gg][Ee3]': 'VINTAGE',
-        r'[Aa4][Nn][Tt][Ii1][Qq][Uu][Ee3]': 'ANTIQUE',
-        r'[Aa4][Nn][Tt][Ii1][Kk]': 'ANTIK',
-        r'[Rr][Ee3][Cc][Ee3][Nn][Tt]': 'RECENT',
-        r'[Bb][Aa4][Rr][Uu][\s\-]?[Bb][Aa4][Rr][Uu][\s\-]?[Ii1][Nn][Ii1]': 'BARU-BARU INI',
-        r'[Aa4][Nn][Cc][Ii1][Ee3][Nn][Tt]': 'ANCIENT',
-        r'[Kk][Uu][Nn][Oo0]': 'KUNO',
-        r'[Cc][Uu][Rr][Rr][Ee3][Nn][Tt]': 'CURRENT',
-        r'[Ss][Aa4][Aa4][Tt][\s\-]?[Ii1][Nn][Ii1]': 'SAAT INI',
-        r'[Oo0][Uu][Tt][Dd][Aa4][Tt][Ee3][Dd]': 'OUTDATED',
-        r'[Kk][Ee3][Tt][Ii1][Nn][Gg][Gg][Aa4][Ll][Aa4][Nn][\s\-]?[Zz][Aa4][Mm][Aa4][Nn]': 'KETINGGALAN ZAMAN',
-        r'[Uu][Pp][Dd][Aa4][Tt][Ee3][Dd]': 'UPDATED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Bb][Aa4][Rr][Uu][Ii1]': 'DIPERBARUI',
-        r'[Uu][Pp][Gg][Rr][Aa4][Dd][Ee3][Dd]': 'UPGRADED',
-        r'[Dd][Ii1][Tt][Ii1][Nn][Gg][Kk][Aa4][Tt][Kk][Aa4][Nn]': 'DITINGKATKAN',
-        r'[Dd][Oo0][Ww][Nn][Gg][Rr][Aa4][Dd][Ee3][Dd]': 'DOWNGRADED',
-        r'[Dd][Ii1][Tt][Uu][Rr][Uu][Nn][Kk][Aa4][Nn]': 'DITURUNKAN',
-        r'[Ii1][Mm][Pp][Rr][Oo0][Vv][Ee3][Dd]': 'IMPROVED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Bb][Aa4][Ii1][Kk][Ii1]': 'DIPERBAIKI',
-        r'[Ww][Oo0][Rr][Ss][Ee3][Nn][Ee3][Dd]': 'WORSENED',
-        r'[Mm][Ee3][Mm][Bb][Uu][Rr][Uu][Kk]': 'MEMBURUK',
-        r'[Ee3][Nn][Hh][Aa4][Nn][Cc][Ee3][Dd]': 'ENHANCED',
-        r'[Dd][Ii1][Tt][Ii1][Nn][Gg][Kk][Aa4][Tt][Kk][Aa4][Nn]': 'DITINGKATKAN',
-        r'[Rr][Ee3][Dd][Uu][Cc][Ee3][Dd]': 'REDUCED',
-        r'[Dd][Ii1][Kk][Uu][Rr][Aa4][Nn][Gg][Ii1]': 'DIKURANGI',
-        r'[Ii1][Nn][Cc][Rr][Ee3][Aa4][Ss][Ee3][Dd]': 'INCREASED',
-        r'[Dd][Ii1][Tt][Ii1][Nn][Gg][Kk][Aa4][Tt][Kk][Aa4][Nn]': 'DITINGKATKAN',
-        r'[Dd][Ee3][Cc][Rr][Ee3][Aa4][Ss][Ee3][Dd]': 'DECREASED',
-        r'[Dd][Ii1][Kk][Uu][Rr][Aa4][Nn][Gg][Ii1]': 'DIKURANGI',
-        r'[Ee3][Xx][Pp][Aa4][Nn][Dd][Ee3][Dd]': 'EXPANDED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Ll][Uu][Aa4][Ss]': 'DIPERLUAS',
-        r'[Cc][Oo0][Nn][Tt][Rr][Aa4][Cc][Tt][Ee3][Dd]': 'CONTRACTED',
-        r'[Dd][Ii1][Kk][Oo0][Nn][Tt][Rr][Aa4][Kk]': 'DIKONTRAK',
-        r'[Ee3][Xx][Tt][Ee3][Nn][Dd][Ee3][Dd]': 'EXTENDED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Pp][Aa4][Nn][Jj][Aa4][Nn][Gg]': 'DIPERPANJANG',
-        r'[Ss][Hh][Oo0][Rr][Tt][Ee3][Nn][Ee3][Dd]': 'SHORTENED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Ss][Ii1][Nn][Gg][Kk][Aa4][Tt]': 'DIPERSINGKAT',
-        r'[Ll][Ee3][Nn][Gg][Tt][Hh][Ee3][Nn][Ee3][Dd]': 'LENGTHENED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Pp][Aa4][Nn][Jj][Aa4][Nn][Gg]': 'DIPERPANJANG',
-        r'[Ww][Ii1][Dd][Ee3][Nn][Ee3][Dd]': 'WIDENED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Ll][Ee3][Bb][Aa4][Rr]': 'DIPERLEBAR',
-        r'[Nn][Aa4][Rr][Rr][Oo0][Ww][Ee3][Dd]': 'NARROWED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Ss][Ee3][Mm][Pp][Ii1][Tt]': 'DIPERSEMPIT',
-        r'[Bb][Rr][Oo0][Aa4][Dd][Ee3][Nn][Ee3][Dd]': 'BROADENED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Ll][Uu][Aa4][Ss]': 'DIPERLUAS',
-        r'[Dd][Ee3][Ee3][Pp][Ee3][Nn][Ee3][Dd]': 'DEEPENED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Dd][Aa4][Ll][Aa4][Mm]': 'DIPERDALAM',
-        r'[Ss][Hh][Aa4][Ll][Ll][Oo0][Ww][Ee3][Dd]': 'SHALLOWED',
-        r'[Dd][Ii1][Pp][Ee3][Rr][Dd][Aa4][Nn][Gg][Kk][Aa4][Ll]': 'DIPERDANGKAL',
-        r'[Rr][Aa4][Ii1][Ss][Ee3][Dd]': 'RAISED',
-        r'[Dd][Ii1][Nn][Aa4][Ii1][Kk][Kk][Aa4][Nn]': 'DINAIKKAN',
-        r'[Ll][Oo0][Ww][Ee3][Rr][Ee3][Dd]': 'LOWERED',
-        r'[Dd][Ii1][Tt][Uu][Rr][Uu][Nn][Kk][Aa4][Nn]': 'DITURUNKAN',
-        r'[Ll][Ii1][Ff][Tt][Ee3][Dd]': 'LIFTED',
-        r'[Dd][Ii1][Aa4][Nn][Gg][Kk][Aa4][Tt]': 'DIANGKAT',
-        r'[Dd][Rr][Oo0][Pp][Pp][Ee3][Dd]': 'DROPPED',
-        r'[Dd][Ii1][Jj][Aa4][Tt][Uu][Hh][Kk][Aa4][Nn]': 'DIJATUHKAN',
-
-        # Final 50+ patterns to reach 1000+
-        r'[Pp][Uu][Ss][Hh][Ee3][Dd]': 'PUSHED',
-        r'[Dd][Ii1][Dd][Oo0][Rr][Oo0][Nn][Gg]': 'DIDORONG',
-        r'[Pp][Uu][Ll][Ll][Ee3][Dd]': 'PULLED',
-        r'[Dd][Ii1][Tt][Aa4][Rr][Ii1][Kk]': 'DITARIK',
-        r'[Tt][Ww][Ii1][Ss][Tt][Ee3][Dd]': 'TWISTED',
-        r'[Dd][Ii1][Pp][Uu][Tt][Aa4][Rr]': 'DIPUTAR',
-        r'[Tt][Uu][Rr][Nn][Ee3][Dd]': 'TURNED',
-        r'[Dd][Ii1][Bb][Aa4][Ll][Ii1][Kk]': 'DIBALIK',
-        r'[Ff][Ll][Ii1][Pp][Pp][Ee3][Dd]': 'FLIPPED',
-        r'[Dd][Ii1][Bb][Aa4][Ll][Ii1][Kk][Kk][Aa4][Nn]': 'DIBALIKKAN',
-        r'[Rr][Oo0][Tt][Aa4][Tt][Ee3][Dd]': 'ROTATED',
-        r'[Dd][Ii1][Rr][Oo0][Tt][Aa4][Ss][Ii1]': 'DIROTASI',
-        r'[Ss][Pp][Uu][Nn]': 'SPUN',
-        r'[Dd][Ii1][Pp][Uu][Tt][Aa4][Rr]': 'DIPUTAR',
-        r'[Rr][Oo0][Ll][Ll][Ee3][Dd]': 'ROLLED',
-        r'[Dd][Ii1][Gg][Uu][Ll][Ii1][Nn][Gg]': 'DIGULING',
-        r'[Ss][Ll][Ii1][Dd]': 'SLID',
-        r'[Dd][Ii1][Gg][Ee3][Ss][Ee3][Rr]': 'DIGESER',
-        r'[Ss][Hh][Ii1][Ff][Tt][Ee3][Dd]': 'SHIFTED',
-        r'[Dd][Ii1][Pp][Ii1][Nn][Dd][Aa4][Hh]': 'DIPINDAH',
-        r'[Mm][Oo0][Vv][Ee3][Dd]': 'MOVED',
-        r'[Dd][Ii1][Pp][Ii1][Nn][Dd][Aa4][Hh][Kk][Aa4][Nn]': 'DIPINDAHKAN',
-        r'[Tt][Rr][Aa4][Nn][Ss][Ff][Ee3][Rr][Rr][Ee3][Dd]': 'TRANSFERRED',
-        r'[Dd][Ii1][Tt][Rr][Aa4][Nn][Ss][Ff][Ee3][Rr]': 'DITRANSFER',
-        r'[Cc][Aa4][Rr][Rr][Ii1][Ee3][Dd]': 'CARRIED',
-        r'[Dd][Ii1][Bb][Aa4][Ww][Aa4]': 'DIBAWA',
-        r'[Tt][Rr][Aa4][Nn][Ss][Pp][Oo0][Rr][Tt][Ee3][Dd]': 'TRANSPORTED',
-        r'[Dd][Ii1][Aa4][Nn][Gg][Kk][Uu][Tt]': 'DIANGKUT',
-        r'[Dd][Ee3][Ll][Ii1][Vv][Ee3][Rr][Ee3][Dd]': 'DELIVERED',
-        r'[Dd][Ii1][Aa4][Nn][Tt][Aa4][Rr]': 'DIANTAR',
-        r'[Ss][Ee3][Nn][Tt]': 'SENT',
-        r'[Dd][Ii1][Kk][Ii1][Rr][Ii1][Mm]': 'DIKIRIM',
-        r'[Rr][Ee3][Cc][Ee3][Ii1][Vv][Ee3][Dd]': 'RECEIVED',
-        r'[Dd][Ii1][Tt][Ee3][Rr][Ii1][Mm][Aa4]': 'DITERIMA',
-        r'[Aa4][Cc][Cc][Ee3][Pp][Tt][Ee3][Dd]': 'ACCEPTED',
-        r'[Dd][Ii1][Tt][Ee3][Rr][Ii1][Mm][Aa4]': 'DITERIMA',
-        r'[Dd][Ee3][Cc][Ll][Ii1][Nn][Ee3][Dd]': 'DECLINED',
-        r'[Dd][Ii1][Tt][Oo0][Ll][Aa4][Kk]': 'DITOLAK',
-        r'[Rr][Ee3][Ff][Uu][Ss][Ee3][Dd]': 'REFUSED',
-        r'[Dd][Ii1][Tt][Oo0][Ll][Aa4][Kk]': 'DITOLAK',
-        r'[Dd][Ee3][Nn][Ii1][Ee3][Dd]': 'DENIED',
-        r'[Dd][Ii1][Tt][Oo0][Ll][Aa4][Kk]': 'DITOLAK',
-        r'[Bb][Ll][Oo0][Cc][Kk][Ee3][Dd]': 'BLOCKED',
-        r'[Dd][Ii1][Bb][Ll][Oo0][Kk][Ii1][Rr]': 'DIBLOKIR',
-        r'[Bb][Aa4][Nn][Nn][Ee3][Dd]': 'BANNED',
-        r'[Dd][Ii1][Ll][Aa4][Rr][Aa4][Nn][Gg]': 'DILARANG',
-        r'[Ff][Oo0][Rr][Bb][Ii1][Dd][Dd][Ee3][Nn]': 'FORBIDDEN',
-        r'[Dd][Ii1][Ll][Aa4][Rr][Aa4][Nn][Gg]': 'DILARANG',
-        r'[Pp][Rr][Oo0][Hh][Ii1][Bb][Ii1][Tt][Ee3][Dd]': 'PROHIBITED',
-        r'[Dd][Ii1][Ll][Aa4][Rr][Aa4][Nn][Gg]': 'DILARANG',
-        r'[Rr][Ee3][Ss][Tt][Rr][Ii1][Cc][Tt][Ee3][Dd]': 'RESTRICTED',
-        r'[Dd][Ii1][Bb][Aa4][Tt][Aa4][Ss][Ii1]': 'DIBATASI',
-        r'[Ll][Ii1][Mm][Ii1][Tt][Ee3][Dd]': 'LIMITED',
-        r'[Tt][Ee3][Rr][Bb][Aa4][Tt][Aa4][Ss]': 'TERBATAS',
-        r'[Uu][Nn][Ll][Ii1][Mm][Ii1][Tt][Ee3][Dd]': 'UNLIMITED',
-        r'[Tt][Aa4][Nn][Pp][Aa4][\s\-]?[Bb][Aa4][Tt][Aa4][Ss]': 'TANPA BATAS',
-        r'[Kk][Oo0][Nn][Tt][Aa4][Kk]': 'KONTAK',
-        r'[Mm][Ii1][Nn][Ii1][Mm][Aa4][Ll]': 'MINIMAL',
-        r'[Tt][Aa4][Hh][Uu][Nn]': 'TAHUN',
-
-        # Additional Indonesian terms
-        r'[Pp][Ee3][Rr][Uu][Ss5][Aa4][Hh][Aa4][Aa4][Nn]': 'PERUSAHAAN',
-        r'[Kk][Aa4][Rr][Yy][Aa4][Ww][Aa4][Nn]': 'KARYAWAN',
-        r'[Pp][Ee3][Nn][Dd][Ii1][Dd][Ii1][Kk][Aa4][Nn]': 'PENDIDIKAN',
-        r'[Kk][Ee3][Aa4][Hh][Ll][Ii1][Aa4][Nn]': 'KEAHLIAN',
-        r'[Ll][Aa4][Mm][Aa4][Rr][Aa4][Nn]': 'LAMARAN',
-        r'[Tt][Ee3][Rr][Ii1][Mm][Aa4]': 'TERIMA',
-        r'[Kk][Aa4][Ss5][Ii1][Hh]': 'KASIH',
-        r'[Ss5][Ee3][Gg][Ee3][Rr][Aa4]': 'SEGERA',
-        r'[Dd][Ii1][Bb][Uu][Tt][Uu][Hh][Kk][Aa4][Nn]': 'DIBUTUHKAN',
-        r'[Dd][Ii1][Cc][Aa4][Rr][Ii1]': 'DICARI',
-
-        # Common OCR errors for Indonesian
-        r'[Rr][Pp]\.?\s*[0-9]': lambda m: 'Rp ' + m.group().replace('Rp', '').replace('.', '').strip(),
-        r'[Jj][Aa4][Kk][Aa4][Rr][Tt][Aa4]': 'JAKARTA',
-        r'[Ss5][Uu][Rr][Aa4][Bb][Aa4][Yy][Aa4]': 'SURABAYA',
-        r'[Bb][Aa4][Nn][Dd][Uu][Nn][Gg]': 'BANDUNG',
-        r'[Mm][Ee3][Dd][Aa4][Nn]': 'MEDAN',
-        r'[Ss5][Ee3][Mm][Aa4][Rr][Aa4][Nn][Gg]': 'SEMARANG'
-}
+    return get_ocr_corrector().correct(text)
 
 
 # Dataset information
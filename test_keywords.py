@@ -6,36 +6,27 @@ Test script to check keyword counts
 import index
 
 print("✅ Backend loaded successfully!")
+lexicons = index.get_lexicons()
+keywords = lexicons.keywords
+print(f"📚 Lexicon version: {lexicons.version}")
 print()
 print("📊 Keyword Analysis:")
-print(f"  - Legitimate indicators: {len(index.INDONESIAN_KEYWORDS['legitimate_indicators'])} words")
-print(f"  - Suspicious indicators: {len(index.INDONESIAN_KEYWORDS['suspicious_indicators'])} words") 
-print(f"  - Neutral keywords: {len(index.INDONESIAN_KEYWORDS['neutral_keywords'])} words")
+print(f"  - Legitimate indicators: {len(keywords['legitimate_indicators'])} words")
+print(f"  - Suspicious indicators: {len(keywords['suspicious_indicators'])} words") 
+print(f"  - Neutral keywords: {len(keywords['neutral_keywords'])} words")
 
 total_keywords = (
-    len(index.INDONESIAN_KEYWORDS['legitimate_indicators']) + 
-    len(index.INDONESIAN_KEYWORDS['suspicious_indicators']) + 
-    len(index.INDONESIAN_KEYWORDS['neutral_keywords'])
+    len(keywords['legitimate_indicators']) + 
+    len(keywords['suspicious_indicators']) + 
+    len(keywords['neutral_keywords'])
 )
 
 print(f"  - Total keywords: {total_keywords} words")
 print()
 
-# Test enhanced word fixes by counting patterns in the function
+# Count the OCR fix patterns in lexicons/ocr_fixes.json
 print("🔧 Enhanced Indonesian Word Fixes:")
-print("  - Counting OCR fix patterns in source code...")
-
-# Count patterns by reading the source file directly
-with open('backend_working.py', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Find word_fixes dictionary
-word_fixes_start = content.find('word_fixes = {')
-word_fixes_end = content.find('\n    }', word_fixes_start)
-word_fixes_section = content[word_fixes_start:word_fixes_end]
-
-# Count patterns (each line with ':' is a pattern)
-pattern_count = word_fixes_section.count("': '") + word_fixes_section.count('": "')
+pattern_count = len(lexicons.word_fixes) + len(lexicons.pattern_fixes)
 print(f"  - Total OCR fix patterns: {pattern_count} patterns")
 print()
 
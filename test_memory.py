@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Memory check for the OCR pipeline: posts synthetic posters of growing
+resolution to /api/extract-text with MEMORY_PROFILING on and asserts the
+per-request peak (tracemalloc) stays within REQUEST_MEMORY_BUDGET_BYTES,
+and that tiled images stay flat regardless of resolution.
+
+Run: python test_memory.py   (or pytest test_memory.py)
+"""
+
+import io
+
+import pytest
+from PIL import Image, ImageDraw
+
+import index
+
+# (width, height) of the synthetic posters; the last two take the tiled path
+POSTER_SIZES = [(800, 1200), (2400, 3200), (4000, 6000), (6000, 9000)]
+
+# Peak allowed for tiled images, independent of their resolution
+TILED_PEAK_LIMIT_BYTES = 64 * 1024 * 1024
+
+def make_poster(width, height):
+    """PNG bytes of a white poster with lines of job-ad text"""
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+    for y in range(40, height - 40, 60):
+        draw.text((40, y), "LOWONGAN KERJA PT MAJU JAYA - gaji 5 juta, hubungi HRD", fill='black')
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+def test_request_peak_memory():
+    if not index.ocr_status.get('available'):
+        pytest.skip("Tesseract not available - skipping memory check")
+
+    # Set here, not through the environment: index may already be imported (pytest collects
+    # every test module first); the profile reads the config on each request
+    saved = {name: index.app.config[name] for name in ('MEMORY_PROFILING', 'OCR_CACHE_ENABLED')}
+    saved_cache = index.ocr_cache
+    index.app.config['MEMORY_PROFILING'] = True
+    # Every request must run the full pipeline
+    index.app.config['OCR_CACHE_ENABLED'] = False
+    index.ocr_cache = None
+    try:
+        check_request_peak_memory()
+    finally:
+        index.app.config.update(saved)
+        index.ocr_cache = saved_cache
+
+def check_request_peak_memory():
+    client = index.app.test_client()
+    budget = index.app.config['REQUEST_MEMORY_BUDGET_BYTES']
+    threshold = index.app.config['OCR_TILE_THRESHOLD_PIXELS']
+
+    for width, height in POSTER_SIZES:
+        response = client.post('/api/extract-text', data={
+            'file': (io.BytesIO(make_poster(width, height)), 'poster.png'),
+            'mode': 'fast'
+        })
+        details = (response.get_json().get('data') or {}).get('ocr_details') or {}
+        memory = details.get('memory')
+        assert memory, f"No memory report for {width}x{height}"
+
+        stages = ', '.join(f"{name} {stage['peak_bytes'] / 1e6:.1f}MB" for name, stage in memory['stages'].items())
+        print(f"📊 {width}x{height}: peak {memory['peak_bytes'] / 1e6:.1f}MB ({stages})")
+
+        assert memory['peak_bytes'] <= budget, f"{width}x{height} peak over budget"
+        if width * height > threshold:
+            assert memory['peak_bytes'] <= TILED_PEAK_LIMIT_BYTES, f"{width}x{height} tiled peak grows with resolution"
+
+    print("✅ Per-request peak memory within budget")
+
+if __name__ == '__main__':
+    try:
+        test_request_peak_memory()
+    except pytest.skip.Exception as e:
+        print(f"⚠️ {e.msg}")
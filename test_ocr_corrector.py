@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+OCR post-correction: valid words outside the spelling vocabulary must
+pass through unchanged; only tokens showing OCR evidence (digits mixed
+with letters, letter pairs read for one letter) are corrected.
+
+Run: python test_ocr_corrector.py   (or pytest test_ocr_corrector.py)
+"""
+
+import index
+
+# Valid Indonesian/English words the vocabulary lacks, each one plausible edit from a word it has
+VALID_WORDS = ['penempatan', 'candidate', 'skills', 'Penempatan', 'SKILLS', 'Candidates', 'internasional', 'modern']
+
+def small_corrector():
+    """A corrector whose vocabulary holds the near neighbours of VALID_WORDS"""
+    vocabulary = {'perempatan': 1, 'kandidat': 3, 'skill': 5, 'pengalaman': 4, 'lowongan': 6, 'internasional': 1}
+    speller = index.SymSpell(vocabulary, index.app.config['OCR_SPELL_MAX_DISTANCE'])
+    return index.OCRCorrector({}, speller=speller, min_length=index.app.config['OCR_SPELL_MIN_LENGTH'])
+
+def test_valid_words_outside_vocabulary_unchanged():
+    text = ' '.join(VALID_WORDS)
+    for corrector in (small_corrector(), index.get_ocr_corrector()):
+        assert corrector.correct(text) == text, corrector.correct(text)
+    assert index.clean_extracted_text(f"Penempatan: Jakarta. Skills: Excel, candidate {text}") == \
+        f"Penempatan: Jakarta. Skills: Excel, candidate {text}"
+
+def test_misread_words_corrected():
+    corrector = small_corrector()
+    cases = {
+        'pengalarnan': 'pengalaman',  # 'rn' read for 'm'
+        'PENGALARNAN': 'PENGALAMAN',
+        'L0WONGAN': 'LOWONGAN',  # Digit among letters
+        'l0wongau': 'lowongan',
+        'intemasional': 'intemasional',  # No OCR evidence: left alone
+    }
+    for token, expected in cases.items():
+        assert corrector.correct(token) == expected, f"{token} -> {corrector.correct(token)}, expected {expected}"
+
+if __name__ == '__main__':
+    test_valid_words_outside_vocabulary_unchanged()
+    test_misread_words_corrected()
+    print("✅ OCR corrector keeps valid words and fixes evidenced misreads")
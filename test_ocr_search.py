@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+OCR strategy search: with run_ocr_strategy stubbed by sleeps, checks that
+strategies after the first run concurrently in the OCR pool, and that the
+deadline returns the best candidate finished by then.
+
+Run: python test_ocr_search.py   (or pytest test_ocr_search.py)
+"""
+
+import threading
+import time
+
+from PIL import Image
+
+import index
+
+POOL_SIZE = 3
+
+class StubStrategies:
+    """Stands in for run_ocr_strategy: the nth call sleeps and scores as plans[n] says"""
+
+    def __init__(self, plans):
+        self.plans = plans
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_at_start = []
+
+    def __call__(self, image, config, timeout, scoring):
+        with self.lock:
+            seconds, score = self.plans[min(self.calls, len(self.plans) - 1)]
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.in_flight_at_start.append(self.in_flight)
+        try:
+            time.sleep(seconds)
+            return {'text': 'lowongan kerja staff admin', 'score': score, 'confidence': 0.3, 'words': []}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+def run_search(stub, deadline_seconds):
+    """search_ocr_strategies on a blank poster in balanced mode, OCR stubbed, in a POOL_SIZE pool"""
+    saved = {name: index.app.config[name] for name in ('OCR_MAX_WORKERS', 'OCR_PATIENCE')}
+    saved_run, saved_executor = index.run_ocr_strategy, index.ocr_executor
+    saved_stats = dict(index.ocr_strategy_stats)
+    index.app.config.update(OCR_MAX_WORKERS=POOL_SIZE, OCR_PATIENCE=100)
+    index.run_ocr_strategy, index.ocr_executor = stub, None
+    try:
+        tier = dict(index.resolve_ocr_mode('balanced'), text_regions=False, confidence_passes=8)
+        decoded = index.DecodedImage(Image.new('RGB', (400, 300), 'white'))
+        start = time.monotonic()
+        best, attempts = index.search_ocr_strategies(
+            decoded, 'confidence', start + deadline_seconds, 'screenshot', tier
+        )
+        return best, attempts, time.monotonic() - start
+    finally:
+        index.ocr_executor.shutdown(wait=False)
+        index.app.config.update(saved)
+        index.run_ocr_strategy, index.ocr_executor = saved_run, saved_executor
+        index.ocr_strategy_stats.clear()
+        index.ocr_strategy_stats.update(saved_stats)
+
+def test_strategies_run_concurrently():
+    stub = StubStrategies([(0.05, 100)] + [(0.2, 100 + 10 * n) for n in range(1, 8)])
+    best, attempts, seconds = run_search(stub, deadline_seconds=10)
+    print(f"🔀 {attempts} strategies in {seconds:.2f}s, up to {stub.max_in_flight} at once")
+
+    assert stub.in_flight_at_start[0] == 1 and stub.in_flight_at_start[1] == 1, "First pass not run on its own"
+    assert stub.max_in_flight == POOL_SIZE, f"Only {stub.max_in_flight} strategies in flight at once"
+    assert attempts == 8
+    assert best['score'] == 170
+    assert seconds < 8 * 0.2, "Strategies ran one after another"
+
+def test_deadline_returns_best_so_far():
+    # Two quick candidates, then strategies that outlive the deadline
+    stub = StubStrategies([(0.05, 100), (0.1, 300), (0.15, 200), (1.0, 999)])
+    best, attempts, seconds = run_search(stub, deadline_seconds=0.5)
+    print(f"⏱️ Deadline: best score {best['score']} after {attempts} strategies in {seconds:.2f}s")
+
+    assert seconds < 0.9, "Search outlived its deadline"
+    assert best['score'] == 300, "Best finished candidate not returned"
+    assert attempts == 3
+
+if __name__ == '__main__':
+    test_strategies_run_concurrently()
+    test_deadline_returns_best_so_far()
+    print("✅ OCR strategy search runs concurrently and honours its deadline")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Text pre-check: posters whose only text is a single headline word must
+still be sent to OCR, and blank or textless images must not.
+
+Run: python test_text_precheck.py   (or pytest test_text_precheck.py)
+"""
+
+from PIL import Image, ImageDraw, ImageFont
+
+import index
+
+POSTER_SIZE = (1000, 1400)
+
+def make_poster(word, text_height):
+    """White poster with one black word, text_height pixels tall (the default bitmap font, enlarged)"""
+    font = ImageFont.load_default()
+    left, top, right, bottom = font.getbbox(word)
+    glyphs = Image.new('L', (right - left, bottom - top), 255)
+    ImageDraw.Draw(glyphs).text((-left, -top), word, fill=0, font=font)
+    scale = text_height / float(glyphs.height)
+    glyphs = glyphs.resize((round(glyphs.width * scale), text_height), Image.NEAREST)
+
+    poster = Image.new('RGB', POSTER_SIZE, 'white')
+    poster.paste(glyphs.convert('RGB'), ((POSTER_SIZE[0] - glyphs.width) // 2, 300))
+    return poster
+
+def make_shapes():
+    """Textless poster: a few scattered solid shapes"""
+    poster = Image.new('RGB', POSTER_SIZE, (90, 140, 200))
+    draw = ImageDraw.Draw(poster)
+    for x, y, radius in [(200, 300, 60), (700, 250, 150), (400, 900, 30), (850, 1200, 90)]:
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=(240, 200, 40))
+    return poster
+
+def precheck(image):
+    return index.estimate_text_likelihood(index.DecodedImage(image))
+
+def test_single_word_posters_reach_ocr():
+    for word, text_height in [('DIBUTUHKAN', 40), ('LOKER', 80), ('LOKER', 40)]:
+        check = precheck(make_poster(word, text_height))
+        print(f"📝 {word} at {text_height}px: {check}")
+        assert check['likely'], f"{word} at {text_height}px skipped before OCR"
+
+def test_textless_images_are_skipped():
+    for name, image in [('blank', Image.new('RGB', POSTER_SIZE, 'white')), ('shapes', make_shapes())]:
+        check = precheck(image)
+        print(f"🖼️ {name}: {check}")
+        assert not check['likely'], f"{name} image sent to OCR"
+
+if __name__ == '__main__':
+    test_single_word_posters_reach_ocr()
+    test_textless_images_are_skipped()
+    print("✅ Text pre-check keeps single-word posters and skips textless images")
@@ -19,16 +19,19 @@ import joblib
 import warnings
 warnings.filterwarnings('ignore')
 
-# Import OCR function from backend
 sys.path.append('.')
+
+# Text features shared with the backend
+from featurizer import FEATURE_NAMES, TextFeaturizer
+
+# Import OCR function from backend
 try:
     from index import extract_text_with_ocr
     print("✅ OCR function imported successfully")
 
-    # Test OCR setup
-    import pytesseract
-    pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-    print("✅ Tesseract path configured")
+    # Tesseract is resolved by the backend at import (set TESSERACT_CMD to override)
+    from index import ocr_status
+    print(f"✅ Tesseract path configured: {ocr_status.get('path', 'not found')}")
 
 except ImportError as e:
     print(f"❌ Error importing OCR function: {e}")
@@ -73,88 +76,9 @@ def extract_text_from_images(image_paths, label, max_images=50):
     return texts, labels
 
 def extract_features(texts):
-    """Extract comprehensive features from texts"""
-    # Enhanced keyword lists
-    GENUINE_KEYWORDS = [
-        'pengalaman', 'kualifikasi', 'syarat', 'tanggung jawab', 'tunjangan',
-        'gaji', 'wawancara', 'lamaran', 'kandidat', 'posisi', 'lowongan',
-        'kerja', 'pekerjaan', 'perusahaan', 'pt', 'cv', 'tbk', 'profesional',
-        'karir', 'jabatan', 'keahlian', 'kemampuan', 'keterampilan',
-        'pendidikan', 'gelar', 'ijazah', 'sertifikat', 'pelatihan',
-        'interview', 'recruitment', 'hiring', 'vacancy', 'position',
-        'experience', 'qualification', 'requirement', 'responsibility',
-        'salary', 'benefit', 'career', 'professional', 'skill',
-        'kantor', 'office', 'company', 'corporation', 'enterprise',
-        'industri', 'bisnis', 'organisasi', 'institusi', 'lembaga'
-    ]
-    
-    FAKE_KEYWORDS = [
-        # Urgency/pressure words
-        'mudah', 'cepat', 'instant', 'langsung', 'tanpa modal', 'gratis',
-        'buruan', 'terbatas', 'deadline', 'segera', 'jangan sampai', 'terlewat',
-        'kesempatan emas', 'limited time', 'sekarang juga', 'hari ini',
-
-        # MLM/Scam indicators
-        'kerja rumah', 'work from home', 'online', 'part time', 'freelance',
-        'sampingan', 'tambahan', 'passive income', 'join', 'member',
-        'downline', 'upline', 'bonus', 'komisi', 'reward', 'cashback',
-
-        # Money promises
-        'jutaan', 'milyar', 'unlimited', 'tak terbatas', 'penghasilan besar',
-        'kaya', 'sukses', 'investasi', 'trading', 'forex', 'crypto', 'bitcoin',
-
-        # Suspicious contact methods
-        'whatsapp', 'wa', 'telegram', 'dm', 'chat', 'hubungi', 'kontak',
-        'no interview', 'tanpa wawancara', 'langsung kerja', 'tanpa pengalaman'
-    ]
-    
-    features = []
-    
-    for text in texts:
-        text_lower = text.lower()
-        
-        # Basic features
-        feature_dict = {
-            'length': len(text),
-            'word_count': len(text.split()),
-            'sentence_count': len([s for s in text.split('.') if s.strip()]),
-            'avg_word_length': np.mean([len(word) for word in text.split()]) if text.split() else 0,
-        }
-        
-        # Keyword features
-        genuine_count = sum(1 for kw in GENUINE_KEYWORDS if kw in text_lower)
-        fake_count = sum(1 for kw in FAKE_KEYWORDS if kw in text_lower)
-        
-        feature_dict.update({
-            'genuine_keywords': genuine_count,
-            'fake_keywords': fake_count,
-            'keyword_ratio': genuine_count / max(fake_count, 1),
-        })
-        
-        # Structure features (ENHANCED)
-        feature_dict.update({
-            'has_email': '@' in text,
-            'has_phone': any(char.isdigit() for char in text),
-            'has_address': any(word in text_lower for word in ['jl', 'jalan', 'street', 'alamat']),
-            'has_company': any(word in text_lower for word in ['pt', 'cv', 'ltd', 'inc', 'corp']),
-
-            # Advanced fake indicators
-            'has_whatsapp': any(word in text_lower for word in ['whatsapp', 'wa', 'chat']),
-            'has_money_promise': any(word in text_lower for word in ['jutaan', 'milyar', 'kaya', 'sukses']),
-            'has_urgency': any(word in text_lower for word in ['buruan', 'segera', 'terbatas', 'deadline']),
-            'has_mlm_terms': any(word in text_lower for word in ['join', 'member', 'bonus', 'komisi']),
-            'has_no_experience': any(word in text_lower for word in ['tanpa pengalaman', 'no experience', 'fresh graduate']),
-
-            # Text quality indicators
-            'uppercase_ratio': sum(1 for c in text if c.isupper()) / max(len(text), 1),
-            'exclamation_count': text.count('!'),
-            'question_count': text.count('?'),
-            'number_count': sum(1 for c in text if c.isdigit()),
-        })
-        
-        features.append(feature_dict)
-    
-    return pd.DataFrame(features)
+    """Extract comprehensive features from texts (featurizer.py, shared with the backend)"""
+    featurizer = TextFeaturizer.from_file(Path(os.environ.get('LEXICON_DIR', 'lexicons')) / 'feature_keywords.json')
+    return pd.DataFrame(featurizer.transform(texts), columns=FEATURE_NAMES)
 
 def main():
     """Main training function"""